@@ -0,0 +1,231 @@
+# Importando as bibliotecas necessárias
+import argparse        # Para ler as opções da linha de comando
+import csv             # Para exportar os resultados em CSV
+import json            # Para exportar e comparar os resultados em JSON
+import statistics      # Para a mediana das repetições
+import sys             # Para o código de saída em caso de regressão
+import time            # Para medir os tempos de cada etapa
+import tracemalloc     # Para medir o pico de memória do treinamento
+from models.data_model import DataModel  # Datasets e preparação dos dados
+from models.ml_model import MLModel      # Treinamento e avaliação dos modelos
+from models.algorithm_registry import ALGORITHMS  # Algoritmos disponíveis
+from models.shared_store import SHARED_STORE     # Discretizações reaproveitadas entre treinamentos
+
+# Métricas de tempo comparadas com a linha de base
+TIME_METRICS = ["load_time", "prepare_time", "fit_time", "predict_time"]
+# Diferença absoluta mínima (em segundos) para considerar uma regressão de tempo (evita ruído)
+MIN_TIME_DELTA = 0.005
+
+class BenchmarkMatrix:
+    """
+    Executa o pipeline completo, sem a interface do Streamlit, para cada combinação
+    de dataset, algoritmo e conjunto de hiperparâmetros, registrando tempos, pico de memória e R².
+    """
+
+    @staticmethod
+    def get_param_sets(config_path=None):
+        """
+        Retorna os conjuntos de hiperparâmetros de cada algoritmo.
+        Args:
+            config_path (str): Arquivo JSON opcional no formato {"Random Forest": [{"n_estimators": 50}, ...]}
+        Returns:
+            dict: Nome do algoritmo -> lista de dicionários de hiperparâmetros
+        """
+        if config_path is None:
+            return {name: [{}] for name in ALGORITHMS}
+        with open(config_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def run_case(dataset_name, algorithm_name, params, repeat=1):
+        """
+        Executa uma combinação do benchmark.
+        Args:
+            dataset_name (str): Nome do dataset
+            algorithm_name (str): Nome do algoritmo
+            params (dict): Hiperparâmetros (os ausentes usam os padrões)
+            repeat (int): Número de repetições; os tempos registrados são a mediana
+        Returns:
+            dict: Resultado da combinação, ou None se o dataset não tiver dados suficientes
+        """
+        runs = []
+        for _ in range(repeat):
+            # Carregamento a frio: ignora o cache do processo
+            DataModel.clear_dataset_cache()
+            # Treinamento a frio: descarta as discretizações do gradient boosting da repetição anterior
+            # (o mesmo nome de BINNING_NAMESPACE; importar o módulo carregaria o scikit-learn)
+            SHARED_STORE.clear("binning")
+            start = time.perf_counter()
+            df = DataModel.load_dataset(dataset_name)
+            load_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            data = DataModel.prepare_data(df)
+            prepare_time = time.perf_counter() - start
+            if data is None:
+                return None
+            X_train, X_test, y_train, y_test = data
+
+            # O treinamento é feito diretamente, sem o cache de modelos
+            algorithm = MLModel.build_algorithm(algorithm_name, params)
+            encoder = DataModel.get_encoder(df)
+            encoder.configure(algorithm)
+            if encoder.uses_one_hot(algorithm):
+                # Modelos lineares recebem as features categóricas em one-hot esparso (como na aplicação)
+                start = time.perf_counter()
+                X_train, X_test = encoder.one_hot(X_train), encoder.one_hot(X_test)
+                prepare_time += time.perf_counter() - start
+            tracemalloc.start()
+            start = time.perf_counter()
+            algorithm.fit(X_train, y_train)
+            fit_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            predictions = algorithm.predict(X_test)
+            predict_time = time.perf_counter() - start
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            runs.append({
+                "load_time": load_time,
+                "prepare_time": prepare_time,
+                "fit_time": fit_time,
+                "predict_time": predict_time,
+                "peak_memory_bytes": peak_memory,
+                "r2": algorithm.score(X_test, y_test),
+                "test_rows": len(predictions)
+            })
+
+        result = {
+            "dataset": dataset_name,
+            "algorithm": algorithm_name,
+            "params": params,
+            "rows": len(df)
+        }
+        for metric in runs[0]:
+            result[metric] = statistics.median(run[metric] for run in runs)
+        # Latência de predição por registro, em microssegundos
+        result["predict_latency_us"] = result["predict_time"] / max(result["test_rows"], 1) * 1e6
+        return result
+
+    @staticmethod
+    def run(datasets=None, algorithms=None, param_sets=None, repeat=1):
+        """
+        Executa a matriz completa datasets × algoritmos × hiperparâmetros.
+        Args:
+            datasets (list): Datasets a executar (padrão: todos de DataModel)
+            algorithms (list): Algoritmos a executar (padrão: todos os do menu, ALGORITHMS)
+            param_sets (dict): Conjuntos de hiperparâmetros por algoritmo (ver get_param_sets())
+            repeat (int): Número de repetições por combinação
+        Returns:
+            list: Resultados de cada combinação
+        """
+        param_sets = param_sets or BenchmarkMatrix.get_param_sets()
+        results = []
+        for dataset_name in datasets or list(DataModel.get_available_datasets()):
+            for algorithm_name in algorithms or list(param_sets):
+                for params in param_sets.get(algorithm_name, [{}]):
+                    result = BenchmarkMatrix.run_case(dataset_name, algorithm_name, params, repeat)
+                    if result is not None:
+                        results.append(result)
+                        print(
+                            f"{dataset_name:10} {algorithm_name:18} {json.dumps(params, ensure_ascii=False):30} "
+                            f"fit={result['fit_time']:.3f}s predict={result['predict_time']:.4f}s "
+                            f"mem={result['peak_memory_bytes'] / 1e6:.1f}MB r2={result['r2']:.4f}"
+                        )
+        return results
+
+    @staticmethod
+    def case_key(result):
+        """
+        Identifica uma combinação para a comparação com a linha de base.
+        """
+        return (result["dataset"], result["algorithm"], json.dumps(result["params"], sort_keys=True))
+
+    @staticmethod
+    def compare(results, baseline, tolerance=0.2, r2_tolerance=0.01):
+        """
+        Compara os resultados com uma linha de base.
+        Args:
+            results (list): Resultados atuais
+            baseline (list): Resultados da linha de base
+            tolerance (float): Aumento relativo máximo aceito nos tempos e na memória
+            r2_tolerance (float): Queda absoluta máxima aceita no R²
+        Returns:
+            list: Descrições das regressões encontradas
+        """
+        previous = {BenchmarkMatrix.case_key(result): result for result in baseline}
+        regressions = []
+        for result in results:
+            base = previous.get(BenchmarkMatrix.case_key(result))
+            if base is None:
+                continue
+            case = f"{result['dataset']} / {result['algorithm']} / {json.dumps(result['params'], ensure_ascii=False)}"
+            for metric in TIME_METRICS:
+                if (result[metric] > base[metric] * (1 + tolerance)
+                        and result[metric] - base[metric] > MIN_TIME_DELTA):
+                    regressions.append(f"{case}: {metric} {base[metric]:.4f}s -> {result[metric]:.4f}s")
+            if result["peak_memory_bytes"] > base["peak_memory_bytes"] * (1 + tolerance):
+                regressions.append(
+                    f"{case}: peak_memory {base['peak_memory_bytes'] / 1e6:.1f}MB -> "
+                    f"{result['peak_memory_bytes'] / 1e6:.1f}MB"
+                )
+            if result["r2"] < base["r2"] - r2_tolerance:
+                regressions.append(f"{case}: r2 {base['r2']:.4f} -> {result['r2']:.4f}")
+        return regressions
+
+    @staticmethod
+    def save(results, json_path=None, csv_path=None):
+        """
+        Salva os resultados em JSON e/ou CSV.
+        Args:
+            results (list): Resultados do benchmark
+            json_path (str): Caminho do arquivo JSON (opcional)
+            csv_path (str): Caminho do arquivo CSV (opcional)
+        """
+        if json_path:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+        if csv_path and results:
+            with open(csv_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=list(results[0]))
+                writer.writeheader()
+                for result in results:
+                    writer.writerow({**result, "params": json.dumps(result["params"], ensure_ascii=False)})
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+    Exemplo: python -m benchmarks.benchmark_matrix --json atual.json --baseline base.json
+    """
+    parser = argparse.ArgumentParser(description="Benchmark headless de datasets × algoritmos.")
+    parser.add_argument("--datasets", nargs="*", help="Datasets a executar (padrão: todos)")
+    parser.add_argument("--algorithms", nargs="*", help="Algoritmos a executar (padrão: todos)")
+    parser.add_argument("--params", help="JSON com conjuntos de hiperparâmetros por algoritmo")
+    parser.add_argument("--repeat", type=int, default=1, help="Repetições por combinação (mediana)")
+    parser.add_argument("--json", dest="json_path", help="Arquivo JSON de saída")
+    parser.add_argument("--csv", dest="csv_path", help="Arquivo CSV de saída")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Aumento relativo aceito (padrão: 0.2)")
+    parser.add_argument("--r2-tolerance", type=float, default=0.01, help="Queda de R² aceita (padrão: 0.01)")
+    args = parser.parse_args(argv)
+
+    results = BenchmarkMatrix.run(
+        args.datasets, args.algorithms, BenchmarkMatrix.get_param_sets(args.params), args.repeat
+    )
+    BenchmarkMatrix.save(results, args.json_path, args.csv_path)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = BenchmarkMatrix.compare(results, baseline, args.tolerance, args.r2_tolerance)
+        if regressions:
+            print("\nRegressões de desempenho encontradas:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\nNenhuma regressão em relação à linha de base.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
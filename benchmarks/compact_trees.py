@@ -0,0 +1,125 @@
+# Importando as bibliotecas necessárias
+import argparse        # Para ler as opções da linha de comando
+import os              # Para medir o tamanho dos arquivos
+import pickle          # Para comparar com o estimador serializado
+import shutil          # Para remover os arquivos temporários
+import statistics      # Para a mediana das repetições
+import sys             # Para o código de saída
+import tempfile        # Para gravar os modelos comparados
+import time            # Para medir os tempos
+import numpy as np     # Para comparar as predições
+from models.data_model import DataModel         # Datasets e preparação dos dados
+from models.ml_model import MLModel             # Criação dos algoritmos
+from models.compact_trees import CompactTrees   # Formato compacto de inferência
+
+# Tamanhos de lote medidos na latência de predição
+BATCH_SIZES = [1, 10, 100, 1000, 10000]
+
+class CompactTreesBenchmark:
+    """
+    Compara o formato compacto com o estimador original do scikit-learn:
+    tamanho em disco, tempo de carregamento e latência de predição por tamanho de lote.
+    """
+
+    @staticmethod
+    def timed(func, repeat):
+        """
+        Mede a mediana do tempo de execução de uma função.
+        Args:
+            func (callable): Função sem argumentos
+            repeat (int): Número de repetições
+        Returns:
+            float: Tempo mediano, em segundos
+        """
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        return statistics.median(times)
+
+    @staticmethod
+    def run(dataset_name, algorithm_name, params, repeat=5):
+        """
+        Treina o modelo e compara os dois formatos.
+        Args:
+            dataset_name (str): Nome do dataset
+            algorithm_name (str): "Árvore de Decisão" ou "Random Forest"
+            params (dict): Hiperparâmetros do algoritmo
+            repeat (int): Repetições de cada medição
+        Returns:
+            dict: Tamanhos, tempos de carregamento, latências e se as predições são idênticas
+        """
+        X_train, X_test, y_train, y_test = DataModel.prepare_data(DataModel.load_dataset(dataset_name))
+        # Um único núcleo nos dois formatos, para comparar o custo de cada predição
+        estimator = MLModel.build_algorithm(algorithm_name, {**params, "n_jobs": 1} if algorithm_name == "Random Forest" else params)
+        estimator.fit(X_train.to_numpy(), y_train.to_numpy())
+        compact = CompactTrees.from_estimator(estimator)
+        X = X_test.to_numpy()
+
+        tmp_dir = tempfile.mkdtemp(prefix="compact-trees-")
+        try:
+            pickle_path = os.path.join(tmp_dir, "model.pkl")
+            with open(pickle_path, "wb") as f:
+                pickle.dump(estimator, f, protocol=pickle.HIGHEST_PROTOCOL)
+            compact_path = os.path.join(tmp_dir, "model.trees")
+            compact.save(compact_path)
+
+            def load_pickle():
+                with open(pickle_path, "rb") as f:
+                    pickle.load(f)
+
+            result = {
+                "dataset": dataset_name,
+                "algorithm": algorithm_name,
+                "params": params,
+                "n_trees": compact.n_trees,
+                "pickle_mb": os.path.getsize(pickle_path) / 1e6,
+                "compact_mb": sum(
+                    os.path.getsize(os.path.join(compact_path, name)) for name in os.listdir(compact_path)
+                ) / 1e6,
+                "pickle_load_ms": CompactTreesBenchmark.timed(load_pickle, repeat) * 1000,
+                "compact_load_ms": CompactTreesBenchmark.timed(lambda: CompactTrees.load(compact_path), repeat) * 1000,
+                "identical": bool(np.array_equal(estimator.predict(X), CompactTrees.load(compact_path).predict(X)))
+            }
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        for size in BATCH_SIZES:
+            if size > len(X):
+                break
+            batch = X[:size]
+            result[f"sklearn_{size}_ms"] = CompactTreesBenchmark.timed(lambda: estimator.predict(batch), repeat) * 1000
+            result[f"compact_{size}_ms"] = CompactTreesBenchmark.timed(lambda: compact.predict(batch), repeat) * 1000
+        return result
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+    Exemplo: python -m benchmarks.compact_trees --dataset Diamonds --n-estimators 200
+    """
+    parser = argparse.ArgumentParser(description="Compara o formato compacto de árvores com o estimador original.")
+    parser.add_argument("--dataset", default="Diamonds", help="Dataset usado no treinamento (padrão: Diamonds)")
+    parser.add_argument("--algorithm", default="Random Forest", choices=["Árvore de Decisão", "Random Forest"])
+    parser.add_argument("--n-estimators", type=int, default=100, help="Árvores da floresta (padrão: 100)")
+    parser.add_argument("--max-depth", type=int, default=None, help="Profundidade máxima (padrão: sem limite)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições de cada medição (mediana)")
+    args = parser.parse_args(argv)
+
+    params = {"max_depth": args.max_depth}
+    if args.algorithm == "Random Forest":
+        params["n_estimators"] = args.n_estimators
+    result = CompactTreesBenchmark.run(args.dataset, args.algorithm, params, args.repeat)
+
+    print(f"{result['algorithm']} ({result['n_trees']} árvores) em {result['dataset']}")
+    print(f"  Tamanho:        pickle {result['pickle_mb']:.2f} MB | compacto {result['compact_mb']:.2f} MB")
+    print(f"  Carregamento:   pickle {result['pickle_load_ms']:.2f} ms | compacto {result['compact_load_ms']:.2f} ms")
+    for size in BATCH_SIZES:
+        if f"compact_{size}_ms" in result:
+            print(f"  Lote {size:>6}:    scikit-learn {result[f'sklearn_{size}_ms']:.2f} ms | "
+                  f"compacto {result[f'compact_{size}_ms']:.2f} ms")
+    print(f"  Predições idênticas: {'sim' if result['identical'] else 'NÃO'}")
+    return 0 if result["identical"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
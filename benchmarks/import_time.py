@@ -0,0 +1,123 @@
+# Importando as bibliotecas necessárias
+import argparse        # Para ler as opções da linha de comando
+import os              # Para ler os orçamentos pelas variáveis de ambiente
+import statistics      # Para a mediana das repetições
+import subprocess      # Para medir cada importação em um interpretador novo
+import sys             # Para o interpretador atual e o código de saída
+
+# Orçamentos de importação (em segundos): a página (app) e o módulo carregado pelos workers
+APP_BUDGET_SECONDS = float(os.environ.get("IMPORT_BUDGET_APP_SECONDS", "1.5"))
+WORKER_BUDGET_SECONDS = float(os.environ.get("IMPORT_BUDGET_WORKER_SECONDS", "0.5"))
+
+# Módulos medidos: nome exibido -> (módulo importado, orçamento, bibliotecas que não podem ser carregadas)
+TARGETS = {
+    "app": ("app", APP_BUDGET_SECONDS, ("seaborn", "matplotlib", "sklearn", "scipy")),
+    "worker": ("models.ml_model", WORKER_BUDGET_SECONDS, ("streamlit", "seaborn", "matplotlib", "sklearn", "scipy"))
+}
+
+# Número de módulos mais lentos exibidos no relatório
+TOP_MODULES = 10
+
+class ImportTime:
+    """
+    Mede o tempo de importação da aplicação e dos workers em interpretadores novos
+    (python -X importtime), compara com os orçamentos e lista os módulos mais lentos.
+    """
+
+    @staticmethod
+    def measure(module_name):
+        """
+        Importa um módulo em um interpretador novo e coleta o tempo de cada importação.
+        Args:
+            module_name (str): Módulo a importar
+        Returns:
+            dict: Nome do módulo -> (tempo próprio, tempo acumulado), em segundos
+        Raises:
+            RuntimeError: Se a importação falhar
+        """
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+            capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"Falha ao importar {module_name}:\n{completed.stderr}")
+
+        timings = {}
+        for line in completed.stderr.splitlines():
+            # Formato: "import time: <próprio> | <acumulado> | <módulo>" (microssegundos)
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            timings[name.strip()] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+        return timings
+
+    @staticmethod
+    def check(target, repeat=3):
+        """
+        Mede um alvo e verifica o orçamento e as bibliotecas proibidas.
+        Args:
+            target (str): Chave de TARGETS
+            repeat (int): Número de medições (usa a mediana)
+        Returns:
+            tuple: (tempo mediano, lista de violações, medições da execução mediana)
+        """
+        module_name, budget, forbidden = TARGETS[target]
+        runs = sorted(
+            (ImportTime.measure(module_name) for _ in range(repeat)),
+            key=lambda timings: timings[module_name][1]
+        )
+        timings = runs[len(runs) // 2]
+        elapsed = timings[module_name][1]
+
+        violations = []
+        if elapsed > budget:
+            violations.append(f"{target}: {elapsed:.3f}s acima do orçamento de {budget:.3f}s")
+        loaded = {name.split(".")[0] for name in timings}
+        for library in forbidden:
+            if library in loaded:
+                violations.append(f"{target}: importa {library} na inicialização")
+        return elapsed, violations, timings
+
+    @staticmethod
+    def top_modules(timings, limit=TOP_MODULES):
+        """
+        Retorna os módulos com maior tempo próprio de importação.
+        Args:
+            timings (dict): Medições retornadas por measure()
+            limit (int): Quantidade de módulos
+        Returns:
+            list: Pares (módulo, tempo próprio em segundos)
+        """
+        ranked = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)
+        return [(name, self_time) for name, (self_time, _) in ranked[:limit]]
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+    Exemplo: python -m benchmarks.import_time --repeat 5
+    """
+    parser = argparse.ArgumentParser(description="Orçamento de tempo de importação da aplicação e dos workers.")
+    parser.add_argument("--targets", nargs="*", default=list(TARGETS), help="Alvos a medir (padrão: todos)")
+    parser.add_argument("--repeat", type=int, default=3, help="Medições por alvo (mediana)")
+    args = parser.parse_args(argv)
+
+    all_violations = []
+    for target in args.targets:
+        elapsed, violations, timings = ImportTime.check(target, args.repeat)
+        module_name, budget, _ = TARGETS[target]
+        print(f"{target} ({module_name}): {elapsed:.3f}s (orçamento {budget:.3f}s)")
+        for name, self_time in ImportTime.top_modules(timings):
+            print(f"  {self_time * 1000:8.1f} ms  {name}")
+        all_violations.extend(violations)
+
+    if all_violations:
+        print("\nOrçamento de importação excedido:")
+        for violation in all_violations:
+            print(f"  - {violation}")
+        return 1
+    print("\nTempos de importação dentro do orçamento.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
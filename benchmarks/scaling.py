@@ -0,0 +1,378 @@
+# Importando as bibliotecas necessárias
+import argparse        # Para ler as opções da linha de comando
+import csv             # Para exportar os resultados em CSV
+import gc              # Para liberar os dados entre os tamanhos
+import json            # Para exportar os resultados em JSON
+import math            # Para os expoentes de crescimento
+import sys             # Para o código de saída
+import time            # Para medir os tempos de cada etapa
+import tracemalloc     # Para medir o pico de memória de cada etapa
+from models.data_model import DataModel  # Perfil, impressão digital e preparação dos dados
+from models.ml_model import MLModel      # Criação dos algoritmos
+from models.algorithm_registry import ALGORITHMS  # Algoritmos do menu
+from models.shared_store import SHARED_STORE  # Limpo entre os tamanhos, para medir sem cache
+from benchmarks.synthetic_data import SyntheticData  # Datasets sintéticos com o esquema dos originais
+
+# Tamanhos (em registros) medidos por padrão: de 10⁴ a 10⁷
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+# Expoente de crescimento (tempo ∝ registros^expoente) acima do qual a etapa é considerada superlinear
+SUPERLINEAR_EXPONENT = 1.15
+# Tempos abaixo deste valor (em segundos) são dominados por custos fixos e não entram no cálculo do expoente
+MIN_FIT_SECONDS = 0.01
+# Registros da execução de aquecimento (importações e compilações de primeiro uso), descartada das medições
+WARMUP_ROWS = 1_000
+# Os limites de registros não são extrapolados além deste múltiplo do maior tamanho medido
+MAX_EXTRAPOLATION = 100
+
+class ScalingBenchmark:
+    """
+    Mede cada etapa do pipeline (impressão digital, perfil, preparação, gráficos, treino e predição
+    de cada algoritmo), sem a interface do Streamlit, em datasets sintéticos de tamanho crescente.
+    Para cada etapa, calcula o expoente de crescimento do tempo e da memória e estima
+    o maior número de registros que cabe nos orçamentos de tempo e de memória.
+    """
+
+    @staticmethod
+    def measure(func):
+        """
+        Executa uma etapa medindo o tempo e o pico de memória alocada.
+        Args:
+            func (callable): Função sem argumentos
+        Returns:
+            tuple: (resultado da função, tempo em segundos, pico de memória em bytes)
+        """
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return result, elapsed, peak_memory
+
+    @staticmethod
+    def get_stages(algorithms):
+        """
+        Retorna as etapas medidas, na ordem do pipeline da aplicação.
+        Cada etapa recebe o contexto do tamanho atual (DataFrame, dados preparados, modelos treinados)
+        e pode acrescentar a ele o que as etapas seguintes usam.
+        Args:
+            algorithms (dict): Nome do algoritmo -> hiperparâmetros
+        Returns:
+            list: Pares (nome da etapa, função)
+        """
+        # A view é importada apenas aqui: ela carrega o Streamlit
+        from views.data_view import DataView, DENSITY_THRESHOLD
+
+        def fingerprint(context):
+            DataModel.get_fingerprint(context["df"])
+
+        def profile(context):
+            DataModel.get_profile(context["df"])
+
+        def prepare(context):
+            context["data"] = DataModel.prepare_data(context["df"])
+            context["encoder"] = DataModel.get_encoder(context["df"])
+
+        def visualizations(context):
+            df, numeric_cols = context["df"], DataModel.get_numeric_columns(context["df"])
+            DataView._render_histogram(df, numeric_cols[0])
+            DataView._render_scatter(df, numeric_cols[0], numeric_cols[1], len(df) > DENSITY_THRESHOLD)
+
+        def fit(algorithm_name, params):
+            def run(context):
+                X_train, X_test, y_train, y_test = context["data"]
+                algorithm = context["encoder"].configure(MLModel.build_algorithm(algorithm_name, params))
+                if context["encoder"].uses_one_hot(algorithm):
+                    # Modelos lineares recebem as features categóricas em one-hot esparso (como na aplicação)
+                    X_train, X_test = context["encoder"].one_hot(X_train), context["encoder"].one_hot(X_test)
+                algorithm.fit(X_train, y_train)
+                context["models"][algorithm_name] = (algorithm, X_test)
+            return run
+
+        def predict(algorithm_name):
+            def run(context):
+                algorithm, X_test = context["models"][algorithm_name]
+                algorithm.predict(X_test)
+            return run
+
+        stages = [
+            ("fingerprint", fingerprint), ("profile", profile),
+            ("prepare", prepare), ("visualizations", visualizations)
+        ]
+        for algorithm_name, params in algorithms.items():
+            stages.append((f"fit:{algorithm_name}", fit(algorithm_name, params)))
+            stages.append((f"predict:{algorithm_name}", predict(algorithm_name)))
+        return stages
+
+    @staticmethod
+    def run(dataset_name="Diamonds", sizes=None, algorithms=None, max_seconds=60.0, seed=0):
+        """
+        Executa todas as etapas em cada tamanho, do menor para o maior.
+        Uma etapa que passa de max_seconds (ou falha, ex.: falta de memória) não é executada
+        nos tamanhos seguintes, assim como as etapas que dependem dela.
+        Args:
+            dataset_name (str): Dataset usado como modelo dos dados sintéticos
+            sizes (list): Números de registros (padrão: DEFAULT_SIZES)
+            algorithms (dict): Nome do algoritmo -> hiperparâmetros (padrão: ALGORITHMS com os padrões)
+            max_seconds (float): Tempo máximo de uma etapa para que ela seja medida no tamanho seguinte
+            seed (int): Semente dos dados sintéticos
+        Returns:
+            list: Um resultado por etapa e tamanho (status "ok", "skipped" ou "error")
+        """
+        algorithms = algorithms if algorithms is not None else {name: {} for name in ALGORITHMS}
+        stages = ScalingBenchmark.get_stages(algorithms)
+        stopped = {}                      # etapa -> motivo de não ser mais executada
+        results = []
+
+        # Aquecimento: o primeiro uso de cada etapa importa bibliotecas (scikit-learn, Seaborn, Matplotlib),
+        # o que distorceria o menor tamanho
+        context = {"df": SyntheticData.generate(dataset_name, WARMUP_ROWS, seed), "data": None, "encoder": None,
+                   "models": {}}
+        for stage, func in stages:
+            if not ScalingBenchmark._missing_dependency(stage, context):
+                func(context)
+
+        for n_rows in sorted(sizes or DEFAULT_SIZES):
+            # Cada tamanho começa sem dados em cache (perfis, divisões e gráficos dos tamanhos anteriores)
+            SHARED_STORE.clear()
+            df, generate_time, generate_memory = ScalingBenchmark.measure(
+                lambda: SyntheticData.generate(dataset_name, n_rows, seed)
+            )
+            results.append(ScalingBenchmark._result(dataset_name, n_rows, "generate", "ok", generate_time, generate_memory))
+            context = {"df": df, "data": None, "encoder": None, "models": {}}
+
+            for stage, func in stages:
+                reason = stopped.get(stage) or ScalingBenchmark._missing_dependency(stage, context)
+                if reason:
+                    results.append(ScalingBenchmark._result(dataset_name, n_rows, stage, "skipped", error=reason))
+                    continue
+                try:
+                    _, elapsed, peak_memory = ScalingBenchmark.measure(lambda: func(context))
+                except MemoryError:
+                    stopped[stage] = f"sem memória em {n_rows} registros"
+                    results.append(ScalingBenchmark._result(dataset_name, n_rows, stage, "error", error="MemoryError"))
+                    continue
+                results.append(ScalingBenchmark._result(dataset_name, n_rows, stage, "ok", elapsed, peak_memory))
+                if elapsed > max_seconds:
+                    stopped[stage] = f"{elapsed:.1f}s em {n_rows} registros"
+                print(f"{dataset_name:10} {n_rows:>10} {stage:28} {elapsed:9.3f}s {peak_memory / 1e6:9.1f}MB")
+
+            del df, context
+        return results
+
+    @staticmethod
+    def analyze(results, time_budget=2.0, memory_budget_mb=1024):
+        """
+        Calcula as curvas de crescimento de cada etapa.
+        O expoente é a inclinação da curva em escala log-log entre os dois maiores tamanhos medidos
+        (1 = linear), onde os custos fixos pesam menos; o limite de registros extrapola o maior tamanho
+        com esse expoente (até MAX_EXTRAPOLATION vezes) ou interpola entre os tamanhos medidos.
+        Args:
+            results (list): Resultados de run()
+            time_budget (float): Tempo máximo aceitável de uma etapa, em segundos
+            memory_budget_mb (float): Pico de memória aceitável de uma etapa, em MB
+        Returns:
+            list: Por dataset e etapa: expoentes de tempo e memória, bytes por registro,
+                se a etapa é superlinear e os limites estimados de registros
+        """
+        curves = {}
+        for result in results:
+            if result["status"] == "ok":
+                curves.setdefault((result["dataset"], result["stage"]), []).append(result)
+
+        summary = []
+        for (dataset_name, stage), points in curves.items():
+            points.sort(key=lambda point: point["rows"])
+            largest = points[-1]
+            time_exponent = ScalingBenchmark._exponent(points, "time")
+            memory_exponent = ScalingBenchmark._exponent(points, "peak_memory_bytes")
+            summary.append({
+                "dataset": dataset_name,
+                "stage": stage,
+                "max_rows_measured": largest["rows"],
+                "time_at_max_rows": largest["time"],
+                "time_exponent": time_exponent,
+                "memory_exponent": memory_exponent,
+                "bytes_per_row": largest["peak_memory_bytes"] / largest["rows"],
+                "superlinear": time_exponent is not None and time_exponent > SUPERLINEAR_EXPONENT,
+                "row_limit_time": ScalingBenchmark._row_limit(points, "time", time_budget),
+                "row_limit_memory": ScalingBenchmark._row_limit(points, "peak_memory_bytes", memory_budget_mb * 1e6)
+            })
+        return summary
+
+    @staticmethod
+    def plot(results, path):
+        """
+        Grava as curvas de tempo e de pico de memória por etapa (escala log-log) em um PNG.
+        Args:
+            results (list): Resultados de run()
+            path (str): Arquivo PNG de saída
+        """
+        import matplotlib.pyplot as plt  # Para desenhar as curvas
+        fig, (ax_time, ax_memory) = plt.subplots(1, 2, figsize=(14, 6))
+        curves = {}
+        for result in results:
+            if result["status"] == "ok":
+                curves.setdefault((result["dataset"], result["stage"]), []).append(result)
+        colors = plt.get_cmap("tab20").colors  # Uma cor por etapa (o ciclo padrão tem apenas 10)
+        for index, ((dataset_name, stage), points) in enumerate(sorted(curves.items())):
+            points.sort(key=lambda point: point["rows"])
+            rows = [point["rows"] for point in points]
+            label = stage if len({key[0] for key in curves}) == 1 else f"{dataset_name} {stage}"
+            color = colors[index % len(colors)]
+            ax_time.plot(rows, [point["time"] for point in points], marker="o", color=color, label=label)
+            ax_memory.plot(rows, [point["peak_memory_bytes"] / 1e6 for point in points], marker="o", color=color,
+                           label=label)
+        for ax, ylabel in ((ax_time, "Tempo (s)"), (ax_memory, "Pico de memória (MB)")):
+            ax.set_xscale("log")
+            ax.set_yscale("log")
+            ax.set_xlabel("Registros")
+            ax.set_ylabel(ylabel)
+            ax.grid(True, which="both", alpha=0.3)
+        ax_time.legend(fontsize="small")
+        fig.tight_layout()
+        fig.savefig(path, dpi=100)
+        plt.close(fig)
+
+    @staticmethod
+    def save(rows, json_path=None, csv_path=None):
+        """
+        Salva os resultados (ou o resumo) em JSON e/ou CSV.
+        Args:
+            rows (list): Dicionários com as mesmas chaves
+            json_path (str): Caminho do arquivo JSON (opcional)
+            csv_path (str): Caminho do arquivo CSV (opcional)
+        """
+        if json_path:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(rows, f, ensure_ascii=False, indent=2)
+        if csv_path and rows:
+            with open(csv_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+
+    @staticmethod
+    def _result(dataset_name, n_rows, stage, status, elapsed=None, peak_memory=None, error=None):
+        """
+        Monta o resultado de uma etapa em um tamanho.
+        """
+        return {
+            "dataset": dataset_name, "rows": n_rows, "stage": stage, "status": status,
+            "time": elapsed, "peak_memory_bytes": peak_memory, "error": error
+        }
+
+    @staticmethod
+    def _missing_dependency(stage, context):
+        """
+        Verifica se a etapa depende de uma etapa anterior que não foi executada neste tamanho.
+        Returns:
+            str: Motivo para não executar a etapa, ou None
+        """
+        if stage.startswith("fit:") and context["data"] is None:
+            return "dados não preparados"
+        if stage.startswith("predict:") and stage.split(":", 1)[1] not in context["models"]:
+            return "modelo não treinado"
+        return None
+
+    @staticmethod
+    def _exponent(points, metric):
+        """
+        Inclinação da curva log-log de uma métrica entre os dois maiores tamanhos acima dos custos fixos.
+        Returns:
+            float: Expoente de crescimento, ou None com menos de dois pontos
+        """
+        minimum = MIN_FIT_SECONDS if metric == "time" else 0
+        usable = [point for point in points if point[metric] and point[metric] > minimum]
+        if len(usable) < 2:
+            return None
+        previous, last = usable[-2], usable[-1]
+        return math.log(last[metric] / previous[metric]) / math.log(last["rows"] / previous["rows"])
+
+    @staticmethod
+    def _row_limit(points, metric, budget):
+        """
+        Estima o maior número de registros em que a métrica fica dentro do orçamento.
+        Returns:
+            int: Registros estimados, ou None se não houver pontos suficientes
+        """
+        last = points[-1]
+        if last[metric] is None or last[metric] <= 0:
+            return None
+        if last[metric] >= budget:
+            # Já passou do orçamento: interpola entre os tamanhos medidos
+            below = [point for point in points if point[metric] and point[metric] < budget]
+            if not below:
+                return None
+            previous = below[-1]
+            following = next(point for point in points if point["rows"] > previous["rows"])
+        else:
+            if len(points) < 2:
+                return None
+            previous, following = points[-2], last
+        if not previous[metric] or following[metric] <= previous[metric]:
+            # Custo que não cresce com o número de registros (ex.: gráfico de densidade)
+            return None if last[metric] >= budget else math.inf
+        exponent = math.log(following[metric] / previous[metric]) / math.log(following["rows"] / previous["rows"])
+        rows = previous["rows"] * (budget / previous[metric]) ** (1 / exponent)
+        return math.inf if rows > MAX_EXTRAPOLATION * last["rows"] else int(rows)
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+    Exemplo: python -m benchmarks.scaling --dataset Diamonds --sizes 10000 100000 1000000 --plot scaling.png
+    """
+    parser = argparse.ArgumentParser(description="Curvas de crescimento do pipeline em datasets sintéticos.")
+    parser.add_argument("--dataset", default="Diamonds", help="Dataset usado como modelo (padrão: Diamonds)")
+    parser.add_argument("--sizes", nargs="*", type=int, help="Números de registros (padrão: 10⁴ a 10⁷)")
+    parser.add_argument("--algorithms", nargs="*", help="Algoritmos a treinar (padrão: todos do menu)")
+    parser.add_argument("--params", help="JSON com os hiperparâmetros de cada algoritmo, ex.: {\"Random Forest\": {\"max_depth\": 8}}")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="Etapas mais lentas que isso não são medidas nos tamanhos seguintes (padrão: 60)")
+    parser.add_argument("--time-budget", type=float, default=2.0,
+                        help="Tempo aceitável por etapa, para estimar o limite de registros (padrão: 2s)")
+    parser.add_argument("--memory-budget-mb", type=float, default=1024,
+                        help="Pico de memória aceitável por etapa, para estimar o limite de registros (padrão: 1024)")
+    parser.add_argument("--seed", type=int, default=0, help="Semente dos dados sintéticos")
+    parser.add_argument("--json", dest="json_path", help="Arquivo JSON com as medições")
+    parser.add_argument("--csv", dest="csv_path", help="Arquivo CSV com o resumo das curvas")
+    parser.add_argument("--plot", help="Arquivo PNG com as curvas de tempo e memória")
+    args = parser.parse_args(argv)
+
+    params = {}
+    if args.params:
+        with open(args.params, encoding="utf-8") as f:
+            params = json.load(f)
+    algorithms = {name: params.get(name, {}) for name in (args.algorithms or ALGORITHMS)}
+
+    results = ScalingBenchmark.run(args.dataset, args.sizes, algorithms, args.max_seconds, args.seed)
+    summary = ScalingBenchmark.analyze(results, args.time_budget, args.memory_budget_mb)
+    ScalingBenchmark.save(results, json_path=args.json_path)
+    ScalingBenchmark.save(summary, csv_path=args.csv_path)
+    if args.plot:
+        ScalingBenchmark.plot(results, args.plot)
+
+    def limit(value, max_rows):
+        return "-" if value is None else f"> {MAX_EXTRAPOLATION * max_rows:,}" if value == math.inf else f"{value:,}"
+
+    def exponent(value):
+        return "-" if value is None else f"{value:.2f}"
+
+    print(f"\nCurvas de crescimento (orçamento: {args.time_budget:g}s e {args.memory_budget_mb:g} MB por etapa)")
+    print(f"{'etapa':28} {'exp. tempo':>10} {'exp. mem.':>10} {'bytes/reg.':>11} "
+          f"{'limite (tempo)':>16} {'limite (mem.)':>16}")
+    for item in summary:
+        flag = "  <- superlinear" if item["superlinear"] else ""
+        print(f"{item['stage']:28} {exponent(item['time_exponent']):>10} {exponent(item['memory_exponent']):>10} "
+              f"{item['bytes_per_row']:>11.1f} {limit(item['row_limit_time'], item['max_rows_measured']):>16} "
+              f"{limit(item['row_limit_memory'], item['max_rows_measured']):>16}{flag}")
+    skipped = [result for result in results if result["status"] != "ok"]
+    for result in skipped:
+        print(f"  {result['stage']} em {result['rows']} registros: {result['status']} ({result['error']})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
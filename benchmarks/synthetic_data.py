@@ -0,0 +1,51 @@
+# Importando as bibliotecas necessárias
+import numpy as np     # Para sortear os registros e o ruído
+import pandas as pd    # Para montar o DataFrame sintético
+from models.data_model import DataModel  # Datasets usados como modelo dos dados sintéticos
+
+# Desvio do ruído somado às colunas float, como fração do desvio padrão da coluna
+NOISE_FRACTION = 0.05
+
+class SyntheticData:
+    """
+    Gera versões sintéticas dos datasets do Seaborn em qualquer número de registros.
+    Os registros são sorteados com reposição do dataset original e as colunas float recebem
+    um ruído gaussiano pequeno: o resultado tem as mesmas colunas, tipos (numéricos, categóricos
+    e inteiros), categorias, proporção de valores ausentes e relações entre as colunas, mas com
+    valores numéricos quase todos distintos, como em um dataset real grande.
+    """
+
+    @staticmethod
+    def generate(dataset_name, n_rows, seed=0, noise=NOISE_FRACTION):
+        """
+        Gera um dataset sintético.
+        Args:
+            dataset_name (str): Dataset usado como modelo (ver DataModel.get_available_datasets())
+            n_rows (int): Número de registros
+            seed (int): Semente do gerador (o mesmo valor gera os mesmos dados)
+            noise (float): Desvio do ruído das colunas float, como fração do desvio padrão da coluna
+        Returns:
+            pandas.DataFrame: Dataset sintético com o esquema do original
+        """
+        source = DataModel.load_dataset(dataset_name)
+        rng = np.random.default_rng(seed)
+        rows = rng.integers(0, len(source), size=n_rows)
+
+        columns = {}
+        for name in source.columns:
+            series = source[name]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # Sorteia os códigos, sem materializar o texto das categorias
+                codes = series.cat.codes.to_numpy()[rows]
+                columns[name] = pd.Categorical.from_codes(codes, dtype=series.dtype)
+            elif pd.api.types.is_float_dtype(series.dtype):
+                values = series.to_numpy()[rows]
+                scale = noise * float(np.nanstd(series.to_numpy(dtype=np.float64)))
+                # O ruído é gerado no tipo da coluna, para não dobrar a memória das colunas float32
+                values += (rng.standard_normal(n_rows, dtype=np.float32 if values.dtype == np.float32 else np.float64)
+                           * scale).astype(values.dtype)
+                columns[name] = values
+            else:
+                # Inteiros e booleanos mantêm os valores do original
+                columns[name] = series.to_numpy()[rows]
+        return pd.DataFrame(columns, copy=False)
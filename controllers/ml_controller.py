@@ -1,8 +1,33 @@
 # Importando bibliotecas e módulos necessários
+import json                             # Para ler os registros de predição informados em JSON
+import os                               # Para validar caminhos de arquivos locais e ler a configuração
+import time                             # Para medir o tempo das predições
 import streamlit as st                  # Para criar a interface web
+from streamlit.runtime.scriptrunner import get_script_run_ctx  # Para identificar a sessão nos rastreamentos
 from models.data_model import DataModel  # Modelo para gerenciamento de dados
 from models.ml_model import MLModel      # Modelo para machine learning
+from models.algorithm_registry import AlgorithmRegistry, INCREMENTAL_ALGORITHMS, HEAVY_LANE  # Algoritmos e filas de treinamento
+from models.feature_importance import PERMUTATION_REPEATS  # Repetições padrão da importância por permutação
+from models.streaming_model import StreamingModel  # Treinamento fora da memória para arquivos grandes
+from models.hyperparameter_search import HyperparameterSearch, RANDOM_STRATEGY, GRID_STRATEGY  # Busca de hiperparâmetros
+from models.training_manager import TRAINING_MANAGER, TrainingJob, TrainingManager  # Agendador de treinamentos
+from models.tracing import Trace, Tracing  # Medição das etapas da página
+from models.prediction_service import PREDICTION_SERVICE  # Predição com os modelos registrados
+from models.shared_store import SHARED_STORE  # Armazenamento compartilhado entre sessões
+from models.run_history import RUN_HISTORY    # Histórico das execuções (ranking por dataset)
 from views.data_view import DataView     # View para interface do usuário
+from views.model_config_view import ModelConfigView  # Controles de configuração dos modelos
+
+# Intervalo (em segundos) entre as atualizações do painel de treinamento
+TRAINING_POLL_SECONDS = 0.5
+
+# Visões de administração (memória compartilhada e fila de treinamento): mostram chaves, datasets e jobs
+# de todas as sessões do processo, então só são exibidas quando ativadas (ADMIN_VIEWS=1)
+ADMIN_VIEWS = os.environ.get("ADMIN_VIEWS", "0") != "0"
+
+# Fontes de dados disponíveis
+SEABORN_SOURCE = "Datasets Seaborn"
+FILE_SOURCE = "Arquivo Local Grande (CSV/Parquet)"
 
 class MLController:
     """
@@ -17,6 +42,7 @@ class MLController:
         self.data_model = DataModel()     # Instância do modelo de dados
         self.ml_model = MLModel()         # Instância do modelo de ML
         self.view = DataView()            # Instância da view
+        self.config_view = ModelConfigView()  # Instância da view de configuração dos modelos
         
     def initialize_page(self):
         """
@@ -62,89 +88,659 @@ class MLController:
         
     def get_user_selections(self):
         """
-        Obtém as seleções do usuário para dataset e algoritmo.
+        Obtém a seleção do dataset (a única entrada que afeta todas as seções da página).
         Returns:
-            tuple: Dataset selecionado, algoritmo selecionado, datasets disponíveis, algoritmos disponíveis
+            tuple: Dataset selecionado, datasets disponíveis
         """
-        # Obtém listas de datasets e algoritmos disponíveis
+        # Obtém os metadados dos datasets (sem carregá-los)
         datasets = self.data_model.get_available_datasets()
-        algorithms = self.ml_model.get_available_algorithms()
-        
+
         # Cria layout com duas colunas
         col1, col2 = st.columns(2)
-        
-        # Cria caixas de seleção para dataset e algoritmo
+
+        # Cria a caixa de seleção do dataset
         with col1:
-            selected_dataset = st.selectbox("Selecione o Dataset:", list(datasets.keys()))
-        with col2:
-            selected_algorithm = list(algorithms.keys())[0]  # Pega o primeiro algoritmo como padrão
-            algorithm_params = algorithms[selected_algorithm]  # Obtém os parâmetros do algoritmo
-            
+            selected_dataset = st.selectbox(
+                "Selecione o Dataset:",
+                list(datasets.keys()),
+                format_func=lambda name: f"{name} ({datasets[name]['rows']} registros)"
+            )
+            st.caption(datasets[selected_dataset]["description"])
+
+        return selected_dataset, datasets
+
+    def get_model_selections(self):
+        """
+        Obtém as seleções do usuário para o algoritmo e seus hiperparâmetros.
+        Returns:
+            tuple: Algoritmo selecionado, algoritmos disponíveis (nome -> instância configurada)
+        """
         # Adiciona uma seção para configuração do modelo
         st.subheader("Configuração do Modelo")
-        selected_algorithm = st.selectbox("Selecione o Algoritmo:", list(algorithms.keys()))
-            
-        return selected_dataset, selected_algorithm, datasets, algorithms
+        algorithms = self.config_view.get_available_algorithms()
+        selected_algorithm = next(iter(algorithms))
+        return selected_algorithm, algorithms
 
-    def process_data(self, df, dataset_name, model_name):
+    def process_data(self, df, dataset_name):
         """
         Processa o dataset selecionado.
+        As informações do dataset e os gráficos são seções independentes da página (fragmentos):
+        mudar os controles do modelo não as executa novamente.
         Args:
             df (pandas.DataFrame): DataFrame a ser processado
             dataset_name (str): Nome do dataset selecionado
-            model_name (str): Nome do modelo selecionado
         Returns:
             tuple: Dados processados e colunas numéricas
         """
-        # Obtém colunas numéricas do dataset
-        numeric_cols = self.data_model.get_numeric_columns(df)
-        
+        # Obtém o perfil do dataset (calculado uma vez por versão e compartilhado entre sessões)
+        with Tracing.span("profile"):
+            profile = self.data_model.get_profile(df)
+        numeric_cols = profile.numeric_columns
+
         # Exibe informações e visualizações do dataset
-        self.view.show_dataset_info(df)
-        self.view.show_visualizations(df, numeric_cols, dataset_name, model_name)
-        
+        self._run_section("show_dataset_info", self.view.show_dataset_info, profile)
+        self._run_section(
+            "visualizations", self.view.show_visualizations,
+            df, numeric_cols, dataset_name, data_fingerprint=profile.fingerprint
+        )
+
         # Prepara os dados para treinamento
-        data = self.data_model.prepare_data(df)
+        with Tracing.span("prepare_data"):
+            data = self.data_model.prepare_data(df)
         return data, numeric_cols
     
-    def train_model(self, data, algorithm):
+    def train_model(self, data, algorithm, dataset_name=None, encoder=None, data_fingerprint=None,
+                    progressive=False):
         """
-        Treina e avalia o modelo selecionado.
+        Submete o treinamento do modelo selecionado ao agendador de treinamentos.
+        O identificador do job fica na sessão, então o resultado é exibido mesmo após reruns.
         Args:
             data: Dados preparados para treinamento
             algorithm: Algoritmo selecionado para treinamento
+            dataset_name (str): Dataset selecionado; se informado, o modelo treinado
+                é registrado para o serviço de predição
+            encoder (FeatureEncoder): Codificador das features categóricas
+            data_fingerprint (str): Versão do dataset; se informada, treinamentos idênticos
+                submetidos por várias sessões ao mesmo tempo são executados uma única vez
+            progressive (bool): Se True, treina em subamostras crescentes e exibe a curva de aprendizado
+                (ver MLModel.train_progressive())
         """
         if data is not None:
             # Desempacota os dados de treino e teste
             X_train, X_test, y_train, y_test = data
-            # Treina o modelo e obtém o score e informações do modelo
-            score, model_name, model_params = self.ml_model.train_and_evaluate(algorithm, X_train, X_test, y_train, y_test)
-            # Exibe o resultado com informações do modelo
-            self.view.show_model_result(score, model_name, model_params)
+            # Submete o treinamento; o worker obtém o score e as informações do modelo
+            # (as etapas de fit e score são medidas no rastreamento do job)
+            with Tracing.span("submit_training"):
+                kind = "progressive" if progressive else "train"
+                key = None
+                if data_fingerprint is not None:
+                    key = TrainingManager.make_key(kind, data_fingerprint, algorithm, register_as=dataset_name)
+                self._submit_training(
+                    self.ml_model.train_progressive if progressive else self.ml_model.train_and_evaluate,
+                    algorithm, X_train, X_test, y_train, y_test,
+                    register_as=dataset_name, encoder=encoder,
+                    description=algorithm.__class__.__name__,
+                    kind=kind, lane=AlgorithmRegistry.get_lane(algorithm), key=key
+                )
         else:
             # Exibe mensagem de erro se não houver dados suficientes
             self.view.show_error_message()
 
+    def get_search_selections(self):
+        """
+        Obtém a configuração da busca de hiperparâmetros.
+        Returns:
+            tuple: Estratégia de busca, número de candidatos e se a busca foi solicitada
+        """
+        with st.expander("Buscar Hiperparâmetros"):
+            col1, col2 = st.columns(2)
+            with col1:
+                strategy = st.selectbox(
+                    "Estratégia de Busca",
+                    [RANDOM_STRATEGY, GRID_STRATEGY],
+                    help="Aleatória amostra o espaço dos controles acima; Grade percorre valores igualmente espaçados."
+                )
+            with col2:
+                n_candidates = st.slider(
+                    "Número de Candidatos",
+                    min_value=5,
+                    max_value=100,
+                    value=20,
+                    help="Candidatos avaliados; na busca em grade, grades maiores são amostradas até este limite. "
+                         "Os mais fracos recebem menos dados (successive halving)."
+                )
+            requested = st.button("Buscar Hiperparâmetros", use_container_width=True)
+        return strategy, n_candidates, requested
+
+    def search_hyperparameters(self, data, algorithm, algorithm_name, strategy, n_candidates, encoder=None,
+                               data_fingerprint=None, dataset_name=None):
+        """
+        Submete a busca de hiperparâmetros ao agendador de treinamentos (fila pesada).
+        Args:
+            data: Dados preparados para treinamento
+            algorithm: Algoritmo configurado na interface
+            algorithm_name (str): Nome do algoritmo selecionado
+            strategy (str): Estratégia de busca
+            n_candidates (int): Número de candidatos da busca aleatória
+            encoder (FeatureEncoder): Codificador das features categóricas
+            data_fingerprint (str): Versão do dataset, para deduplicar buscas idênticas
+            dataset_name (str): Dataset selecionado, para gravar o melhor estimador no histórico de execuções
+        """
+        if data is not None:
+            X_train, X_test, y_train, y_test = data
+            key = None
+            if data_fingerprint is not None:
+                key = TrainingManager.make_key(
+                    "search", data_fingerprint, algorithm, strategy=strategy, n_candidates=n_candidates,
+                    dataset_name=dataset_name
+                )
+            self._submit_training(
+                HyperparameterSearch.search, algorithm, algorithm_name, X_train, X_test, y_train, y_test,
+                strategy, n_candidates, encoder=encoder, dataset_name=dataset_name,
+                description=f"busca de hiperparâmetros ({algorithm_name})",
+                kind="search", lane=HEAVY_LANE, key=key
+            )
+        else:
+            self.view.show_error_message()
+
+    def get_cv_selections(self):
+        """
+        Obtém a configuração da validação cruzada K-fold.
+        Returns:
+            tuple: Número de folds e se a validação cruzada foi solicitada
+        """
+        with st.expander("Validação Cruzada (K-Fold)"):
+            n_folds = st.slider(
+                "Número de Folds",
+                min_value=3,
+                max_value=10,
+                value=5,
+                help="Os registros são divididos em K partes; cada fold é treinado em um processo paralelo."
+            )
+            requested = st.button("Executar Validação Cruzada", use_container_width=True)
+        return n_folds, requested
+
+    def cross_validate_model(self, data, algorithm, n_folds, encoder=None, data_fingerprint=None):
+        """
+        Submete a validação cruzada K-fold ao agendador de treinamentos (fila pesada).
+        Args:
+            data: Dados preparados para treinamento
+            algorithm: Algoritmo selecionado
+            n_folds (int): Número de folds
+            encoder (FeatureEncoder): Codificador das features categóricas
+            data_fingerprint (str): Versão do dataset, para deduplicar validações idênticas
+        """
+        if data is not None:
+            X_train, X_test, y_train, y_test = data
+            key = None
+            if data_fingerprint is not None:
+                key = TrainingManager.make_key("cv", data_fingerprint, algorithm, n_folds=n_folds)
+            self._submit_training(
+                self.ml_model.train_and_evaluate, algorithm, X_train, X_test, y_train, y_test,
+                n_folds=n_folds, encoder=encoder,
+                description=f"validação cruzada de {algorithm.__class__.__name__} ({n_folds} folds)",
+                kind="cv", lane=HEAVY_LANE, key=key
+            )
+        else:
+            self.view.show_error_message()
+
+    def get_importance_selections(self):
+        """
+        Obtém a configuração da análise de importância das features.
+        Returns:
+            tuple: Número de repetições da permutação e se a análise foi solicitada
+        """
+        with st.expander("Importância das Features"):
+            n_repeats = st.slider(
+                "Repetições da Permutação",
+                min_value=2,
+                max_value=20,
+                value=PERMUTATION_REPEATS,
+                help="Cada repetição embaralha as features com outra semente, em um processo paralelo; "
+                     "mais repetições estimam melhor o desvio."
+            )
+            requested = st.button("Calcular Importância das Features", use_container_width=True)
+        return n_repeats, requested
+
+    def analyze_feature_importance(self, data, algorithm, n_repeats, encoder=None, data_fingerprint=None):
+        """
+        Submete a análise de importância das features ao agendador de treinamentos (fila pesada).
+        Args:
+            data: Dados preparados para treinamento
+            algorithm: Algoritmo selecionado (configuração do modelo analisado)
+            n_repeats (int): Número de repetições da importância por permutação
+            encoder (FeatureEncoder): Codificador das features categóricas
+            data_fingerprint (str): Versão do dataset, para deduplicar análises idênticas
+        """
+        if data is not None:
+            X_train, X_test, y_train, y_test = data
+            key = None
+            if data_fingerprint is not None:
+                key = TrainingManager.make_key("importance", data_fingerprint, algorithm, n_repeats=n_repeats)
+            self._submit_training(
+                self.ml_model.feature_importance, algorithm, X_train, X_test, y_train, y_test,
+                encoder=encoder, n_repeats=n_repeats,
+                description=f"importância das features de {algorithm.__class__.__name__}",
+                kind="importance", lane=HEAVY_LANE, key=key
+            )
+        else:
+            self.view.show_error_message()
+
+    def get_file_selections(self):
+        """
+        Obtém as seleções do usuário para o treinamento fora da memória.
+        Returns:
+            tuple: Arquivo (caminho ou arquivo enviado), registros por bloco, épocas e algoritmos disponíveis
+        """
+        uploaded = st.file_uploader("Envie um arquivo CSV ou Parquet:", type=["csv", "parquet"])
+        data_dir = StreamingModel.get_data_dir()
+        path = ""
+        if data_dir:
+            path = st.text_input(
+                "Ou informe o caminho de um arquivo local no servidor:",
+                help=f"Apenas arquivos CSV ou Parquet dentro de {data_dir} (variável LOCAL_DATA_DIR)."
+            )
+
+        # Cria layout com duas colunas para a configuração da leitura
+        col1, col2 = st.columns(2)
+        with col1:
+            chunksize = st.number_input(
+                "Registros por Bloco",
+                min_value=1000,
+                max_value=1_000_000,
+                value=100_000,
+                step=10_000,
+                help="Quantidade de registros lidos por vez. Define o pico de memória do treinamento."
+            )
+        with col2:
+            epochs = st.number_input(
+                "Épocas",
+                min_value=1,
+                max_value=50,
+                value=5,
+                help="Número de passagens de treinamento pelo arquivo."
+            )
+
+        # Apenas algoritmos incrementais (com partial_fit) podem treinar em blocos
+        st.subheader("Configuração do Modelo")
+        algorithms = self.config_view.get_available_algorithms(INCREMENTAL_ALGORITHMS)
+
+        source = path.strip() or uploaded
+        return source, int(chunksize), int(epochs), algorithms
+
+    def train_out_of_core(self, source, chunksize, epochs, algorithm):
+        """
+        Submete o treinamento fora da memória ao agendador de treinamentos.
+        Args:
+            source: Caminho do arquivo ou arquivo enviado
+            chunksize (int): Registros por bloco
+            epochs (int): Número de passagens de treinamento
+            algorithm: Algoritmo incremental selecionado
+        """
+        key = None
+        if isinstance(source, str):
+            # Caminhos informados pelo usuário só podem apontar para o diretório de dados
+            try:
+                source = StreamingModel.resolve_path(source)
+            except ValueError as error:
+                self.view.show_file_error(str(error))
+                return
+            # Arquivos locais são identificados pelo caminho, tamanho e data de modificação
+            stat = os.stat(source)
+            key = TrainingManager.make_key(
+                "stream", f"{source}:{stat.st_size}:{stat.st_mtime_ns}", algorithm,
+                chunksize=chunksize, epochs=epochs
+            )
+        self._submit_training(
+            StreamingModel.train_and_evaluate, algorithm, source, chunksize, epochs,
+            description=algorithm.__class__.__name__,
+            lane=AlgorithmRegistry.get_lane(algorithm), key=key
+        )
+
+    def _submit_training(self, func, *args, description="", kind="train", lane=HEAVY_LANE, key=None, **kwargs):
+        """
+        Submete um treinamento e associa o job à sessão do usuário.
+        O treinamento anterior da sessão, se ainda estiver em andamento, é cancelado
+        (a menos que seja idêntico ao novo, que então continua de onde está).
+        Args:
+            func (callable): Função de treinamento (recebe o argumento nomeado progress)
+            *args: Argumentos da função
+            description (str): Descrição exibida no painel de progresso
+            kind (str): Tipo do job ("train", "progressive", "search", "cv" ou "importance")
+            lane (str): Fila do agendador (LIGHT_LANE ou HEAVY_LANE)
+            key (str): Chave de deduplicação (ver TrainingManager.make_key()), ou None
+            **kwargs: Argumentos nomeados da função
+        """
+        session_id = self._get_session_id()
+        previous = TRAINING_MANAGER.get(st.session_state.get("training_job_id"))
+        if previous is not None and not previous.finished and session_id in previous.sessions:
+            if key is not None and previous.key == key:
+                return
+            previous.cancel(session_id)
+        job = TRAINING_MANAGER.submit(
+            func, *args, description=description, kind=kind, session_id=session_id, lane=lane, key=key, **kwargs
+        )
+        st.session_state["training_job_id"] = job.id
+
+    @staticmethod
+    def _get_session_id():
+        """
+        Obtém o identificador da sessão do Streamlit em execução.
+        Returns:
+            str: Identificador da sessão, ou "" fora do Streamlit
+        """
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx is not None else ""
+
+    def _run_section(self, name, func, *args, run_every=None, **kwargs):
+        """
+        Executa uma seção da página como fragmento do Streamlit: interações com os widgets da
+        seção executam novamente apenas ela, com os argumentos da última execução completa da página.
+        Na execução completa, a seção é uma etapa do rastreamento da página; quando apenas a seção
+        é executada, ela tem um rastreamento próprio ("section:<nome>"), exibido no painel de desempenho.
+        Args:
+            name (str): Nome da seção (etapa do rastreamento)
+            func (callable): Função que monta a seção
+            *args: Argumentos da função
+            run_every (float): Intervalo de reexecução periódica da seção, em segundos (opcional)
+            **kwargs: Argumentos nomeados da função
+        """
+        def section(*section_args, **section_kwargs):
+            if Tracing.current() is not None:
+                with Tracing.span(name):
+                    return func(*section_args, **section_kwargs)
+            trace = Trace(f"section:{name}", self._get_session_id())
+            try:
+                with Tracing.activate(trace), Tracing.span(name):
+                    return func(*section_args, **section_kwargs)
+            finally:
+                trace.export()
+                if run_every is None:
+                    # Reexecuções periódicas (progresso do treinamento) não substituem a última interação
+                    st.session_state["section_trace"] = trace
+
+        return st.fragment(section, run_every=run_every)(*args, **kwargs)
+
+    def show_training_status(self):
+        """
+        Exibe o estado do treinamento da sessão.
+        Enquanto o job está em andamento, apenas este painel é reexecutado periodicamente.
+        """
+        job = TRAINING_MANAGER.get(st.session_state.get("training_job_id"))
+        if job is None:
+            return
+        polling = not job.finished and self._get_session_id() in job.sessions
+        self._run_section(
+            "training_status", self._training_status_panel, job.id, polling,
+            run_every=TRAINING_POLL_SECONDS if polling else None
+        )
+
+    def _training_status_panel(self, job_id, polling):
+        """
+        Painel com o progresso, o botão de cancelamento e o resultado do treinamento.
+        Args:
+            job_id (str): Identificador do job
+            polling (bool): Se o painel foi criado com atualização periódica
+        """
+        job = TRAINING_MANAGER.get(job_id)
+        if job is None:
+            return
+
+        if not job.finished and self._get_session_id() not in job.sessions:
+            # A sessão desistiu de um job que continua em execução para outras sessões
+            if polling:
+                st.rerun()
+            self.view.show_training_cancelled()
+            return
+
+        if not job.finished:
+            # Mostra o progresso e o tempo decorrido, com opção de cancelar
+            self.view.show_training_progress(job.description, job.progress, job.elapsed, job.status)
+            col1, col2 = st.columns(2)
+            if col1.button("Cancelar Treinamento"):
+                job.cancel(self._get_session_id())
+            if job.kind == "progressive":
+                # Curva de aprendizado até o momento; o usuário pode parar quando ela se estabilizar
+                if col2.button("Parar e Usar o Modelo Atual", disabled=job.partial_result is None):
+                    # Em um job compartilhado, a sessão recebe um job próprio com o resultado atual
+                    stopped = TRAINING_MANAGER.stop(job, self._get_session_id())
+                    if stopped is not job:
+                        st.session_state["training_job_id"] = stopped.id
+                        st.rerun()
+                if job.partial_result is not None:
+                    self.view.show_learning_curve(job.partial_result[3], finished=False)
+            return
+
+        if polling:
+            # O job terminou durante a atualização periódica: um rerun completo encerra o polling
+            st.rerun()
+
+        if job.status == TrainingJob.DONE and job.kind == "search":
+            # Exibe o melhor modelo encontrado e o ranking dos candidatos
+            score, model_name, model_params, leaderboard = job.result
+            self.view.show_model_result(score, model_name, model_params)
+            self.view.show_search_leaderboard(leaderboard)
+        elif job.status == TrainingJob.DONE and job.kind == "progressive":
+            # Exibe o resultado da última etapa e a curva de aprendizado
+            score, model_name, model_params, curve = job.result
+            self.view.show_model_result(score, model_name, model_params)
+            self.view.show_learning_curve(curve)
+        elif job.status == TrainingJob.DONE and job.kind == "cv":
+            # Exibe o R² médio, o desvio e os resultados por fold
+            score, model_name, model_params, fold_results = job.result
+            self.view.show_model_result(score, model_name, model_params)
+            self.view.show_cv_results(fold_results)
+        elif job.status == TrainingJob.DONE and job.kind == "importance":
+            # Exibe o resultado do modelo e a importância das features
+            score, model_name, model_params, importances = job.result
+            self.view.show_model_result(score, model_name, model_params)
+            self.view.show_feature_importance(importances)
+        elif job.status == TrainingJob.DONE:
+            # Exibe o resultado com informações do modelo
+            score, model_name, model_params = job.result
+            self.view.show_model_result(score, model_name, model_params)
+        elif job.status == TrainingJob.CANCELLED:
+            self.view.show_training_cancelled()
+        else:
+            self.view.show_training_error(job.error)
+
     def run_application(self):
         """
         Executa o fluxo principal da aplicação.
         """
-        # Inicializa a página
-        self.initialize_page()
-        
-        # Obtém seleções do usuário
-        selected_dataset, selected_algorithm, datasets, algorithms = self.get_user_selections()
+        # Cada execução da página é medida etapa por etapa
+        trace = Trace("page", self._get_session_id())
+        with Tracing.activate(trace), Tracing.span("run_application"):
+            # Inicializa a página
+            with Tracing.span("initialize_page"):
+                self.initialize_page()
+
+            # Obtém a fonte dos dados escolhida pelo usuário
+            data_source = st.radio("Fonte dos Dados:", [SEABORN_SOURCE, FILE_SOURCE], horizontal=True)
+            if data_source == FILE_SOURCE:
+                self.run_out_of_core()
+                # Exibe o progresso ou o resultado do treinamento da sessão
+                self.show_training_status()
+            else:
+                # O painel do modelo exibe o treinamento da sessão
+                self.run_seaborn()
+
+            # Predição com os modelos já treinados (seção independente)
+            self._run_section("predictions", self.run_predictions)
+        trace.export()
+
+        # Painel opcional com as etapas desta execução, da última seção executada sozinha
+        # e do último treinamento da sessão
+        job = TRAINING_MANAGER.get(st.session_state.get("training_job_id"))
+        self.view.show_performance([
+            trace, st.session_state.get("section_trace"), job.trace if job is not None else None
+        ])
+
+        if ADMIN_VIEWS:
+            # Visão de administração do armazenamento compartilhado entre as sessões
+            self.view.show_shared_store(SHARED_STORE.get_stats())
+            # Visão de administração do agendador de treinamentos
+            self.view.show_training_scheduler(TRAINING_MANAGER.get_stats())
+
+    def run_seaborn(self):
+        """
+        Executa o fluxo com os datasets do Seaborn, carregados em memória.
+        """
+        # Obtém a seleção do dataset (mudá-la executa a página inteira)
+        with Tracing.span("get_user_selections"):
+            selected_dataset, datasets = self.get_user_selections()
         
-        # Obtém o DataFrame selecionado
-        df = datasets[selected_dataset]
+        # Carrega apenas o DataFrame selecionado (memoizado entre reruns e sessões)
+        with Tracing.span("load_dataset"):
+            df = self.data_model.load_dataset(selected_dataset)
         
         # Processa os dados e obtém visualizações
-        data, numeric_cols = self.process_data(df, selected_dataset, selected_algorithm)
-        
+        with Tracing.span("process_data"):
+            data, numeric_cols = self.process_data(df, selected_dataset)
+        # Categorias das features não numéricas (calculadas junto com a divisão treino/teste)
+        encoder = self.data_model.get_encoder(df)
+        # Versão do dataset (calculada uma vez), usada para deduplicar treinamentos idênticos entre sessões
+        data_fingerprint = self.data_model.get_fingerprint(df)
+
+        # Configuração e treinamento do modelo: os controles executam novamente apenas esta seção
+        self._run_section("model_panel", self._model_panel, data, selected_dataset, encoder, data_fingerprint)
+
+        # Ranking das execuções já gravadas para o dataset (seção independente)
+        self._run_section("run_history", self.run_history_panel, selected_dataset)
+
+    def _model_panel(self, data, dataset_name, encoder, data_fingerprint):
+        """
+        Seção de configuração e treinamento do modelo, com o progresso e o resultado do treinamento.
+        Executada como fragmento (ver _run_section()): os dados preparados chegam como argumentos,
+        então mudar um hiperparâmetro não carrega, perfila nem prepara o dataset de novo.
+        Args:
+            data: Dados preparados para treinamento
+            dataset_name (str): Dataset selecionado
+            encoder (FeatureEncoder): Codificador das features categóricas
+            data_fingerprint (str): Versão do dataset
+        """
+        # Obtém o algoritmo e os hiperparâmetros selecionados
+        with Tracing.span("get_model_selections"):
+            selected_algorithm, algorithms = self.get_model_selections()
+
+        # Treinamento progressivo: subamostras crescentes, com a curva de aprendizado exibida a cada etapa
+        progressive = st.toggle(
+            "Treinamento Progressivo (Curva de Aprendizado)",
+            help="Treina com 1%, 5%, 25% e 100% dos dados de treino e exibe o R² de cada etapa; "
+                 "é possível parar e usar o modelo atual quando a curva se estabilizar."
+        )
+
         # Adiciona um botão para executar o modelo
         if st.button("Executar Modelo Preditivo", type="primary", use_container_width=True):
             # Obtém o algoritmo selecionado
             algorithm = algorithms[selected_algorithm]
             
-            # Treina e avalia o modelo
-            self.train_model(data, algorithm)
+            # Submete o treinamento em segundo plano (o modelo treinado fica disponível para predição)
+            self.train_model(data, algorithm, dataset_name, encoder, data_fingerprint, progressive)
+
+        # Validação cruzada K-fold com os folds em processos paralelos
+        n_folds, cv_requested = self.get_cv_selections()
+        if cv_requested:
+            self.cross_validate_model(data, algorithms[selected_algorithm], n_folds, encoder, data_fingerprint)
+
+        # Importância das features do modelo configurado (impureza ou coeficientes e permutação)
+        n_repeats, importance_requested = self.get_importance_selections()
+        if importance_requested:
+            self.analyze_feature_importance(
+                data, algorithms[selected_algorithm], n_repeats, encoder, data_fingerprint
+            )
+
+        # Busca de hiperparâmetros no mesmo espaço dos controles do modelo
+        strategy, n_candidates, search_requested = self.get_search_selections()
+        if search_requested:
+            self.search_hyperparameters(
+                data, algorithms[selected_algorithm], selected_algorithm, strategy, n_candidates, encoder,
+                data_fingerprint, dataset_name
+            )
+
+        # Exibe o progresso ou o resultado do treinamento da sessão logo abaixo dos controles
+        self.show_training_status()
+
+    def run_history_panel(self, dataset_name):
+        """
+        Exibe o ranking das execuções gravadas no histórico para o dataset selecionado
+        e a melhor configuração encontrada, com filtro por algoritmo.
+        Args:
+            dataset_name (str): Dataset selecionado
+        """
+        with st.expander("Histórico de Execuções"):
+            algorithms = RUN_HISTORY.get_algorithms(dataset_name)
+            if not algorithms:
+                self.view.show_run_history_hint()
+                return
+            algorithm = st.selectbox("Algoritmo", ["Todos"] + algorithms, key="history_algorithm")
+            algorithm = None if algorithm == "Todos" else algorithm
+            with Tracing.span("history_query"):
+                best = RUN_HISTORY.best(dataset_name, algorithm)
+                leaderboard = RUN_HISTORY.leaderboard(dataset_name, algorithm)
+            self.view.show_run_history(best, leaderboard)
+
+    def get_prediction_selections(self, models):
+        """
+        Obtém o modelo e os registros para predição.
+        Args:
+            models (list): Metadados dos modelos registrados
+        Returns:
+            tuple: Id do modelo, registros (arquivo enviado ou lista de dicionários) e se a predição foi solicitada
+        """
+        model_id = st.selectbox(
+            "Modelo Registrado",
+            [metadata["id"] for metadata in models],
+            format_func=lambda model_id: next(
+                f"{m['algorithm']} — {m['dataset']} (R² {m['score']:.4f}) [{model_id[:8]}]"
+                for m in models if m["id"] == model_id
+            )
+        )
+        uploaded = st.file_uploader("Registros para predição (CSV ou Parquet):", type=["csv", "parquet"], key="predict_file")
+        text = st.text_area(
+            "Ou registros em JSON (lista de objetos com as features):",
+            help="Exemplo: [{\"sepal_length\": 5.1, \"sepal_width\": 3.5, \"petal_length\": 1.4, \"species\": \"setosa\"}]"
+        )
+        requested = st.button("Prever", use_container_width=True)
+        return model_id, uploaded or text.strip(), requested
+
+    def run_predictions(self):
+        """
+        Executa a predição com os modelos registrados pelo fluxo de treinamento.
+        Registros enviados juntos (ou por sessões concorrentes) são agrupados em lotes pelo serviço.
+        """
+        models = PREDICTION_SERVICE.registry.list_models()
+        with st.expander("Predições com Modelos Treinados"):
+            if not models:
+                self.view.show_prediction_hint()
+                return
+            model_id, rows, requested = self.get_prediction_selections(models)
+            if not (requested and rows):
+                return
+            try:
+                start = time.perf_counter()
+                if isinstance(rows, str):
+                    predictions = PREDICTION_SERVICE.predict(model_id, json.loads(rows))
+                else:
+                    predictions = PREDICTION_SERVICE.predict_file(model_id, rows)
+                elapsed = time.perf_counter() - start
+            except (KeyError, ValueError, TypeError) as error:
+                self.view.show_prediction_error(error)
+                return
+            model = PREDICTION_SERVICE.registry.get(model_id)
+            self.view.show_predictions(predictions, model.target, elapsed, PREDICTION_SERVICE.get_stats(model_id).get(model_id))
+
+    def run_out_of_core(self):
+        """
+        Executa o fluxo de treinamento fora da memória para arquivos CSV/Parquet grandes.
+        """
+        with Tracing.span("get_file_selections"):
+            source, chunksize, epochs, algorithms = self.get_file_selections()
+        if not source:
+            self.view.show_file_hint()
+            return
+
+        if st.button("Executar Modelo Preditivo", type="primary", use_container_width=True):
+            # Obtém o algoritmo selecionado e submete o treinamento em blocos
+            algorithm = next(iter(algorithms.values()))
+            self.train_out_of_core(source, chunksize, epochs, algorithm)
@@ -0,0 +1,168 @@
+# Importando as bibliotecas necessárias
+import importlib       # Para importar as classes do scikit-learn somente quando usadas
+import os              # Para obter o número de núcleos disponíveis
+
+# Algoritmos exibidos no menu dos datasets em memória
+ALGORITHMS = ["Regressão Linear", "Árvore de Decisão", "Random Forest", "Gradient Boosting (Histograma)"]
+# Algoritmos com partial_fit, usados no treinamento fora da memória (que padroniza as features)
+INCREMENTAL_ALGORITHMS = ["Regressão SGD"]
+
+# Classe do scikit-learn de cada algoritmo ("módulo:classe"), importada apenas no primeiro uso
+ALGORITHM_CLASSES = {
+    "Regressão Linear": "sklearn.linear_model:LinearRegression",
+    "Árvore de Decisão": "sklearn.tree:DecisionTreeRegressor",
+    "Random Forest": "sklearn.ensemble:RandomForestRegressor",
+    # Subclasse do HistGradientBoostingRegressor que reaproveita a discretização das features
+    "Gradient Boosting (Histograma)": "models.hist_gradient_boosting:BinnedGradientBoostingRegressor",
+    "Regressão SGD": "sklearn.linear_model:SGDRegressor"
+}
+
+# Codificações das features categóricas (ver models.feature_encoder)
+ONE_HOT_ENCODING = "onehot"     # Uma coluna por categoria, em matriz esparsa
+ORDINAL_ENCODING = "ordinal"    # Uma coluna por feature, com o código da categoria
+NATIVE_ENCODING = "native"      # Códigos ordinais, tratados pelo estimador como categorias (sem ordem)
+# Codificação usada por cada algoritmo: modelos lineares precisam de one-hot; árvores dividem pelos códigos;
+# o gradient boosting por histogramas divide pelos conjuntos de categorias
+ALGORITHM_ENCODINGS = {
+    "Regressão Linear": ONE_HOT_ENCODING,
+    "Árvore de Decisão": ORDINAL_ENCODING,
+    "Random Forest": ORDINAL_ENCODING,
+    "Gradient Boosting (Histograma)": NATIVE_ENCODING,
+    "Regressão SGD": ONE_HOT_ENCODING
+}
+
+# Filas do agendador de treinamentos (ver models.training_manager)
+LIGHT_LANE = "light"    # Treinamentos rápidos, que não devem esperar atrás dos pesados
+HEAVY_LANE = "heavy"    # Treinamentos demorados (ensembles, leitura de arquivos em blocos)
+# Fila de cada algoritmo; validação cruzada e busca de hiperparâmetros usam sempre a fila pesada
+ALGORITHM_LANES = {
+    "Regressão Linear": LIGHT_LANE,
+    "Árvore de Decisão": LIGHT_LANE,
+    "Random Forest": HEAVY_LANE,
+    "Gradient Boosting (Histograma)": HEAVY_LANE,
+    "Regressão SGD": HEAVY_LANE
+}
+
+# Workers da fila pesada do agendador (models.training_manager): até esse número de treinamentos
+# pesados roda ao mesmo tempo, então cada um usa no máximo a sua parte dos núcleos
+TRAINING_WORKERS = int(os.environ.get("TRAINING_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+JOB_MAX_CORES = max(1, (os.cpu_count() or 1) // TRAINING_WORKERS)
+
+# Espaço de hiperparâmetros de cada algoritmo, compartilhado pelos controles da interface
+# e pela busca de hiperparâmetros: (mínimo, máximo) para inteiros ou lista de opções
+PARAM_SPACE = {
+    "Regressão Linear": {
+        "fit_intercept": [True, False]
+    },
+    "Árvore de Decisão": {
+        "max_depth": (1, 20),
+        "min_samples_split": (2, 20),
+        "min_samples_leaf": (1, 20)
+    },
+    "Random Forest": {
+        "n_estimators": (10, 200),
+        "max_depth": (1, 20),
+        "min_samples_split": (2, 20),
+        "min_samples_leaf": (1, 20)
+    },
+    "Gradient Boosting (Histograma)": {
+        "max_iter": (10, 500),
+        "learning_rate": [0.01, 0.05, 0.1, 0.2, 0.3],
+        "max_bins": (16, 255),
+        "early_stopping": ["auto", True, False]
+    }
+}
+
+# Hiperparâmetros padrão de cada algoritmo (os mesmos valores iniciais dos controles da interface)
+DEFAULT_PARAMS = {
+    "Regressão Linear": {"fit_intercept": True},
+    "Árvore de Decisão": {"max_depth": 1, "min_samples_split": 2, "min_samples_leaf": 1, "random_state": 42},
+    "Random Forest": {
+        "n_estimators": 100, "max_depth": 1, "min_samples_split": 2, "min_samples_leaf": 1,
+        "random_state": 42, "n_jobs": JOB_MAX_CORES
+    },
+    "Gradient Boosting (Histograma)": {
+        "max_iter": 100, "learning_rate": 0.1, "max_bins": 255, "early_stopping": "auto", "random_state": 42
+    },
+    "Regressão SGD": {"alpha": 0.0001, "penalty": "l2", "eta0": 0.01, "random_state": 42}
+}
+
+class AlgorithmRegistry:
+    """
+    Registro dos algoritmos disponíveis, sem dependência da interface.
+    Pode ser importado pelos workers, benchmarks e scripts sem carregar o Streamlit
+    nem o scikit-learn; as classes dos algoritmos são importadas no primeiro uso.
+    """
+
+    @staticmethod
+    def get_class(algorithm_name):
+        """
+        Obtém a classe do scikit-learn de um algoritmo.
+        Args:
+            algorithm_name (str): Nome do algoritmo
+        Returns:
+            type: Classe do estimador
+        Raises:
+            KeyError: Se o algoritmo não existir
+        """
+        if algorithm_name not in ALGORITHM_CLASSES:
+            raise KeyError(f"Algoritmo desconhecido: {algorithm_name}")
+        module_name, class_name = ALGORITHM_CLASSES[algorithm_name].split(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    @staticmethod
+    def build(algorithm_name, params=None):
+        """
+        Cria a instância de um algoritmo.
+        Args:
+            algorithm_name (str): Nome do algoritmo
+            params (dict): Hiperparâmetros; os ausentes usam DEFAULT_PARAMS
+        Returns:
+            Instância do algoritmo do scikit-learn
+        Raises:
+            KeyError: Se o algoritmo não existir
+        """
+        estimator_class = AlgorithmRegistry.get_class(algorithm_name)
+        return estimator_class(**{**DEFAULT_PARAMS[algorithm_name], **(params or {})})
+
+    @staticmethod
+    def get_encoding(estimator):
+        """
+        Obtém a codificação das features categóricas usada por um estimador.
+        A classe é comparada pelo nome, sem importar o scikit-learn.
+        Args:
+            estimator: Estimador do scikit-learn
+        Returns:
+            str: ONE_HOT_ENCODING, ORDINAL_ENCODING (padrão para classes fora do registro) ou NATIVE_ENCODING
+        """
+        algorithm_name = AlgorithmRegistry.get_name(estimator)
+        return ALGORITHM_ENCODINGS[algorithm_name] if algorithm_name else ORDINAL_ENCODING
+
+    @staticmethod
+    def get_lane(estimator):
+        """
+        Obtém a fila do agendador de treinamentos de um estimador.
+        Args:
+            estimator: Estimador do scikit-learn
+        Returns:
+            str: LIGHT_LANE ou HEAVY_LANE (padrão para classes fora do registro)
+        """
+        algorithm_name = AlgorithmRegistry.get_name(estimator)
+        return ALGORITHM_LANES[algorithm_name] if algorithm_name else HEAVY_LANE
+
+    @staticmethod
+    def get_name(estimator):
+        """
+        Obtém o nome do algoritmo de um estimador.
+        A classe é comparada pelo nome, sem importar o scikit-learn.
+        Args:
+            estimator: Estimador do scikit-learn
+        Returns:
+            str: Nome do algoritmo, ou None se a classe não estiver no registro
+        """
+        estimator_class = type(estimator)
+        for algorithm_name, path in ALGORITHM_CLASSES.items():
+            module_name, class_name = path.split(":")
+            if estimator_class.__name__ == class_name and estimator_class.__module__.startswith(module_name):
+                return algorithm_name
+        return None
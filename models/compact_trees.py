@@ -0,0 +1,220 @@
+# Importando as bibliotecas necessárias
+import json            # Para salvar os metadados do modelo
+import os              # Para manipular caminhos e diretórios
+import shutil          # Para remover diretórios temporários
+import tempfile        # Para gravar o modelo de forma atômica
+import numpy as np     # Para os arrays dos nós e a predição vetorizada
+
+# Número máximo de pares (árvore, registro) percorridos por vez na predição; limita a memória temporária
+PREDICT_BLOCK_NODES = 262_144
+# Arrays que descrevem os nós de todas as árvores, gravados um por arquivo .npy
+NODE_ARRAYS = ("feature", "threshold", "children", "missing_left", "value")
+
+class CompactTrees:
+    """
+    Formato compacto de inferência para árvores de decisão e florestas (DecisionTreeRegressor,
+    RandomForestRegressor).
+    Os nós de todas as árvores ficam em arrays NumPy contíguos (feature, limiar, filhos, valor),
+    gravados em um diretório com um arquivo .npy por array e mapeados em memória na leitura.
+    A predição percorre todas as árvores para o lote inteiro de uma vez: a cada nível,
+    uma única operação vetorizada avança todos os pares (árvore, registro) que ainda não
+    chegaram a uma folha.
+    """
+
+    def __init__(self, feature, threshold, children, missing_left, value, roots, max_depth, n_features):
+        """
+        Inicializa o modelo compacto (use from_estimator() ou load()).
+        Args:
+            feature (numpy.ndarray): Feature testada em cada nó (-1 nas folhas)
+            threshold (numpy.ndarray): Limiar de cada nó (x <= limiar vai para a esquerda)
+            children (numpy.ndarray): Filhos intercalados: children[2 * nó] é o esquerdo
+                e children[2 * nó + 1] o direito
+            missing_left (numpy.ndarray): Se valores ausentes vão para a esquerda em cada nó
+            value (numpy.ndarray): Valor previsto em cada nó
+            roots (numpy.ndarray): Índice da raiz de cada árvore
+            max_depth (int): Maior profundidade entre as árvores
+            n_features (int): Número de features de entrada
+        """
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.n_features = n_features
+
+    @property
+    def n_trees(self):
+        """
+        Número de árvores do modelo.
+        """
+        return len(self.roots)
+
+    @property
+    def nbytes(self):
+        """
+        Tamanho dos arrays do modelo, em bytes.
+        """
+        return sum(getattr(self, name).nbytes for name in NODE_ARRAYS) + self.roots.nbytes
+
+    @staticmethod
+    def supports(estimator):
+        """
+        Verifica se o estimador pode ser convertido para o formato compacto.
+        Args:
+            estimator: Estimador do scikit-learn já treinado
+        Returns:
+            bool: True para árvores e florestas de regressão treinadas, com uma única saída
+        """
+        trees = CompactTrees._get_trees(estimator)
+        return bool(trees) and all(tree.n_outputs == 1 for tree in trees)
+
+    @staticmethod
+    def from_estimator(estimator):
+        """
+        Converte uma árvore ou floresta treinada para o formato compacto.
+        Args:
+            estimator: DecisionTreeRegressor ou RandomForestRegressor já treinado
+        Returns:
+            CompactTrees: Modelo compacto
+        Raises:
+            ValueError: Se o estimador não for suportado (ver supports())
+        """
+        if not CompactTrees.supports(estimator):
+            raise ValueError(f"Estimador não suportado no formato compacto: {estimator.__class__.__name__}")
+        trees = CompactTrees._get_trees(estimator)
+
+        sizes = np.array([tree.node_count for tree in trees])
+        roots = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        index_dtype = np.int32 if sizes.sum() < np.iinfo(np.int32).max else np.int64
+
+        features, thresholds, children, missing, values = [], [], [], [], []
+        for tree, offset in zip(trees, roots):
+            is_leaf = tree.children_left == -1
+            # Os filhos das folhas nunca são lidos: o percurso de um par termina ao chegar em uma folha
+            children.append(np.column_stack([tree.children_left, tree.children_right]).ravel() + offset)
+            features.append(np.where(is_leaf, -1, tree.feature))
+            thresholds.append(tree.threshold)
+            missing.append(getattr(tree, "missing_go_to_left", np.zeros(tree.node_count, dtype=np.uint8)))
+            values.append(tree.value[:, 0, 0])
+
+        return CompactTrees(
+            feature=np.concatenate(features).astype(np.int32),
+            threshold=np.concatenate(thresholds).astype(np.float64),
+            children=np.concatenate(children).astype(index_dtype),
+            missing_left=np.concatenate(missing).astype(bool),
+            value=np.concatenate(values).astype(np.float64),
+            roots=roots.astype(index_dtype),
+            max_depth=max(tree.max_depth for tree in trees),
+            n_features=estimator.n_features_in_
+        )
+
+    def predict(self, X):
+        """
+        Prediz um lote de registros com todas as árvores de uma vez.
+        O resultado é o mesmo do estimador original (média das árvores, no caso de florestas).
+        Args:
+            X: Matriz de features (array NumPy ou DataFrame), com as colunas na ordem do treinamento
+        Returns:
+            numpy.ndarray: Predições
+        """
+        # O scikit-learn compara as features em float32 com limiares em float64; o mesmo é feito aqui
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Esperadas {self.n_features} features, recebida uma matriz {X.shape}")
+
+        predictions = np.empty(len(X))
+        block = max(1, PREDICT_BLOCK_NODES // self.n_trees)
+        for start in range(0, len(X), block):
+            X_block = X[start:start + block]
+            predictions[start:start + len(X_block)] = self._predict_block(X_block)
+        return predictions
+
+    def _predict_block(self, X):
+        """
+        Percorre todas as árvores para um bloco de registros.
+        Args:
+            X (numpy.ndarray): Bloco de registros em float32
+        Returns:
+            numpy.ndarray: Predições do bloco
+        """
+        n_rows, n_features = X.shape
+        X_flat = X.ravel()
+        has_missing = np.isnan(X_flat).any()
+        # Posição atual de cada par (árvore, registro), ordenada por árvore, começando pelas raízes
+        nodes = np.repeat(self.roots, n_rows)
+        row_offsets = np.tile(np.arange(n_rows) * n_features, self.n_trees)
+        active = np.flatnonzero(np.take(self.feature, nodes) >= 0)
+        while len(active):
+            current = np.take(nodes, active)
+            x = np.take(X_flat, np.take(row_offsets, active) + np.take(self.feature, current))
+            go_right = ~(x <= np.take(self.threshold, current))
+            if has_missing:
+                go_right &= ~(np.isnan(x) & np.take(self.missing_left, current))
+            current = np.take(self.children, 2 * current + go_right)
+            nodes[active] = current
+            # Mantém apenas os pares que ainda não chegaram a uma folha
+            active = active[np.take(self.feature, current) >= 0]
+        # Soma as árvores na mesma ordem do scikit-learn antes de dividir
+        return np.take(self.value, nodes).reshape(self.n_trees, n_rows).sum(axis=0) / self.n_trees
+
+    def save(self, path):
+        """
+        Grava o modelo em um diretório (um .npy por array e um meta.json).
+        A gravação é feita em um diretório temporário e renomeada ao final.
+        Args:
+            path (str): Diretório de destino
+        """
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{os.path.basename(path)}-", dir=parent)
+        try:
+            for name in NODE_ARRAYS + ("roots",):
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), getattr(self, name))
+            with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({"max_depth": int(self.max_depth), "n_features": int(self.n_features)}, f)
+            try:
+                os.rename(tmp_dir, path)
+            except OSError:
+                # O mesmo modelo já foi gravado (por outra sessão ou processo)
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+    @staticmethod
+    def load(path):
+        """
+        Lê um modelo gravado por save(), com os arrays mapeados em memória.
+        Args:
+            path (str): Diretório do modelo
+        Returns:
+            CompactTrees: Modelo compacto, ou None se não existir
+        """
+        meta_path = os.path.join(path, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r", allow_pickle=False)
+            for name in NODE_ARRAYS + ("roots",)
+        }
+        return CompactTrees(**arrays, max_depth=meta["max_depth"], n_features=meta["n_features"])
+
+    @staticmethod
+    def _get_trees(estimator):
+        """
+        Retorna as estruturas de árvore (tree_) de uma árvore ou floresta treinada.
+        """
+        if hasattr(estimator, "tree_"):
+            trees = [estimator.tree_]
+        elif hasattr(estimator, "estimators_") and all(hasattr(tree, "tree_") for tree in estimator.estimators_):
+            trees = [tree.tree_ for tree in estimator.estimators_]
+        else:
+            return []
+        # Classificadores têm um valor por classe; apenas regressores são suportados
+        if getattr(estimator, "_estimator_type", "regressor") != "regressor":
+            return []
+        return trees
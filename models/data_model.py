@@ -1,49 +1,243 @@
 # Importando as bibliotecas necessárias
-import seaborn as sns  # Para carregar datasets de exemplo e criar visualizações
+import os                       # Para ler a configuração pelas variáveis de ambiente
+import threading                # Para proteger o registro de impressões digitais
+import weakref                  # Para associar impressões digitais aos DataFrames sem mantê-los vivos
+# O Seaborn e o scikit-learn são importados apenas quando usados (download do dataset e divisão)
 import pandas as pd    # Para manipulação de dados em DataFrames
 import numpy as np     # Para operações numéricas
-from sklearn.model_selection import train_test_split  # Para dividir dados em treino e teste
+from models.dataset_store import DatasetStore  # Armazenamento local e colunar dos datasets
+from models.model_cache import ModelCache      # Para calcular a impressão digital dos dados
+from models.dataset_profile import DatasetProfile  # Perfil (estatísticas) dos datasets
+from models.tracing import Tracing                 # Medição das etapas
+from models.feature_encoder import FeatureEncoder  # Codificação das features categóricas
+from models.shared_store import SHARED_STORE, SharedStore  # Armazenamento compartilhado entre sessões
+
+# As sessões recebem visões rasas dos DataFrames compartilhados: alterá-las não pode afetar o original
+SharedStore.enable_copy_on_write()
+
+# Acima deste número de registros, o perfil é calculado no modo aproximado (uma passagem)
+PROFILE_APPROX_THRESHOLD = int(os.environ.get("PROFILE_APPROX_THRESHOLD", "1000000"))
+
+# Datasets, perfis e divisões treino/teste ficam no armazenamento compartilhado (models.shared_store),
+# com um limite de memória único (SHARED_STORE_MAX_MB)
+
+# Proporção do conjunto de teste e semente da divisão treino/teste
+TEST_SIZE = 0.2
+SPLIT_RANDOM_STATE = 42
+
+# Impressões digitais já calculadas: id do DataFrame -> (referência fraca, impressão digital)
+_fingerprints = {}
+_fingerprints_lock = threading.Lock()
 
 class DataModel:
     """
     Classe responsável por gerenciar os dados da aplicação.
     Fornece métodos para carregar datasets, preparar dados e identificar colunas numéricas.
     """
+
+    # Registro dos datasets disponíveis: nome exibido -> metadados.
+    # Nenhum dataset é carregado aqui; o carregamento acontece sob demanda em load_dataset().
+    DATASETS = {
+        "Tips": {
+            "source": "tips",
+            "description": "Dataset de gorjetas de restaurante",
+            "rows": 244,
+            "columns": 7
+        },
+        "Iris": {
+            "source": "iris",
+            "description": "Dataset clássico de flores Iris",
+            "rows": 150,
+            "columns": 5
+        },
+        "Diamonds": {
+            "source": "diamonds",
+            "description": "Dataset de preços de diamantes",
+            "rows": 53940,
+            "columns": 10
+        },
+        "Penguins": {
+            "source": "penguins",
+            "description": "Dataset de medidas de pinguins",
+            "rows": 344,
+            "columns": 7
+        }
+    }
     
     @staticmethod
     def get_available_datasets():
         """
         Retorna um dicionário com os datasets disponíveis do Seaborn.
-        Cada dataset é carregado diretamente da biblioteca Seaborn.
+        Apenas nomes e metadados são retornados; nenhum dataset é carregado.
+        Returns:
+            dict: Dicionário com nome do dataset e seus metadados
         """
-        return {
-            "Tips": sns.load_dataset("tips"),        # Dataset de gorjetas de restaurante
-            "Iris": sns.load_dataset("iris"),        # Dataset clássico de flores Iris
-            "Diamonds": sns.load_dataset("diamonds"), # Dataset de preços de diamantes
-            "Penguins": sns.load_dataset("penguins") # Dataset de medidas de pinguins
-        }
+        return {name: dict(info) for name, info in DataModel.DATASETS.items()}
+
+    @staticmethod
+    def load_dataset(name):
+        """
+        Carrega um único dataset sob demanda.
+        O dataset fica no armazenamento compartilhado entre reruns e sessões; cada chamada
+        recebe uma visão sem cópia dos dados (ver SharedStore.view()), que não deve ser modificada.
+        Args:
+            name (str): Nome do dataset (chave de get_available_datasets())
+        Returns:
+            pandas.DataFrame: Dataset carregado
+        """
+        if name not in DataModel.DATASETS:
+            raise KeyError(f"Dataset desconhecido: {name}")
+        source = DataModel.DATASETS[name]["source"]
+        shared = SHARED_STORE.get_or_create("dataset", source, lambda: _load_dataset(source))
+        # A impressão digital é calculada uma vez no DataFrame compartilhado e vale para as visões
+        fingerprint = DataModel.get_fingerprint(shared)
+        df = SharedStore.view(shared)
+        DataModel._remember_fingerprint(df, fingerprint)
+        return df
     
+    @staticmethod
+    def clear_dataset_cache():
+        """
+        Remove do armazenamento compartilhado os datasets carregados e as divisões preparadas
+        (ex.: para medir o carregamento a frio).
+        """
+        SHARED_STORE.clear("dataset")
+        SHARED_STORE.clear("prepared")
+
+    @staticmethod
+    def get_fingerprint(df):
+        """
+        Retorna a impressão digital (versão) do conteúdo de um DataFrame.
+        O valor é calculado uma única vez por objeto; como os datasets carregados são
+        compartilhados e não são modificados, reruns e sessões reaproveitam o cálculo.
+        Args:
+            df (pandas.DataFrame): DataFrame a identificar
+        Returns:
+            str: Impressão digital do conteúdo
+        """
+        with _fingerprints_lock:
+            entry = _fingerprints.get(id(df))
+            if entry is not None and entry[0]() is df:
+                return entry[1]
+
+        fingerprint = ModelCache.fingerprint(df)
+        DataModel._remember_fingerprint(df, fingerprint)
+        return fingerprint
+
+    @staticmethod
+    def _remember_fingerprint(df, fingerprint):
+        """
+        Associa uma impressão digital já calculada a um DataFrame.
+        """
+        with _fingerprints_lock:
+            # Remove a entrada quando o DataFrame for coletado, liberando o id para outro objeto
+            key = id(df)
+            _fingerprints[key] = (weakref.ref(df, lambda _: _fingerprints.pop(key, None)), fingerprint)
+
+    @staticmethod
+    def get_profile(df, approximate=None):
+        """
+        Retorna o perfil do dataset, calculado uma vez por versão do conteúdo.
+        Args:
+            df (pandas.DataFrame): DataFrame a ser analisado
+            approximate (bool): Se True, usa estatísticas de uma única passagem com quartis
+                aproximados; se None, usa o modo aproximado acima de PROFILE_APPROX_THRESHOLD registros
+        Returns:
+            DatasetProfile: Perfil do dataset
+        """
+        if approximate is None:
+            approximate = len(df) > PROFILE_APPROX_THRESHOLD
+        fingerprint = DataModel.get_fingerprint(df)
+        key = repr((fingerprint, approximate))
+
+        def describe():
+            with Tracing.span("describe"):
+                return DatasetProfile.from_dataframe(df, fingerprint, approximate=approximate)
+        return SHARED_STORE.get_or_create("profile", key, describe)
+
     @staticmethod
     def prepare_data(df):
         """
         Prepara os dados para treinamento do modelo.
+        A última coluna numérica é o target; as demais colunas (numéricas e categóricas) são as features,
+        com as categóricas representadas pelos códigos ordinais (ver get_encoder()).
+        A divisão é calculada uma vez por versão do conteúdo e compartilhada entre reruns,
+        sessões e algoritmos; os DataFrames retornados não devem ser modificados.
         Args:
             df (pandas.DataFrame): DataFrame com os dados a serem preparados
         Returns:
             tuple: Dados divididos em treino e teste, ou None se não houver colunas numéricas suficientes
         """
+        prepared = DataModel._get_prepared(df)
+        return prepared[0] if prepared is not None else None
+
+    @staticmethod
+    def get_encoder(df):
+        """
+        Retorna o codificador das features usadas por prepare_data() (calculado uma vez por versão).
+        Args:
+            df (pandas.DataFrame): DataFrame com os dados
+        Returns:
+            FeatureEncoder: Codificador das features, ou None se não houver colunas numéricas suficientes
+        """
+        prepared = DataModel._get_prepared(df)
+        return prepared[1] if prepared is not None else None
+
+    @staticmethod
+    def _get_prepared(df):
+        """
+        Obtém do cache (ou calcula) a divisão treino/teste e o codificador de um DataFrame.
+        Returns:
+            tuple: ((X_train, X_test, y_train, y_test), FeatureEncoder), ou None
+        """
         # Obtém todas as colunas numéricas do DataFrame
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         
         # Verifica se há pelo menos duas colunas numéricas
-        if len(numeric_cols) >= 2:
-            # Separa features (X) e target (y)
-            X = df[numeric_cols[:-1]]  # Todas as colunas numéricas exceto a última
-            y = df[numeric_cols[-1]]   # Última coluna numérica como target
-            
-            # Divide os dados em conjuntos de treino e teste
-            return train_test_split(X, y, test_size=0.2, random_state=42)
-        return None
+        if len(numeric_cols) < 2:
+            return None
+
+        key = repr((DataModel.get_fingerprint(df), TEST_SIZE, SPLIT_RANDOM_STATE))
+        data, encoder = SHARED_STORE.get_or_create("prepared", key, lambda: DataModel._split(df, numeric_cols[-1]))
+        return SharedStore.view(data), encoder
+
+    @staticmethod
+    def _split(df, target):
+        """
+        Divide os dados em treino e teste (mesma divisão de train_test_split).
+        As features ficam em uma única matriz float64 contígua, com os registros de treino
+        seguidos pelos de teste; os conjuntos retornados são fatias dessa matriz, sem cópias.
+        Registros com valores ausentes nas colunas numéricas são descartados; nas categóricas,
+        o valor ausente é mantido como NaN.
+        Args:
+            df (pandas.DataFrame): DataFrame com os dados
+            target (str): Coluna prevista
+        Returns:
+            tuple: ((X_train, X_test, y_train, y_test), FeatureEncoder)
+        """
+        features = [name for name in df.columns if name != target]
+        encoder = FeatureEncoder.from_dataframe(df, features)
+        X = encoder.encode(df)
+        y = df[target].to_numpy(dtype=np.float64)
+        numeric = [j for j, name in enumerate(features) if name not in encoder.categories]
+        rows = np.flatnonzero(~(np.isnan(X[:, numeric]).any(axis=1) | np.isnan(y)))
+
+        # Sorteia as posições como train_test_split e reordena os registros uma única vez
+        from sklearn.model_selection import train_test_split
+        train_rows, test_rows = train_test_split(rows, test_size=TEST_SIZE, random_state=SPLIT_RANDOM_STATE)
+        rows = np.concatenate([train_rows, test_rows])
+        X, y, index = X[rows], y[rows], df.index[rows]
+        X.flags.writeable = False
+        y.flags.writeable = False
+
+        n_train = len(train_rows)
+        data = (
+            pd.DataFrame(X[:n_train], index=index[:n_train], columns=features, copy=False),
+            pd.DataFrame(X[n_train:], index=index[n_train:], columns=features, copy=False),
+            pd.Series(y[:n_train], index=index[:n_train], name=target, copy=False),
+            pd.Series(y[n_train:], index=index[n_train:], name=target, copy=False)
+        )
+        return data, encoder
     
     @staticmethod
     def get_numeric_columns(df):
@@ -55,3 +249,26 @@ class DataModel:
             pandas.Index: Lista de nomes das colunas numéricas
         """
         return df.select_dtypes(include=[np.number]).columns
+
+def _load_dataset(source):
+    """
+    Carrega um dataset pelo nome de origem.
+    Lê do armazenamento local mapeado em memória; apenas na primeira vez
+    o dataset é obtido do Seaborn e convertido para o armazenamento.
+    Args:
+        source (str): Nome do dataset no Seaborn
+    Returns:
+        pandas.DataFrame: Dataset carregado
+    """
+    df = DatasetStore.load(source)
+    if df is not None:
+        return df
+
+    import seaborn as sns  # Necessário apenas na primeira carga de cada dataset
+    df = sns.load_dataset(source)
+    try:
+        DatasetStore.save(source, df)
+    except OSError:
+        # Armazenamento sem permissão de escrita: usa o dataset compactado em memória
+        return DatasetStore.compact_dtypes(df)
+    return DatasetStore.load(source)
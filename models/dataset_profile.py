@@ -0,0 +1,125 @@
+# Importando as bibliotecas necessárias
+import warnings        # Para silenciar avisos de colunas sem valores
+import numpy as np     # Para operações numéricas
+import pandas as pd    # Para manipulação de dados em DataFrames
+
+# Número de registros processados por bloco no modo aproximado
+PROFILE_CHUNK_ROWS = 100_000
+# Tamanho da amostra usada para estimar os quantis no modo aproximado
+PROFILE_SAMPLE_ROWS = 100_000
+# Número de registros exibidos como amostra do dataset
+PROFILE_HEAD_ROWS = 5
+
+class DatasetProfile:
+    """
+    Perfil de um dataset, calculado uma vez por versão (impressão digital) do conteúdo.
+    Guarda formato, tipos, colunas numéricas, estatísticas descritivas, contagem de nulos
+    e uma amostra dos registros, para que reruns e sessões não recalculem essas informações.
+    """
+
+    def __init__(self, fingerprint, shape, dtypes, numeric_columns, describe, null_counts, sample, approximate):
+        """
+        Inicializa o perfil (use from_dataframe() para calculá-lo).
+        Args:
+            fingerprint (str): Impressão digital do dataset
+            shape (tuple): Número de registros e de variáveis
+            dtypes (pandas.Series): Tipo de cada coluna
+            numeric_columns (pandas.Index): Colunas numéricas
+            describe (pandas.DataFrame): Estatísticas descritivas das colunas numéricas
+            null_counts (pandas.Series): Quantidade de valores nulos por coluna
+            sample (pandas.DataFrame): Primeiros registros do dataset
+            approximate (bool): Se as estatísticas foram calculadas no modo aproximado
+        """
+        self.fingerprint = fingerprint
+        self.shape = shape
+        self.dtypes = dtypes
+        self.numeric_columns = numeric_columns
+        self.describe = describe
+        self.null_counts = null_counts
+        self.sample = sample
+        self.approximate = approximate
+
+    @staticmethod
+    def from_dataframe(df, fingerprint, approximate=False):
+        """
+        Calcula o perfil de um DataFrame.
+        Args:
+            df (pandas.DataFrame): DataFrame a ser analisado
+            fingerprint (str): Impressão digital do DataFrame
+            approximate (bool): Se True, calcula as estatísticas em uma única passagem por blocos,
+                com quantis estimados por amostragem, em vez das várias passagens de describe()
+        Returns:
+            DatasetProfile: Perfil calculado
+        """
+        numeric_columns = df.select_dtypes(include=[np.number]).columns
+        if approximate and len(numeric_columns) > 0:
+            describe = DatasetProfile._streaming_describe(df, numeric_columns)
+        else:
+            describe = df.describe()
+        return DatasetProfile(
+            fingerprint=fingerprint,
+            shape=df.shape,
+            dtypes=df.dtypes.copy(),
+            numeric_columns=numeric_columns,
+            describe=describe,
+            null_counts=df.isna().sum(),
+            sample=df.head(PROFILE_HEAD_ROWS).copy(),
+            approximate=approximate
+        )
+
+    @staticmethod
+    def _streaming_describe(df, numeric_columns):
+        """
+        Calcula as estatísticas descritivas em uma única passagem pelos dados.
+        Contagem, média, desvio padrão, mínimo e máximo são exatos e combinados bloco a bloco
+        (método de Chan para média e variância); os quartis são estimados em uma amostra aleatória.
+        Args:
+            df (pandas.DataFrame): DataFrame a ser analisado
+            numeric_columns (pandas.Index): Colunas numéricas
+        Returns:
+            pandas.DataFrame: Tabela no mesmo formato de describe()
+        """
+        n_cols = len(numeric_columns)
+        count = np.zeros(n_cols)
+        mean = np.zeros(n_cols)
+        m2 = np.zeros(n_cols)                       # Soma dos quadrados dos desvios
+        minimum = np.full(n_cols, np.inf)
+        maximum = np.full(n_cols, -np.inf)
+
+        for start in range(0, len(df), PROFILE_CHUNK_ROWS):
+            # Fatia as linhas antes das colunas para copiar apenas o bloco atual
+            block = df.iloc[start:start + PROFILE_CHUNK_ROWS][numeric_columns].to_numpy(dtype=np.float64)
+            block_count = np.sum(~np.isnan(block), axis=0)
+            block_mean = np.nansum(block, axis=0) / np.maximum(block_count, 1)
+            block_m2 = np.nansum((block - block_mean) ** 2, axis=0)
+
+            # Combina as estatísticas do bloco com as acumuladas
+            total = count + block_count
+            delta = block_mean - mean
+            mean = mean + delta * block_count / np.maximum(total, 1)
+            m2 = m2 + block_m2 + delta ** 2 * count * block_count / np.maximum(total, 1)
+            count = total
+
+            # fmin/fmax ignoram valores nulos
+            minimum = np.fmin(minimum, np.fmin.reduce(block, axis=0))
+            maximum = np.fmax(maximum, np.fmax.reduce(block, axis=0))
+
+        # Quartis estimados em uma amostra aleatória (reprodutível) dos registros
+        sample = df.sample(n=PROFILE_SAMPLE_ROWS, random_state=0) if len(df) > PROFILE_SAMPLE_ROWS else df
+        with warnings.catch_warnings():
+            # Colunas sem valores geram quartis nulos, como em describe()
+            warnings.simplefilter("ignore", RuntimeWarning)
+            quartiles = np.nanquantile(sample[numeric_columns].to_numpy(dtype=np.float64), [0.25, 0.5, 0.75], axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(m2 / (count - 1))
+        std[count < 2] = np.nan
+        empty = count == 0
+        mean[empty] = np.nan
+        minimum[empty] = np.nan
+        maximum[empty] = np.nan
+        return pd.DataFrame(
+            [count, mean, std, minimum, quartiles[0], quartiles[1], quartiles[2], maximum],
+            index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+            columns=numeric_columns
+        )
@@ -0,0 +1,168 @@
+# Importando as bibliotecas necessárias
+import json            # Para salvar os metadados de cada dataset
+import os              # Para manipular caminhos e diretórios
+import shutil          # Para remover diretórios temporários
+import tempfile        # Para gravar o dataset de forma atômica
+import numpy as np     # Para gravar e mapear as colunas em disco
+import pandas as pd    # Para manipulação de dados em DataFrames
+
+# Diretório padrão do armazenamento local (pode ser alterado pela variável de ambiente)
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "store")
+
+class DatasetStore:
+    """
+    Armazenamento local e colunar dos datasets.
+    Cada dataset é gravado em um diretório com um arquivo .npy por coluna e um meta.json.
+    Os tipos são compactados na gravação e as colunas são mapeadas em memória na leitura,
+    de modo que várias sessões com o mesmo dataset compartilham as páginas do arquivo.
+    """
+
+    @staticmethod
+    def get_store_dir():
+        """
+        Retorna o diretório do armazenamento local.
+        Returns:
+            str: Caminho do diretório (variável DATASET_STORE_DIR ou data/store do projeto)
+        """
+        return os.environ.get("DATASET_STORE_DIR", DEFAULT_STORE_DIR)
+
+    @staticmethod
+    def exists(source):
+        """
+        Verifica se o dataset já foi gravado no armazenamento local.
+        Args:
+            source (str): Nome do dataset no Seaborn
+        Returns:
+            bool: True se o dataset estiver disponível localmente
+        """
+        return os.path.exists(os.path.join(DatasetStore.get_store_dir(), source, "meta.json"))
+
+    @staticmethod
+    def compact_dtypes(df):
+        """
+        Compacta os tipos das colunas sem perda de informação.
+        Colunas de texto viram categóricas; floats e inteiros são reduzidos
+        para o menor tipo que representa exatamente os mesmos valores.
+        Args:
+            df (pandas.DataFrame): DataFrame original
+        Returns:
+            pandas.DataFrame: Novo DataFrame com tipos compactados
+        """
+        columns = {}
+        for col in df.columns:
+            series = df[col]
+            if isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(series.dtype):
+                # Já está em um formato compacto
+                columns[col] = series
+            elif pd.api.types.is_float_dtype(series.dtype):
+                # Reduz para float32 apenas se todos os valores forem preservados
+                values = series.to_numpy(dtype=np.float64)
+                compact = values.astype(np.float32)
+                if np.array_equal(compact.astype(np.float64), values, equal_nan=True):
+                    columns[col] = pd.Series(compact, index=df.index, name=col)
+                else:
+                    columns[col] = series
+            elif pd.api.types.is_integer_dtype(series.dtype):
+                # pd.to_numeric escolhe o menor inteiro que comporta o intervalo de valores
+                columns[col] = pd.to_numeric(series, downcast="integer")
+            else:
+                # Texto e demais tipos viram categóricas
+                columns[col] = series.astype("category")
+        return pd.DataFrame(columns, index=df.index)
+
+    @staticmethod
+    def save(source, df):
+        """
+        Grava o dataset no armazenamento local, em formato colunar e com tipos compactados.
+        A gravação é feita em um diretório temporário e renomeada ao final,
+        então leitores concorrentes nunca veem um dataset incompleto.
+        Args:
+            source (str): Nome do dataset no Seaborn
+            df (pandas.DataFrame): DataFrame a ser gravado
+        """
+        store_dir = DatasetStore.get_store_dir()
+        os.makedirs(store_dir, exist_ok=True)
+        df = DatasetStore.compact_dtypes(df.reset_index(drop=True))
+
+        tmp_dir = tempfile.mkdtemp(prefix=f".{source}-", dir=store_dir)
+        try:
+            meta = {"rows": len(df), "columns": []}
+            for i, col in enumerate(df.columns):
+                series = df[col]
+                file_name = f"{i:03d}.npy"
+                if isinstance(series.dtype, pd.CategoricalDtype):
+                    # Para categóricas, grava os códigos e guarda as categorias nos metadados
+                    np.save(os.path.join(tmp_dir, file_name), np.asarray(series.cat.codes))
+                    meta["columns"].append({
+                        "name": col,
+                        "file": file_name,
+                        "kind": "category",
+                        "categories": series.cat.categories.tolist(),
+                        "ordered": bool(series.cat.ordered)
+                    })
+                else:
+                    np.save(os.path.join(tmp_dir, file_name), series.to_numpy())
+                    meta["columns"].append({"name": col, "file": file_name, "kind": "array"})
+
+            with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+
+            target = os.path.join(store_dir, source)
+            try:
+                os.rename(tmp_dir, target)
+            except OSError:
+                # Outro processo gravou o mesmo dataset primeiro; mantém a versão existente
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+    @staticmethod
+    def load(source):
+        """
+        Lê o dataset do armazenamento local com as colunas mapeadas em memória.
+        As colunas numéricas são somente leitura e compartilhadas com o cache de páginas do sistema.
+        Args:
+            source (str): Nome do dataset no Seaborn
+        Returns:
+            pandas.DataFrame: Dataset carregado, ou None se não estiver no armazenamento
+        """
+        dataset_dir = os.path.join(DatasetStore.get_store_dir(), source)
+        meta_path = os.path.join(dataset_dir, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+        columns = {}
+        for info in meta["columns"]:
+            # view(np.ndarray) mantém o mapeamento em memória sem expor a subclasse memmap ao pandas
+            values = np.load(os.path.join(dataset_dir, info["file"]), mmap_mode="r", allow_pickle=False).view(np.ndarray)
+            if info["kind"] == "category":
+                columns[info["name"]] = pd.Categorical.from_codes(
+                    values, categories=info["categories"], ordered=info["ordered"]
+                )
+            else:
+                columns[info["name"]] = values
+        return pd.DataFrame(columns, copy=False)
+
+    @staticmethod
+    def build(sources):
+        """
+        Preenche o armazenamento local com os datasets informados.
+        Deve ser executado na construção/implantação do app para que o início a frio funcione offline.
+        Args:
+            sources (list): Nomes dos datasets no Seaborn
+        """
+        import seaborn as sns  # Necessário apenas para baixar os datasets
+
+        for source in sources:
+            if not DatasetStore.exists(source):
+                DatasetStore.save(source, sns.load_dataset(source))
+
+# Permite preencher o armazenamento com: python -m models.dataset_store
+if __name__ == "__main__":
+    from models.data_model import DataModel
+    DatasetStore.build([info["source"] for info in DataModel.DATASETS.values()])
+    print(f"Datasets gravados em {DatasetStore.get_store_dir()}")
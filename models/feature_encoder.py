@@ -0,0 +1,158 @@
+# Importando as bibliotecas necessárias
+# O pandas e o SciPy são importados dentro dos métodos que os usam,
+# para que importar este módulo (ex.: no serviço de predição) seja rápido
+import numpy as np     # Para as matrizes de códigos
+from models.algorithm_registry import AlgorithmRegistry, NATIVE_ENCODING, ONE_HOT_ENCODING  # Codificação de cada algoritmo
+
+class FeatureEncoder:
+    """
+    Codificação das features não numéricas (texto, categóricas e booleanas).
+    As categorias de cada coluna são obtidas uma única vez por versão do dataset
+    (ver DataModel.get_encoder()) e reaproveitadas por todos os algoritmos, sessões e
+    pelo serviço de predição.
+    A matriz de entrada dos modelos tem uma coluna por feature, com o código ordinal
+    da categoria nas colunas categóricas (NaN para valores ausentes ou desconhecidos):
+    as árvores usam essa matriz diretamente, os modelos lineares recebem a versão
+    one-hot, em formato esparso CSR, e o gradient boosting por histogramas recebe a mesma
+    matriz, com as colunas categóricas indicadas como tal (ver configure()).
+    """
+
+    def __init__(self, features, categories):
+        """
+        Inicializa o codificador.
+        Args:
+            features (list): Features de entrada, na ordem da matriz
+            categories (dict): Coluna categórica -> lista de categorias (o código é a posição na lista)
+        """
+        self.features = list(features)
+        self.categories = {name: list(values) for name, values in categories.items()}
+        self.categorical_features = [name for name in self.features if name in self.categories]
+        # Categoria -> código, para converter registros individuais sem o pandas
+        self._codes = {
+            name: {value: code for code, value in enumerate(values)} for name, values in self.categories.items()
+        }
+
+    @staticmethod
+    def from_dataframe(df, features):
+        """
+        Obtém as categorias das colunas não numéricas de um DataFrame.
+        Args:
+            df (pandas.DataFrame): DataFrame com os dados
+            features (list): Features de entrada
+        Returns:
+            FeatureEncoder: Codificador das features
+        """
+        import pandas as pd  # Para identificar os tipos das colunas
+        categories = {}
+        for name in features:
+            series = df[name]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                categories[name] = series.cat.categories.tolist()
+            elif pd.api.types.is_bool_dtype(series.dtype) or not pd.api.types.is_numeric_dtype(series.dtype):
+                categories[name] = sorted(series.dropna().unique().tolist(), key=str)
+        return FeatureEncoder(features, categories)
+
+    def uses_one_hot(self, estimator):
+        """
+        Verifica se o estimador deve receber as categorias em one-hot.
+        Args:
+            estimator: Estimador do scikit-learn
+        Returns:
+            bool: True para modelos lineares quando há features categóricas
+        """
+        return bool(self.categorical_features) and AlgorithmRegistry.get_encoding(estimator) == ONE_HOT_ENCODING
+
+    def configure(self, estimator):
+        """
+        Indica ao estimador quais colunas da matriz são categóricas, para os algoritmos com
+        suporte nativo a categorias: cada divisão separa conjuntos de categorias, sem one-hot.
+        Colunas com mais categorias que os bins do estimador continuam como códigos ordinais.
+        Args:
+            estimator: Estimador do scikit-learn (alterado no próprio objeto)
+        Returns:
+            O próprio estimador
+        """
+        if AlgorithmRegistry.get_encoding(estimator) != NATIVE_ENCODING:
+            return estimator
+        max_bins = estimator.get_params()["max_bins"]
+        native = [
+            j for j, name in enumerate(self.features)
+            if name in self.categories and len(self.categories[name]) <= max_bins
+        ]
+        return estimator.set_params(categorical_features=native or None)
+
+    def encode(self, df):
+        """
+        Monta a matriz de entrada com os códigos ordinais das colunas categóricas.
+        Args:
+            df (pandas.DataFrame): Registros com as features
+        Returns:
+            numpy.ndarray: Matriz float64 com uma coluna por feature
+        Raises:
+            KeyError: Se faltarem features nos registros
+        """
+        import pandas as pd  # Para converter as colunas em códigos
+        X = np.empty((len(df), len(self.features)))
+        for j, name in enumerate(self.features):
+            if name in self.categories:
+                codes = pd.Categorical(df[name], categories=self.categories[name]).codes
+                X[:, j] = np.where(codes >= 0, codes, np.nan)
+            else:
+                X[:, j] = df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        return X
+
+    def encode_records(self, records):
+        """
+        Monta a matriz de entrada a partir de uma lista de dicionários (ex.: requisições de predição).
+        Args:
+            records (list): Registros com as features
+        Returns:
+            numpy.ndarray: Matriz float64 com uma coluna por feature
+        Raises:
+            KeyError: Se faltarem features nos registros
+        """
+        nan = float("nan")
+        return np.array([
+            [self._codes[name].get(row[name], nan) if name in self._codes else row[name] for name in self.features]
+            for row in records
+        ], dtype=np.float64)
+
+    def one_hot(self, X):
+        """
+        Converte a matriz de códigos em uma matriz esparsa: as colunas numéricas seguidas de
+        uma coluna por categoria. Valores ausentes ou desconhecidos não ativam nenhuma coluna.
+        Args:
+            X: Matriz de entrada (array NumPy ou DataFrame), com as colunas em self.features
+        Returns:
+            scipy.sparse.csr_matrix: Matriz one-hot
+        """
+        import scipy.sparse as sp  # Para a matriz esparsa
+        X = np.asarray(X, dtype=np.float64)
+        numeric = [j for j, name in enumerate(self.features) if name not in self.categories]
+
+        rows, columns, offset = [], [], 0
+        for j, name in enumerate(self.features):
+            if name not in self.categories:
+                continue
+            n_categories = len(self.categories[name])
+            codes = X[:, j]
+            present = np.flatnonzero((codes >= 0) & (codes < n_categories))  # NaN não satisfaz a comparação
+            rows.append(present)
+            columns.append(offset + codes[present].astype(np.int64))
+            offset += n_categories
+        rows, columns = np.concatenate(rows), np.concatenate(columns)
+        indicators = sp.csr_matrix((np.ones(len(rows)), (rows, columns)), shape=(len(X), offset))
+        return sp.hstack([sp.csr_matrix(X[:, numeric]), indicators], format="csr")
+
+    def get_feature_names(self, one_hot=False):
+        """
+        Retorna os nomes das colunas da matriz de entrada.
+        Args:
+            one_hot (bool): Se True, os nomes das colunas da matriz one-hot ("coluna=categoria")
+        Returns:
+            list: Nomes das colunas
+        """
+        if not one_hot:
+            return list(self.features)
+        numeric = [name for name in self.features if name not in self.categories]
+        return numeric + [f"{name}={value}" for name in self.categorical_features for value in self.categories[name]]
@@ -0,0 +1,191 @@
+# Importando as bibliotecas necessárias
+# O joblib, o pandas e o scikit-learn são importados apenas ao calcular as importâncias
+import copy            # Para ajustar o número de núcleos sem alterar o estimador do cache
+import os              # Para obter o número de núcleos e ler a configuração
+import numpy as np     # Para operações numéricas
+from models.shared_arrays import shared_arrays  # Matriz de teste compartilhada entre os processos
+from models.tracing import Tracing  # Medição das etapas
+
+# Número padrão de repetições da importância por permutação (cada uma em um processo)
+PERMUTATION_REPEATS = int(os.environ.get("PERMUTATION_REPEATS", "5"))
+# Registros do conjunto de teste usados na permutação (amostra fixa, a mesma em todas as repetições)
+PERMUTATION_MAX_ROWS = int(os.environ.get("PERMUTATION_MAX_ROWS", "20000"))
+# Nomes das colunas das tabelas de importância
+IMPURITY_COLUMN = "Importância (Impureza)"
+COEFFICIENT_COLUMN = "Coeficiente"
+PERMUTATION_COLUMN = "Queda do R²"
+PERMUTATION_STD_COLUMN = "Desvio"
+
+class FeatureImportance:
+    """
+    Classe responsável pela importância das features de um modelo treinado.
+    A importância do próprio modelo vem da redução de impureza (árvores e florestas) ou dos
+    coeficientes (modelos lineares); a importância por permutação, disponível para todos os
+    algoritmos, é a queda do R² no conjunto de teste quando os valores de uma feature são
+    embaralhados. As repetições da permutação rodam em processos paralelos, com a matriz de
+    teste gravada uma única vez e compartilhada somente leitura (como na validação cruzada).
+    """
+
+    @staticmethod
+    def compute(estimator, X_test, y_test, encoder=None, one_hot=False, n_repeats=PERMUTATION_REPEATS,
+                progress=None, random_state=42):
+        """
+        Calcula a importância do modelo e a importância por permutação.
+        Args:
+            estimator: Estimador treinado
+            X_test: Features de teste (colunas de DataModel.prepare_data())
+            y_test: Target de teste
+            encoder (FeatureEncoder): Codificador das features (nomes das colunas e one-hot)
+            one_hot (bool): Se o estimador foi treinado com as categorias em one-hot
+            n_repeats (int): Número de repetições da permutação
+            progress (callable): Função opcional chamada com a fração concluída
+            random_state (int): Semente da amostra e das permutações
+        Returns:
+            dict: "model" (DataFrame com a importância do modelo, ou None se o algoritmo não a
+                fornece) e "permutation" (DataFrame com a queda média do R² e o desvio por feature)
+        """
+        with Tracing.span("model_importance"):
+            model_importance = FeatureImportance.model_based(estimator, X_test, encoder, one_hot)
+        with Tracing.span("permutation_importance"):
+            permutation_importance = FeatureImportance.permutation(
+                estimator, X_test, y_test, encoder if one_hot else None, n_repeats, progress, random_state
+            )
+        return {"model": model_importance, "permutation": permutation_importance}
+
+    @staticmethod
+    def model_based(estimator, X, encoder=None, one_hot=False):
+        """
+        Obtém a importância calculada pelo próprio modelo, ordenada pelo valor absoluto.
+        Args:
+            estimator: Estimador treinado
+            X: Features (define os nomes das colunas quando não há codificador)
+            encoder (FeatureEncoder): Codificador das features
+            one_hot (bool): Se True, os coeficientes são das colunas one-hot ("coluna=categoria")
+        Returns:
+            pandas.DataFrame: Feature e importância (impureza) ou coeficiente, ou None
+        """
+        import pandas as pd  # Para a tabela de importâncias
+        if hasattr(estimator, "feature_importances_"):
+            column, values = IMPURITY_COLUMN, estimator.feature_importances_
+        elif hasattr(estimator, "coef_"):
+            column, values = COEFFICIENT_COLUMN, np.ravel(estimator.coef_)
+        else:
+            # Ex.: gradient boosting por histogramas, que não calcula a importância por impureza
+            return None
+        names = FeatureImportance.get_feature_names(X, encoder, one_hot)
+        if len(names) != len(values):
+            names = [f"x{j}" for j in range(len(values))]
+        importance = pd.DataFrame({"Feature": names, column: values})
+        order = np.argsort(-np.abs(importance[column].to_numpy()), kind="stable")
+        return importance.iloc[order].reset_index(drop=True)
+
+    @staticmethod
+    def permutation(estimator, X, y, encoder=None, n_repeats=PERMUTATION_REPEATS, progress=None, random_state=42):
+        """
+        Calcula a importância por permutação das features de entrada, com uma repetição por processo.
+        Cada repetição embaralha uma feature por vez (com uma semente própria) e mede a queda do R².
+        Features categóricas são embaralhadas como uma única coluna, mesmo nos modelos lineares.
+        Args:
+            estimator: Estimador treinado
+            X: Features de teste
+            y: Target de teste
+            encoder (FeatureEncoder): Se informado, a matriz é convertida em one-hot antes da predição
+            n_repeats (int): Número de repetições
+            progress (callable): Função opcional chamada com a fração concluída;
+                pode lançar uma exceção para interromper o cálculo
+            random_state (int): Semente da amostra e das permutações
+        Returns:
+            pandas.DataFrame: Feature, queda média do R² e desvio entre as repetições, da mais importante
+                para a menos importante
+        """
+        import joblib          # Para processos paralelos
+        import pandas as pd    # Para a tabela de importâncias
+        report = progress or (lambda fraction: None)
+        report(0.0)
+
+        names = FeatureImportance.get_feature_names(X, encoder)
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if len(X) > PERMUTATION_MAX_ROWS:
+            # Amostra fixa do conjunto de teste: o custo não cresce com o dataset
+            rows = np.sort(np.random.default_rng(random_state).choice(len(X), PERMUTATION_MAX_ROWS, replace=False))
+            X, y = X[rows], y[rows]
+
+        # Cada repetição roda em um processo; o estimador usa um único núcleo para não disputar CPU
+        if estimator.get_params().get("n_jobs") not in (None, 1):
+            estimator = copy.deepcopy(estimator)
+            estimator.set_params(n_jobs=1)
+
+        seeds = np.random.SeedSequence(random_state).generate_state(n_repeats)
+        # Grava a matriz de teste uma vez e a reabre mapeada em memória (somente leitura)
+        with shared_arrays(X, y, prefix="importance-") as (X_shared, y_shared):
+            n_jobs = min(n_repeats, os.cpu_count() or 1)
+            tasks = (
+                joblib.delayed(_permutation_repeat)(estimator, X_shared, y_shared, int(seed), encoder)
+                for seed in seeds
+            )
+            drops = []
+            for result in joblib.Parallel(n_jobs=n_jobs, return_as="generator")(tasks):
+                drops.append(result)
+                report(len(drops) / n_repeats)
+
+        drops = np.array(drops)  # Repetições x features
+        importance = pd.DataFrame({
+            "Feature": names, PERMUTATION_COLUMN: drops.mean(axis=0), PERMUTATION_STD_COLUMN: drops.std(axis=0)
+        })
+        return importance.sort_values(PERMUTATION_COLUMN, ascending=False, kind="stable").reset_index(drop=True)
+
+    @staticmethod
+    def get_feature_names(X, encoder=None, one_hot=False):
+        """
+        Retorna os nomes das colunas da matriz de entrada do modelo.
+        Args:
+            X: Features (DataFrame ou array NumPy)
+            encoder (FeatureEncoder): Codificador das features
+            one_hot (bool): Se True, os nomes das colunas da matriz one-hot
+        Returns:
+            list: Nomes das colunas
+        """
+        if encoder is not None:
+            return encoder.get_feature_names(one_hot)
+        if hasattr(X, "columns"):
+            return [str(name) for name in X.columns]
+        return [f"x{j}" for j in range(np.shape(X)[1])]
+
+
+def _permutation_repeat(estimator, X, y, seed, encoder=None):
+    """
+    Executa uma repetição da importância por permutação (em um processo do pool).
+    X e y chegam como arrays mapeados em memória; cada processo trabalha em uma única cópia de X,
+    embaralhando uma coluna por vez e restaurando-a em seguida.
+    Args:
+        estimator: Estimador treinado
+        X (numpy.ndarray): Features de teste (somente leitura)
+        y (numpy.ndarray): Target de teste (somente leitura)
+        seed (int): Semente das permutações desta repetição
+        encoder (FeatureEncoder): Se informado, a matriz é convertida em one-hot antes da predição
+    Returns:
+        numpy.ndarray: Queda do R² ao embaralhar cada feature
+    """
+    import pandas as pd  # Para manter os nomes das features na predição
+    # O estimador treinado com DataFrame recebe os nomes das colunas (evita o aviso do scikit-learn)
+    columns = getattr(estimator, "feature_names_in_", None) if encoder is None else None
+
+    def prepare(matrix):
+        if encoder is not None:
+            return encoder.one_hot(matrix)
+        if columns is not None:
+            return pd.DataFrame(matrix, columns=columns, copy=False)
+        return matrix
+
+    rng = np.random.default_rng(seed)
+    X_permuted = np.array(X)
+
+    baseline = estimator.score(prepare(X_permuted), y)
+    drops = np.empty(X_permuted.shape[1])
+    for j in range(X_permuted.shape[1]):
+        original = X_permuted[:, j].copy()
+        X_permuted[:, j] = original[rng.permutation(len(original))]
+        drops[j] = baseline - estimator.score(prepare(X_permuted), y)
+        X_permuted[:, j] = original
+    return drops
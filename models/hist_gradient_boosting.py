@@ -0,0 +1,95 @@
+# Importando as bibliotecas necessárias
+# Este módulo é importado apenas no primeiro uso do algoritmo (ver models.algorithm_registry)
+import copy            # Para que cada estimador tenha os seus limites dos bins
+import inspect         # Para conferir a assinatura do método sobrescrito
+import numpy as np     # Para as categorias conhecidas de cada feature
+from sklearn.ensemble import HistGradientBoostingRegressor  # Gradient boosting com features discretizadas em bins
+from models.model_cache import ModelCache              # Impressão digital das matrizes discretizadas
+from models.shared_store import SHARED_STORE           # Bins compartilhados entre treinamentos e sessões
+
+# Tipo das entradas no armazenamento compartilhado
+BINNING_NAMESPACE = "binning"
+# _bin_data é um método privado do scikit-learn: o reaproveitamento só é usado quando a assinatura
+# é a conhecida; em outras versões o estimador se comporta exatamente como o original
+BIN_DATA_SUPPORTED = list(inspect.signature(HistGradientBoostingRegressor._bin_data).parameters) == [
+    "self", "X", "sample_weight", "is_training_data"
+]
+
+class BinnedGradientBoostingRegressor(HistGradientBoostingRegressor):
+    """
+    Gradient boosting por histogramas que reaproveita a discretização das features.
+    Antes de treinar, o HistGradientBoostingRegressor calcula os limites dos bins de cada
+    feature (quantis) e converte a matriz de treino (e a de validação do early stopping) em
+    códigos de bin; em datasets grandes essa etapa custa tanto quanto dezenas de iterações.
+    Os limites e as matrizes discretizadas ficam no armazenamento compartilhado (SHARED_STORE),
+    identificados pelo conteúdo dos dados e pelos parâmetros da discretização: treinar de novo
+    com outro número de iterações, outra taxa de aprendizado, em outro fold da busca ou em outra
+    sessão pula a discretização. O resultado é idêntico ao do estimador do scikit-learn.
+    """
+
+    def _bin_data(self, *args, **kwargs):
+        """
+        Discretiza a matriz de treino ou de validação (sobrescreve o método do scikit-learn).
+        Com uma assinatura desconhecida (outra versão do scikit-learn), usa o método original.
+        Returns:
+            numpy.ndarray: Matriz de códigos de bin
+        """
+        if not BIN_DATA_SUPPORTED:
+            self._binning_key = None
+            return super()._bin_data(*args, **kwargs)
+        return self._reuse_bin_data(*args, **kwargs)
+
+    def _reuse_bin_data(self, X, sample_weight, is_training_data):
+        """
+        Discretiza a matriz de treino ou de validação, reaproveitando o resultado já calculado.
+        Args:
+            X (numpy.ndarray): Matriz de entrada já validada pelo scikit-learn
+            sample_weight: Pesos das amostras; com pesos, os quantis mudam e nada é reaproveitado
+            is_training_data (bool): Se True, também define os limites dos bins (self._bin_mapper)
+        Returns:
+            numpy.ndarray: Matriz de códigos de bin (somente leitura quando reaproveitada)
+        """
+        if sample_weight is not None:
+            self._binning_key = None
+            return super()._bin_data(X, sample_weight, is_training_data)
+
+        if is_training_data:
+            self._binning_key = BinnedGradientBoostingRegressor._make_key(self._bin_mapper, X)
+
+            def discretize():
+                X_binned = super(BinnedGradientBoostingRegressor, self)._bin_data(X, None, True)
+                return {"bin_mapper": self._bin_mapper, "X_binned": X_binned}
+
+            binned = SHARED_STORE.get_or_create(BINNING_NAMESPACE, self._binning_key, discretize)
+            # Os limites dos bins também são usados na predição e, com categorias nativas, precisam
+            # ser graváveis pelo scikit-learn: cada estimador recebe uma cópia (poucos KB)
+            self._bin_mapper = copy.deepcopy(binned["bin_mapper"])
+            return binned["X_binned"]
+
+        if self._binning_key is None:
+            return super()._bin_data(X, None, False)
+        # A validação é discretizada com os limites do treino: a chave inclui a do treino
+        return SHARED_STORE.get_or_create(
+            BINNING_NAMESPACE, f"{self._binning_key}:val:{ModelCache.fingerprint(X)}",
+            lambda: super(BinnedGradientBoostingRegressor, self)._bin_data(X, None, False)
+        )
+
+    @staticmethod
+    def _make_key(bin_mapper, X):
+        """
+        Monta a chave da discretização da matriz de treino.
+        Args:
+            bin_mapper: Discretizador ainda não ajustado, com os parâmetros do treinamento
+            X (numpy.ndarray): Matriz de treino
+        Returns:
+            str: Conteúdo da matriz, número de bins, semente da subamostra dos quantis e categorias
+        """
+        is_categorical = bin_mapper.is_categorical
+        known_categories = [
+            None if categories is None else np.asarray(categories).tolist()
+            for categories in (bin_mapper.known_categories or [])
+        ]
+        return ModelCache.fingerprint(X) + ":" + repr((
+            bin_mapper.n_bins, bin_mapper.subsample, int(bin_mapper.random_state),
+            None if is_categorical is None else np.asarray(is_categorical).tolist(), known_categories
+        ))
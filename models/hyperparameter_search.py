@@ -0,0 +1,243 @@
+# Importando as bibliotecas necessárias
+import os              # Para obter o número de núcleos disponíveis
+import time            # Para medir o retreino e a avaliação do melhor estimador
+import numpy as np     # Para gerar a grade de valores
+import pandas as pd    # Para montar o ranking dos candidatos
+# O SciPy e o scikit-learn são importados apenas ao executar uma busca
+from models.algorithm_registry import AlgorithmRegistry, PARAM_SPACE  # Mesmo espaço de hiperparâmetros dos controles da interface
+from models.model_cache import MODEL_CACHE           # Cache de modelos treinados
+from models.run_history import RUN_HISTORY           # Histórico das execuções (SQLite)
+from models.shared_arrays import shared_arrays       # Matrizes compartilhadas entre os processos
+from models.tracing import Tracing                   # Medição das etapas
+
+# Estratégias de busca disponíveis
+RANDOM_STRATEGY = "Aleatória"
+GRID_STRATEGY = "Grade"
+# Número de valores por hiperparâmetro inteiro na busca em grade
+GRID_POINTS = 5
+# Fator de eliminação do successive halving: a cada rodada, 1/3 dos candidatos continuam com 3x mais dados
+HALVING_FACTOR = 3
+# Número de folds da validação cruzada de cada rodada
+SEARCH_CV_FOLDS = 3
+# Registros mínimos da primeira rodada (com menos, o R² de cada fold é pouco informativo)
+SEARCH_MIN_ROWS = 100
+
+class HyperparameterSearch:
+    """
+    Classe responsável pela busca de hiperparâmetros.
+    Amostra (ou percorre em grade) o mesmo espaço exposto pelos controles da interface,
+    avalia os candidatos em paralelo em todos os núcleos e usa successive halving:
+    todos os candidatos começam com poucas amostras e apenas os melhores recebem mais dados.
+    As rodadas são executadas uma a uma e o progresso é informado a cada fold avaliado,
+    então a busca pode ser cancelada entre os candidatos.
+    """
+
+    @staticmethod
+    def get_search_space(algorithm_name, strategy):
+        """
+        Converte o espaço de hiperparâmetros do algoritmo para o formato da busca.
+        Args:
+            algorithm_name (str): Nome do algoritmo (chave de PARAM_SPACE)
+            strategy (str): RANDOM_STRATEGY ou GRID_STRATEGY
+        Returns:
+            dict: Distribuições (busca aleatória) ou listas de valores (busca em grade)
+        """
+        from scipy.stats import randint  # Distribuição uniforme de inteiros para a busca aleatória
+        space = {}
+        for name, values in PARAM_SPACE[algorithm_name].items():
+            if isinstance(values, list):
+                space[name] = values
+            elif strategy == RANDOM_STRATEGY:
+                space[name] = randint(values[0], values[1] + 1)
+            else:
+                # Valores inteiros igualmente espaçados no intervalo
+                space[name] = sorted({int(v) for v in np.linspace(values[0], values[1], GRID_POINTS)})
+        return space
+
+    @staticmethod
+    def get_candidates(algorithm_name, strategy, n_candidates):
+        """
+        Obtém os candidatos da busca.
+        Args:
+            algorithm_name (str): Nome do algoritmo (chave de PARAM_SPACE)
+            strategy (str): RANDOM_STRATEGY ou GRID_STRATEGY
+            n_candidates (int): Número máximo de candidatos
+        Returns:
+            list: Dicionários de hiperparâmetros; uma grade com até n_candidates pontos é percorrida
+                inteira, e uma maior é reduzida a n_candidates pontos distintos amostrados da grade
+                (ex.: Random Forest tem 5^4 = 625 pontos)
+        """
+        from sklearn.model_selection import ParameterGrid, ParameterSampler
+        space = HyperparameterSearch.get_search_space(algorithm_name, strategy)
+        if all(isinstance(values, list) for values in space.values()):
+            # Com todos os valores em listas, a amostragem é feita sem repetição entre os pontos da grade
+            grid = ParameterGrid(space)
+            if len(grid) <= n_candidates:
+                return list(grid)
+        return list(ParameterSampler(space, n_candidates, random_state=42))
+
+    @staticmethod
+    def get_schedule(n_candidates, n_samples):
+        """
+        Calcula as rodadas do successive halving: cada rodada mantém 1/HALVING_FACTOR dos candidatos
+        e multiplica os registros por HALVING_FACTOR; a última usa todos os registros de treino.
+        Args:
+            n_candidates (int): Número de candidatos da primeira rodada
+            n_samples (int): Registros de treino
+        Returns:
+            list: (Candidatos, registros) de cada rodada
+        """
+        # Rodadas até restarem menos de HALVING_FACTOR candidatos, limitadas pelos registros disponíveis
+        n_rounds, remaining = 1, n_candidates
+        while remaining >= HALVING_FACTOR:
+            remaining //= HALVING_FACTOR
+            n_rounds += 1
+        while n_rounds > 1 and SEARCH_MIN_ROWS * HALVING_FACTOR ** (n_rounds - 1) > n_samples:
+            n_rounds -= 1
+
+        schedule, candidates = [], n_candidates
+        for round_index in range(n_rounds):
+            n_resources = n_samples // HALVING_FACTOR ** (n_rounds - 1 - round_index)
+            schedule.append((candidates, n_resources))
+            candidates = -(-candidates // HALVING_FACTOR)  # Divisão com arredondamento para cima
+        return schedule
+
+    @staticmethod
+    def search(algorithm, algorithm_name, X_train, X_test, y_train, y_test,
+               strategy=RANDOM_STRATEGY, n_candidates=20, progress=None, encoder=None, dataset_name=None):
+        """
+        Executa a busca de hiperparâmetros e avalia o melhor estimador no conjunto de teste.
+        Args:
+            algorithm: Estimador configurado na interface (usado como base da busca)
+            algorithm_name (str): Nome do algoritmo (chave de PARAM_SPACE)
+            X_train: Features de treino
+            X_test: Features de teste
+            y_train: Target de treino
+            y_test: Target de teste
+            strategy (str): RANDOM_STRATEGY ou GRID_STRATEGY
+            n_candidates (int): Número de candidatos amostrados na busca aleatória; na busca em grade,
+                grades maiores são reduzidas a n_candidates pontos amostrados da grade
+            progress (callable): Função opcional chamada com a fração concluída (a cada fold avaliado);
+                pode lançar uma exceção para interromper a busca
+            encoder (FeatureEncoder): Codificador das features; modelos lineares são buscados
+                com as features categóricas em one-hot esparso
+            dataset_name (str): Nome do dataset, usado para gravar o melhor estimador no histórico de execuções
+        Returns:
+            tuple: (Score R² do melhor modelo, nome do modelo, parâmetros, ranking dos candidatos)
+        """
+        import joblib                              # Para avaliar os candidatos em processos paralelos
+        from sklearn.base import clone             # Para criar o estimador de cada candidato
+        from sklearn.model_selection import KFold  # Para dividir os registros de cada rodada em folds
+        from models.ml_model import MLModel, _fit_fold  # Treino em etapas e avaliação de um fold
+
+        report = progress or (lambda fraction: None)
+        report(0.0)
+
+        # Os candidatos já rodam em paralelo; cada estimador usa um único núcleo
+        base = clone(algorithm)
+        if "n_jobs" in base.get_params():
+            base.set_params(n_jobs=1)
+
+        # Mesma codificação de MLModel.train_and_evaluate(); nas rodadas, como na validação cruzada,
+        # cada fold converte as suas linhas em one-hot a partir da matriz compartilhada
+        X_fit, X_score = X_train, X_test
+        fold_encoder = None
+        if encoder is not None and encoder.uses_one_hot(base):
+            X_fit, X_score = encoder.one_hot(X_train), encoder.one_hot(X_test)
+            fold_encoder = encoder
+
+        def build(estimator, params):
+            candidate = clone(estimator).set_params(**params)
+            if encoder is not None:
+                # Categorias nativas conforme o max_bins do próprio candidato, como no treinamento
+                encoder.configure(candidate)
+            return candidate
+
+        candidates = HyperparameterSearch.get_candidates(algorithm_name, strategy, n_candidates)
+        schedule = HyperparameterSearch.get_schedule(len(candidates), np.shape(X_train)[0])
+        n_tasks = sum(n_round * SEARCH_CV_FOLDS for n_round, _ in schedule)
+
+        # Cada rodada usa os primeiros registros de uma ordem aleatória fixa (subconjuntos crescentes)
+        order = np.random.default_rng(42).permutation(np.shape(X_train)[0])
+
+        results = []  # (rodada, registros, candidato, R² médio, desvio)
+        alive = list(range(len(candidates)))
+        done = 0
+        # Grava as matrizes uma vez e as reabre mapeadas em memória (somente leitura) para todas as rodadas
+        with shared_arrays(X_train, y_train, prefix="search-") as (X_cv, y_cv), Tracing.span("search_fit"):
+            for round_index, (_, n_resources) in enumerate(schedule):
+                rows = order[:n_resources]
+                folds = list(KFold(n_splits=SEARCH_CV_FOLDS, shuffle=True, random_state=42).split(rows))
+                tasks = (
+                    joblib.delayed(_fit_fold)(
+                        build(base, candidates[index]), X_cv, y_cv, rows[train_idx], rows[test_idx], fold_encoder
+                    )
+                    for index in alive for train_idx, test_idx in folds
+                )
+                scores = []
+                n_jobs = min(len(alive) * SEARCH_CV_FOLDS, os.cpu_count() or 1)
+                for score, _, _ in joblib.Parallel(n_jobs=n_jobs, return_as="generator")(tasks):
+                    scores.append(score)
+                    done += 1
+                    # Ponto de cancelamento entre os candidatos (a função pode lançar uma exceção)
+                    report(0.9 * done / n_tasks)
+
+                scores = np.array(scores, dtype=np.float64).reshape(len(alive), SEARCH_CV_FOLDS)
+                means, stds = scores.mean(axis=1), scores.std(axis=1)
+                results.extend(
+                    (round_index, n_resources, index, mean, std) for index, mean, std in zip(alive, means, stds)
+                )
+                # Os melhores candidatos (R² indefinido conta como o pior) seguem para a próxima rodada
+                ranking = np.argsort(-np.nan_to_num(means, nan=-np.inf), kind="stable")
+                alive = [alive[j] for j in ranking[:-(-len(alive) // HALVING_FACTOR)]]
+
+        # O melhor candidato parte do estimador da interface (com os seus núcleos) e tem a mesma
+        # configuração e a mesma chave de cache que MLModel.train_and_evaluate() monta para ele
+        best = build(algorithm, candidates[alive[0]])
+        data_fingerprint, cache_key, _ = MLModel._make_cache_key(best, X_train, X_test, y_train, y_test, encoder)
+
+        # Retreina o melhor candidato com todo o treino, em etapas (com progresso e cancelamento)
+        with Tracing.span("refit"):
+            start = time.perf_counter()
+            MLModel._fit(best, X_fit, y_train, lambda fraction: report(0.9 + 0.09 * fraction))
+            fit_seconds = time.perf_counter() - start
+
+        # Avalia o melhor estimador no conjunto de teste
+        with Tracing.span("score"):
+            start = time.perf_counter()
+            score = best.score(X_score, y_test)
+            score_seconds = time.perf_counter() - start
+
+        # Guarda o melhor estimador no cache e no histórico: executar o modelo com esses parâmetros será imediato
+        MODEL_CACHE.put(cache_key, {"estimator": best, "score": score})
+        RUN_HISTORY.record(
+            cache_key, best, dataset_name, AlgorithmRegistry.get_name(best) or best.__class__.__name__,
+            data_fingerprint, score, fit_seconds, score_seconds, np.shape(X_train)[0], np.shape(X_test)[0],
+            kind="search"
+        )
+        report(1.0)
+
+        leaderboard = HyperparameterSearch.get_leaderboard(candidates, results)
+        return score, best.__class__.__name__, best.get_params(), leaderboard
+
+    @staticmethod
+    def get_leaderboard(candidates, results):
+        """
+        Monta o ranking dos candidatos avaliados.
+        Candidatos que chegaram às rodadas finais (com mais dados) ficam à frente.
+        Args:
+            candidates (list): Hiperparâmetros de cada candidato
+            results (list): (Rodada, registros, candidato, R² médio, desvio) de cada avaliação
+        Returns:
+            pandas.DataFrame: Ranking com score médio, desvio, rodada, amostras e parâmetros
+        """
+        evaluations = pd.DataFrame(results, columns=["Rodada", "Amostras", "Candidato", "R² Médio (CV)", "Desvio"])
+        # Mantém apenas a última avaliação de cada candidato
+        evaluations = evaluations.drop_duplicates(subset="Candidato", keep="last")
+        evaluations = evaluations.sort_values(
+            ["Rodada", "R² Médio (CV)"], ascending=[False, False], na_position="last", kind="stable"
+        ).reset_index(drop=True)
+        params = pd.DataFrame([candidates[index] for index in evaluations["Candidato"]])
+        leaderboard = evaluations[["R² Médio (CV)", "Desvio", "Rodada", "Amostras"]]
+        leaderboard.insert(0, "Posição", range(1, len(leaderboard) + 1))
+        return pd.concat([leaderboard, params], axis=1)
@@ -1,166 +1,55 @@
-# Importando os algoritmos de machine learning do scikit-learn
-from sklearn.linear_model import LinearRegression      # Para regressão linear
-from sklearn.tree import DecisionTreeRegressor        # Para árvore de decisão
-from sklearn.ensemble import RandomForestRegressor    # Para random forest
-import streamlit as st                               # Para interface do usuário
+# Importando as bibliotecas necessárias
+# O scikit-learn, o pandas e o joblib são importados dentro das funções que os usam,
+# para que importar este módulo (ex.: em workers e benchmarks) seja rápido
+import copy                                          # Para copiar florestas do cache antes de ampliá-las
+import os                                            # Para obter o número de núcleos disponíveis
+import time                                          # Para medir o tempo de cada fold
+import numpy as np                                   # Para operações numéricas
+from models.algorithm_registry import AlgorithmRegistry, ONE_HOT_ENCODING  # Registro dos algoritmos (sem dependência da interface)
+# Reexportados para compatibilidade com quem importava os algoritmos deste módulo
+from models.algorithm_registry import ALGORITHMS, INCREMENTAL_ALGORITHMS, PARAM_SPACE, DEFAULT_PARAMS  # noqa: F401
+from models.feature_importance import FeatureImportance, PERMUTATION_REPEATS  # Importância das features
+from models.model_cache import MODEL_CACHE, ModelCache  # Cache de modelos treinados
+from models.model_registry import MODEL_REGISTRY     # Modelos disponíveis para o serviço de predição
+from models.run_history import RUN_HISTORY           # Histórico das execuções (SQLite)
+from models.shared_arrays import shared_arrays       # Matrizes compartilhadas entre os processos
+from models.shared_store import SHARED_STORE         # Importâncias compartilhadas entre sessões
+from models.tracing import Tracing                   # Medição das etapas
+from models.training_manager import TrainingStopped  # Encerramento do treinamento progressivo pelo usuário
+
+# Número de etapas em que os ensembles são treinados para reportar progresso e permitir cancelamento
+ENSEMBLE_FIT_STEPS = 10
+# Frações dos dados de treino usadas em cada etapa do treinamento progressivo
+PROGRESSIVE_FRACTIONS = (0.01, 0.05, 0.25, 1.0)
+# Etapas intermediárias com menos registros que isso são omitidas (R² pouco informativo)
+PROGRESSIVE_MIN_ROWS = 200
+# Tipo das importâncias das features no armazenamento compartilhado
+IMPORTANCE_NAMESPACE = "importance"
 
 class MLModel:
     """
     Classe responsável por gerenciar os modelos de machine learning.
-    Fornece métodos para obter algoritmos disponíveis e treinar/avaliar modelos.
+    Fornece métodos para criar, treinar e avaliar modelos; os controles da interface
+    ficam em views.model_config_view.
     """
     
     @staticmethod
-    def get_model_params(model_name):
+    def build_algorithm(algorithm_name, params=None):
         """
-        Retorna os hiperparâmetros disponíveis para cada modelo.
+        Cria a instância de um algoritmo sem usar a interface (ex.: para benchmarks).
         Args:
-            model_name (str): Nome do modelo selecionado
+            algorithm_name (str): Nome do algoritmo
+            params (dict): Hiperparâmetros; os ausentes usam DEFAULT_PARAMS
         Returns:
-            dict: Dicionário com os hiperparâmetros e seus valores
-        """
-        if model_name == "Regressão Linear":
-            # Regressão Linear tem poucos hiperparâmetros ajustáveis
-            # Para normalização, use StandardScaler antes de aplicar o modelo
-            return {
-                "fit_intercept": st.checkbox(
-                    "Incluir Intercepto",
-                    value=True,
-                    help="Se True, o modelo calculará o intercepto (termo constante). "
-                         "Se False, o modelo assumirá que os dados estão centralizados."
-                )
-            }
-        
-        elif model_name == "Árvore de Decisão":
-            # Hiperparâmetros principais da Árvore de Decisão
-            return {
-                "max_depth": st.slider(
-                    "Profundidade Máxima",
-                    min_value=1,
-                    max_value=20,
-                    value=None,
-                    help="Profundidade máxima da árvore. Se None, a árvore crescerá até as folhas serem puras "
-                         "ou terem min_samples_split amostras."
-                ),
-                "min_samples_split": st.slider(
-                    "Mínimo de Amostras para Divisão",
-                    min_value=2,
-                    max_value=20,
-                    value=2,
-                    help="Número mínimo de amostras necessário para dividir um nó interno."
-                ),
-                "min_samples_leaf": st.slider(
-                    "Mínimo de Amostras por Folha",
-                    min_value=1,
-                    max_value=20,
-                    value=1,
-                    help="Número mínimo de amostras necessário para ser um nó folha."
-                ),
-                "random_state": st.number_input(
-                    "Semente Aleatória",
-                    value=42,
-                    help="Controla a aleatoriedade do estimador."
-                )
-            }
-        
-        elif model_name == "Random Forest":
-            # Hiperparâmetros principais do Random Forest
-            return {
-                "n_estimators": st.slider(
-                    "Número de Árvores",
-                    min_value=10,
-                    max_value=200,
-                    value=100,
-                    help="Número de árvores na floresta."
-                ),
-                "max_depth": st.slider(
-                    "Profundidade Máxima",
-                    min_value=1,
-                    max_value=20,
-                    value=None,
-                    help="Profundidade máxima das árvores. Se None, as árvores crescerão até as folhas serem puras "
-                         "ou terem min_samples_split amostras."
-                ),
-                "min_samples_split": st.slider(
-                    "Mínimo de Amostras para Divisão",
-                    min_value=2,
-                    max_value=20,
-                    value=2,
-                    help="Número mínimo de amostras necessário para dividir um nó interno."
-                ),
-                "min_samples_leaf": st.slider(
-                    "Mínimo de Amostras por Folha",
-                    min_value=1,
-                    max_value=20,
-                    value=1,
-                    help="Número mínimo de amostras necessário para ser um nó folha."
-                ),
-                "random_state": st.number_input(
-                    "Semente Aleatória",
-                    value=42,
-                    help="Controla a aleatoriedade do estimador."
-                )
-            }
-        return {}
-    
-    @staticmethod
-    def get_available_algorithms():
+            Instância do algoritmo do scikit-learn
+        Raises:
+            KeyError: Se o algoritmo não existir
         """
-        Retorna um dicionário com os algoritmos de machine learning disponíveis.
-        Cada algoritmo é instanciado com seus parâmetros padrão.
-        Returns:
-            dict: Dicionário com nome do algoritmo e sua instância
-        """
-        # Obtém o nome do algoritmo selecionado
-        algorithm_name = st.selectbox(
-            "Selecione o Algoritmo:",
-            ["Regressão Linear", "Árvore de Decisão", "Random Forest"]
-        )
-        
-        # Obtém os parâmetros do modelo selecionado
-        params = MLModel.get_model_params(algorithm_name)
-        
-        # Cria o modelo com os parâmetros selecionados
-        if algorithm_name == "Regressão Linear":
-            model = LinearRegression(**params)
-        elif algorithm_name == "Árvore de Decisão":
-            model = DecisionTreeRegressor(**params)
-        elif algorithm_name == "Random Forest":
-            model = RandomForestRegressor(**params)
-            
-        # Exibe informações sobre o modelo
-        st.markdown("""
-        <style>
-        .model-info {
-            background-color: #f0f2f6;
-            padding: 15px;
-            border-radius: 5px;
-            margin: 10px 0;
-        }
-        .model-title {
-            color: #1E395B;
-            font-weight: bold;
-            font-size: 1.2em;
-        }
-        .param-name {
-            color: #1E395B;
-            font-weight: bold;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        st.markdown(f"""
-        <div class="model-info">
-            <div class="model-title">Informações do Modelo: {algorithm_name}</div>
-            <p>Parâmetros configurados:</p>
-            {''.join(f'<p><span class="param-name">{k}:</span> {v}</p>' for k, v in params.items())}
-        </div>
-        """, unsafe_allow_html=True)
-        
-        return {algorithm_name: model}
+        return AlgorithmRegistry.build(algorithm_name, params)
     
     @staticmethod
-    def train_and_evaluate(algorithm, X_train, X_test, y_train, y_test):
+    def train_and_evaluate(algorithm, X_train, X_test, y_train, y_test, progress=None, n_folds=None,
+                           register_as=None, encoder=None):
         """
         Treina um algoritmo com os dados de treino e avalia com os dados de teste.
         Args:
@@ -169,17 +58,469 @@ class MLModel:
             X_test: Features de teste
             y_train: Target de treino
             y_test: Target de teste
+            progress (callable): Função opcional chamada com a fração concluída;
+                pode lançar uma exceção para interromper o treinamento
+            n_folds (int): Se informado, avalia com validação cruzada K-fold (ver cross_validate())
+            register_as (str): Se informado (nome do dataset), registra o modelo treinado
+                para o serviço de predição (ver register_model()); também identifica o dataset
+                no histórico de execuções (models.run_history)
+            encoder (FeatureEncoder): Codificador das features (ver DataModel.get_encoder());
+                modelos lineares recebem as features categóricas em one-hot esparso, e algoritmos
+                com categorias nativas são configurados com as colunas categóricas
         Returns:
-            tuple: (Score R², nome do modelo, dicionário de parâmetros)
+            tuple: (Score R², nome do modelo, dicionário de parâmetros); com n_folds,
+                (R² médio, nome do modelo, dicionário de parâmetros, resultados por fold)
         """
-        # Treina o modelo com os dados de treino
-        algorithm.fit(X_train, y_train)
-        
-        # Obtém o score R² nos dados de teste
-        score = algorithm.score(X_test, y_test)
-        
+        if n_folds:
+            import pandas as pd  # Para juntar treino e teste
+            # A validação cruzada usa todos os registros, divididos em n_folds partes
+            X = pd.concat([X_train, X_test]) if isinstance(X_train, pd.DataFrame) else np.concatenate([X_train, X_test])
+            y = pd.concat([y_train, y_test]) if isinstance(y_train, pd.Series) else np.concatenate([y_train, y_test])
+            return MLModel.cross_validate(algorithm, X, y, n_folds, progress, encoder)
+
+        # Monta a chave do cache a partir dos dados, da codificação, da classe e dos hiperparâmetros
+        data_fingerprint, cache_key, one_hot = MLModel._make_cache_key(
+            algorithm, X_train, X_test, y_train, y_test, encoder
+        )
+
         # Obtém o nome do modelo e seus parâmetros
         model_name = algorithm.__class__.__name__
         model_params = algorithm.get_params()
+
+        # Se a mesma configuração já foi treinada (nesta ou em outra sessão), reutiliza o resultado
+        with Tracing.span("cache_lookup"):
+            cached = MODEL_CACHE.get(cache_key)
+        if cached is not None:
+            if register_as is not None:
+                MLModel.register_model(
+                    cache_key, cached["estimator"], X_train, y_train, register_as, cached["score"], encoder
+                )
+            return cached["score"], model_name, model_params
+
+        # Execução idêntica já gravada no histórico (ex.: antes de o processo ser reiniciado):
+        # retorna o resultado gravado quando não é preciso registrar o estimador para predição
+        # ou quando o modelo já está registrado
+        with Tracing.span("history_lookup"):
+            stored = RUN_HISTORY.get(cache_key)
+        if stored is not None and (register_as is None or MLModel._is_registered(cache_key)):
+            return stored["score"], model_name, model_params
+
+        # As categorias viram colunas one-hot (matriz esparsa) apenas para os modelos lineares
+        X_fit, X_score = X_train, X_test
+        if one_hot:
+            with Tracing.span("encode"):
+                X_fit, X_score = encoder.one_hot(X_train), encoder.one_hot(X_test)
+
+        # Ensembles que diferem apenas no número de árvores formam um grupo no cache
+        growth_group = None
+        if "n_estimators" in model_params and "warm_start" in model_params:
+            growth_group = ModelCache.make_key(data_fingerprint, algorithm, ignore=("n_estimators",))
+            algorithm = MLModel._grow_from_cache(algorithm, growth_group)
+
+        # Treina o modelo com os dados de treino
+        with Tracing.span("fit"):
+            start = time.perf_counter()
+            MLModel._fit(algorithm, X_fit, y_train, progress, grow=growth_group is not None)
+            fit_seconds = time.perf_counter() - start
+        
+        # Obtém o score R² nos dados de teste
+        with Tracing.span("score"):
+            start = time.perf_counter()
+            score = algorithm.score(X_score, y_test)
+            score_seconds = time.perf_counter() - start
+
+        # Guarda o estimador treinado e o score no cache
+        with Tracing.span("cache_store"):
+            MODEL_CACHE.put(cache_key, {"estimator": algorithm, "score": score}, group=growth_group)
+
+        # Grava a execução no histórico (ranking e melhor configuração por dataset)
+        with Tracing.span("history_record"):
+            RUN_HISTORY.record(
+                cache_key, algorithm, register_as, AlgorithmRegistry.get_name(algorithm) or model_name,
+                data_fingerprint, score, fit_seconds, score_seconds, len(X_train), len(X_test)
+            )
+
+        if register_as is not None:
+            MLModel.register_model(cache_key, algorithm, X_train, y_train, register_as, score, encoder)
         
         return score, model_name, model_params
+
+    @staticmethod
+    def feature_importance(algorithm, X_train, X_test, y_train, y_test, progress=None, encoder=None,
+                           n_repeats=PERMUTATION_REPEATS):
+        """
+        Calcula a importância das features do modelo treinado com a configuração do algoritmo
+        (ver models.feature_importance). O resultado fica no armazenamento compartilhado, identificado
+        pela chave do modelo no cache: abrir a análise de novo, em qualquer sessão, não recalcula nada.
+        O modelo treinado vem do cache de modelos ou do registro; se não estiver em nenhum dos dois,
+        é treinado antes da análise.
+        Args:
+            algorithm: Instância do algoritmo de ML (configuração do modelo analisado)
+            X_train: Features de treino
+            X_test: Features de teste
+            y_train: Target de treino
+            y_test: Target de teste
+            progress (callable): Função opcional chamada com a fração concluída;
+                pode lançar uma exceção para interromper a análise
+            encoder (FeatureEncoder): Codificador das features
+            n_repeats (int): Número de repetições da importância por permutação
+        Returns:
+            tuple: (Score R², nome do modelo, dicionário de parâmetros, importâncias), com as importâncias
+                como em FeatureImportance.compute()
+        """
+        report = progress or (lambda fraction: None)
+        _, cache_key, one_hot = MLModel._make_cache_key(
+            algorithm, X_train, X_test, y_train, y_test, encoder
+        )
+
+        def analyze():
+            with Tracing.span("cache_lookup"):
+                estimator, score = MLModel._get_fitted(cache_key)
+            if estimator is None:
+                # Modelo ainda não treinado (ou removido do cache): treina uma cópia e a guarda no cache
+                from sklearn.base import clone  # Para não alterar o estimador da interface
+                X_fit, X_score = (encoder.one_hot(X_train), encoder.one_hot(X_test)) if one_hot else (X_train, X_test)
+                estimator = clone(algorithm)
+                with Tracing.span("fit"):
+                    MLModel._fit(estimator, X_fit, y_train, lambda fraction: report(fraction / 2))
+                with Tracing.span("score"):
+                    score = estimator.score(X_score, y_test)
+                with Tracing.span("cache_store"):
+                    MODEL_CACHE.put(cache_key, {"estimator": estimator, "score": score})
+                fit_share = 0.5
+            else:
+                fit_share = 0.0
+            importances = FeatureImportance.compute(
+                estimator, X_test, y_test, encoder, one_hot, n_repeats,
+                lambda fraction: report(fit_share + (1 - fit_share) * fraction)
+            )
+            return dict(importances, score=score)
+
+        importances = SHARED_STORE.get_or_create(IMPORTANCE_NAMESPACE, f"{cache_key}:{n_repeats}", analyze)
+        return importances["score"], algorithm.__class__.__name__, algorithm.get_params(), importances
+
+    @staticmethod
+    def train_progressive(algorithm, X_train, X_test, y_train, y_test, progress=None, register_as=None,
+                          encoder=None, fractions=PROGRESSIVE_FRACTIONS):
+        """
+        Treina em subamostras crescentes dos dados de treino (ex.: 1%, 5%, 25% e 100%), avaliando
+        cada etapa no conjunto de teste completo, para mostrar a curva de aprendizado antes do fim.
+        Como a divisão treino/teste já embaralha os registros, cada subamostra é o início dos dados
+        de treino (uma fatia, sem cópia), e as subamostras são aninhadas.
+        A cada etapa, o resultado até o momento (com a curva) é enviado como resultado parcial para a
+        função de progresso.
+        Se o usuário encerrar o treinamento (TrainingStopped), o resultado é o da última etapa concluída;
+        a etapa completa usa train_and_evaluate() (cache de modelos e registro para predição).
+        Args:
+            algorithm: Instância do algoritmo de ML a ser treinado
+            X_train: Features de treino
+            X_test: Features de teste
+            y_train: Target de treino
+            y_test: Target de teste
+            progress (callable): Função opcional chamada com a fração concluída e a curva parcial
+            register_as (str): Se informado, registra o modelo da etapa completa (ver train_and_evaluate())
+            encoder (FeatureEncoder): Codificador das features
+            fractions (tuple): Frações dos dados de treino de cada etapa
+        Returns:
+            tuple: (R² da última etapa, nome do modelo, dicionário de parâmetros, curva de aprendizado)
+        """
+        import pandas as pd                 # Para a tabela da curva de aprendizado
+        from sklearn.base import clone      # Para um estimador novo a cada etapa
+
+        report = progress or (lambda fraction, partial_result=None: None)
+        n_rows = len(X_train)
+        sizes = MLModel.get_progressive_sizes(n_rows, fractions)
+        total_rows = sum(sizes)
+        one_hot = encoder is not None and encoder.uses_one_hot(algorithm)
+        if encoder is not None:
+            encoder.configure(algorithm)
+        curve = []
+        done_rows = 0
+
+        def head(data, size):
+            return data.iloc[:size] if hasattr(data, "iloc") else data[:size]
+
+        def result():
+            # Resultado até a última etapa concluída (também enviado como resultado parcial)
+            frame = pd.DataFrame(curve, columns=["Registros", "Fração dos Dados", "R²", "Tempo de Treino (s)"])
+            return curve[-1][2], algorithm.__class__.__name__, algorithm.get_params(), frame
+
+        report(0.0)
+        try:
+            X_score = None
+            for size in sizes:
+                # Progresso proporcional aos registros treinados em todas as etapas
+                def step_progress(fraction, partial_result=None, size=size):
+                    report((done_rows + fraction * size) / total_rows)
+
+                start = time.perf_counter()
+                if size == n_rows:
+                    score = MLModel.train_and_evaluate(
+                        algorithm, X_train, X_test, y_train, y_test, progress=step_progress,
+                        register_as=register_as, encoder=encoder
+                    )[0]
+                else:
+                    with Tracing.span("fit_subsample"):
+                        X_fit = head(X_train, size)
+                        if one_hot:
+                            X_fit = encoder.one_hot(X_fit)
+                            X_score = X_score if X_score is not None else encoder.one_hot(X_test)
+                        model = clone(algorithm)
+                        MLModel._fit(model, X_fit, head(y_train, size), step_progress)
+                        score = model.score(X_score if one_hot else X_test, y_test)
+                curve.append((size, size / n_rows, score, time.perf_counter() - start))
+                done_rows += size
+                report(done_rows / total_rows, result())
+        except TrainingStopped:
+            # Encerrado pelo usuário: usa a última etapa concluída (sem etapas, o job é cancelado)
+            if not curve:
+                raise
+
+        return result()
+
+    @staticmethod
+    def get_progressive_sizes(n_rows, fractions=PROGRESSIVE_FRACTIONS):
+        """
+        Calcula o número de registros de cada etapa do treinamento progressivo.
+        Args:
+            n_rows (int): Registros de treino
+            fractions (tuple): Frações dos dados de treino de cada etapa
+        Returns:
+            list: Registros de cada etapa, crescentes, terminando em n_rows
+        """
+        sizes = {int(round(fraction * n_rows)) for fraction in fractions if fraction < 1}
+        return sorted(size for size in sizes if PROGRESSIVE_MIN_ROWS <= size < n_rows) + [n_rows]
+
+    @staticmethod
+    def register_model(model_id, estimator, X_train, y_train, dataset_name, score, encoder=None):
+        """
+        Registra um modelo treinado para o serviço de predição (models.prediction_service).
+        Args:
+            model_id (str): Identificador do modelo (a chave do cache, que identifica dados e hiperparâmetros)
+            estimator: Estimador treinado
+            X_train: Features de treino (define as colunas de entrada e sua ordem)
+            y_train: Target de treino (define o nome da coluna prevista)
+            dataset_name (str): Dataset usado no treinamento
+            score (float): R² no conjunto de teste
+            encoder (FeatureEncoder): Codificador das features, usado para converter os registros de predição
+        Returns:
+            RegisteredModel: Modelo registrado
+        """
+        features = list(getattr(X_train, "columns", [f"x{i}" for i in range(np.shape(X_train)[1])]))
+        target = getattr(y_train, "name", None) or "y"
+        with Tracing.span("register_model"):
+            return MODEL_REGISTRY.register(model_id, estimator, features, target, dataset_name, score, encoder)
+
+    @staticmethod
+    def _make_cache_key(algorithm, X_train, X_test, y_train, y_test, encoder=None):
+        """
+        Monta a chave do cache a partir dos dados, da codificação, da classe e dos hiperparâmetros.
+        Algoritmos com categorias nativas são configurados antes, pois as colunas categóricas
+        são um hiperparâmetro.
+        Args:
+            algorithm: Instância do algoritmo de ML (alterada no próprio objeto)
+            X_train: Features de treino
+            X_test: Features de teste
+            y_train: Target de treino
+            y_test: Target de teste
+            encoder (FeatureEncoder): Codificador das features
+        Returns:
+            tuple: (Impressão digital dos dados, chave do cache, se o modelo usa one-hot)
+        """
+        one_hot = encoder is not None and encoder.uses_one_hot(algorithm)
+        if encoder is not None:
+            encoder.configure(algorithm)
+        with Tracing.span("fingerprint"):
+            data_fingerprint = ModelCache.fingerprint(X_train, X_test, y_train, y_test)
+            if one_hot:
+                data_fingerprint = f"{data_fingerprint}:{ONE_HOT_ENCODING}"
+            cache_key = ModelCache.make_key(data_fingerprint, algorithm)
+        return data_fingerprint, cache_key, one_hot
+
+    @staticmethod
+    def _get_fitted(model_id):
+        """
+        Obtém um modelo treinado do cache de modelos ou, se não estiver lá, do registro.
+        Args:
+            model_id (str): Chave do cache (também o identificador no registro)
+        Returns:
+            tuple: (Estimador treinado, R² no conjunto de teste), ou (None, None) se não existir
+        """
+        cached = MODEL_CACHE.get(model_id)
+        if cached is not None:
+            return cached["estimator"], cached["score"]
+        try:
+            registered = MODEL_REGISTRY.get(model_id)
+        except KeyError:
+            return None, None
+        return registered.estimator, registered.score
+
+    @staticmethod
+    def _is_registered(model_id):
+        """
+        Verifica se um modelo está registrado para o serviço de predição (memória ou disco).
+        Args:
+            model_id (str): Identificador do modelo
+        Returns:
+            bool: True se o modelo estiver registrado
+        """
+        try:
+            MODEL_REGISTRY.get(model_id)
+        except KeyError:
+            return False
+        return True
+
+    @staticmethod
+    def cross_validate(algorithm, X, y, n_folds=5, progress=None, encoder=None):
+        """
+        Avalia o algoritmo com validação cruzada K-fold, com os folds em processos paralelos.
+        A matriz de features é gravada uma única vez em um arquivo mapeado em memória e
+        compartilhada somente leitura entre os processos, em vez de ser serializada por fold,
+        então a memória não cresce com K nem com o número de núcleos.
+        Args:
+            algorithm: Instância do algoritmo de ML a ser avaliado
+            X: Features de todos os registros
+            y: Target de todos os registros
+            n_folds (int): Número de folds
+            progress (callable): Função opcional chamada com a fração concluída
+            encoder (FeatureEncoder): Codificador das features; com modelos lineares, cada fold
+                converte as suas linhas em one-hot esparso
+        Returns:
+            tuple: (R² médio, nome do modelo, dicionário de parâmetros, resultados por fold)
+        """
+        import joblib                              # Para processos paralelos
+        import pandas as pd                        # Para montar os resultados por fold
+        from sklearn.base import clone             # Para criar o estimador base dos folds
+        from sklearn.model_selection import KFold  # Para dividir os dados em folds
+
+        report = progress or (lambda fraction: None)
+        report(0.0)
+
+        # Cada fold roda em um processo; o estimador usa um único núcleo para não disputar CPU
+        estimator = clone(algorithm)
+        if "n_jobs" in estimator.get_params():
+            estimator.set_params(n_jobs=1)
+
+        if encoder is not None:
+            encoder.configure(estimator)
+        fold_encoder = encoder if encoder is not None and encoder.uses_one_hot(estimator) else None
+        folds = list(KFold(n_splits=n_folds, shuffle=True, random_state=42).split(X))
+        # Grava as matrizes uma vez e as reabre mapeadas em memória (somente leitura)
+        with shared_arrays(X, y, prefix="cv-") as (X_shared, y_shared):
+            n_jobs = min(n_folds, os.cpu_count() or 1)
+            results = []
+            tasks = (
+                joblib.delayed(_fit_fold)(estimator, X_shared, y_shared, train_idx, test_idx, fold_encoder)
+                for train_idx, test_idx in folds
+            )
+            with Tracing.span("fit_folds"):
+                for result in joblib.Parallel(n_jobs=n_jobs, return_as="generator")(tasks):
+                    results.append(result)
+                    report(len(results) / n_folds)
+
+        fold_results = pd.DataFrame(results, columns=["R²", "Tempo de Treino (s)", "Tempo de Avaliação (s)"])
+        fold_results.insert(0, "Fold", range(1, n_folds + 1))
+        scores = fold_results["R²"]
+        return scores.mean(), algorithm.__class__.__name__, algorithm.get_params(), fold_results
+
+    @staticmethod
+    def _grow_from_cache(algorithm, growth_group):
+        """
+        Procura no cache o maior ensemble já treinado com os mesmos dados e hiperparâmetros,
+        exceto por ter menos árvores. Se existir, retorna uma cópia dele configurada para
+        o número de árvores desejado, de modo que apenas as árvores novas sejam treinadas.
+        Args:
+            algorithm: Ensemble com os hiperparâmetros desejados
+            growth_group (str): Grupo do cache (chave sem n_estimators)
+        Returns:
+            Ensemble a ser treinado (a cópia ampliável ou uma cópia não treinada do algoritmo)
+        """
+        from sklearn.base import clone  # Para descartar um ajuste anterior do algoritmo recebido
+
+        target = algorithm.get_params()["n_estimators"]
+        candidates = [
+            entry["estimator"] for entry in MODEL_CACHE.get_group(growth_group)
+            if len(entry["estimator"].estimators_) < target
+        ]
+        if not candidates:
+            # Apenas árvores vindas do cache são mantidas: um ajuste anterior (ex.: em outros dados) não
+            return clone(algorithm)
+
+        # Copia para não alterar a entrada do cache, que pode estar em uso por outra sessão
+        base = copy.deepcopy(max(candidates, key=lambda estimator: len(estimator.estimators_)))
+        base.set_params(**algorithm.get_params())
+        return base
+
+    @staticmethod
+    def _fit(algorithm, X_train, y_train, progress=None, grow=False):
+        """
+        Treina o algoritmo, reportando o progresso quando possível.
+        Ensembles com warm_start (ex.: Random Forest) são treinados em etapas,
+        adicionando árvores a cada etapa; o resultado final é o mesmo de um único fit.
+        Args:
+            algorithm: Instância do algoritmo de ML a ser treinado
+            X_train: Features de treino
+            y_train: Target de treino
+            progress (callable): Função opcional chamada com a fração concluída
+            grow (bool): Se True, mantém as árvores já treinadas e adiciona apenas as que faltam
+                (ensemble ampliado a partir do cache, ver _grow_from_cache()); caso contrário,
+                árvores de um ajuste anterior são descartadas
+        """
+        params = algorithm.get_params()
+        if "n_estimators" not in params or "warm_start" not in params:
+            if progress is not None:
+                progress(0.0)
+            algorithm.fit(X_train, y_train)
+            return
+
+        total = params["n_estimators"]
+        start = len(getattr(algorithm, "estimators_", [])) if grow else 0  # Árvores mantidas
+        remaining = total - start
+        if remaining <= 0:
+            # O ensemble ampliado já tem todas as árvores
+            if progress is not None:
+                progress(1.0)
+            return
+        if progress is None:
+            step = remaining
+        else:
+            step = max(1, -(-remaining // ENSEMBLE_FIT_STEPS))  # Divisão com arredondamento para cima
+            progress(0.0)
+        try:
+            for n_estimators in range(start + step, total + step, step):
+                n_estimators = min(n_estimators, total)
+                # Sem ampliação, a primeira etapa treina do zero (warm_start=False descarta as árvores)
+                algorithm.set_params(n_estimators=n_estimators, warm_start=grow or n_estimators > start + step)
+                algorithm.fit(X_train, y_train)
+                if progress is not None:
+                    progress((n_estimators - start) / remaining)
+        finally:
+            # Restaura os parâmetros configurados pelo usuário
+            algorithm.set_params(n_estimators=total, warm_start=params["warm_start"])
+
+
+def _fit_fold(estimator, X, y, train_idx, test_idx, encoder=None):
+    """
+    Treina e avalia um fold da validação cruzada (executado em um processo do pool).
+    X e y chegam como arrays mapeados em memória; apenas os índices do fold são enviados.
+    Args:
+        estimator: Estimador não treinado
+        X (numpy.ndarray): Features de todos os registros (somente leitura)
+        y (numpy.ndarray): Target de todos os registros (somente leitura)
+        train_idx (numpy.ndarray): Índices de treino do fold
+        test_idx (numpy.ndarray): Índices de teste do fold
+        encoder (FeatureEncoder): Se informado, as linhas do fold são convertidas em one-hot esparso
+    Returns:
+        tuple: (R², tempo de treino, tempo de avaliação)
+    """
+    from sklearn.base import clone  # Para criar um estimador novo por fold
+    encode = encoder.one_hot if encoder is not None else (lambda X_fold: X_fold)
+    model = clone(estimator)
+    start = time.perf_counter()
+    model.fit(encode(X[train_idx]), y[train_idx])
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score = model.score(encode(X[test_idx]), y[test_idx])
+    score_time = time.perf_counter() - start
+    return score, fit_time, score_time
@@ -0,0 +1,187 @@
+# Importando as bibliotecas necessárias
+import hashlib         # Para gerar as chaves do cache a partir do conteúdo
+import os              # Para manipular caminhos e variáveis de ambiente
+import pickle          # Para medir o tamanho e persistir os modelos treinados
+import threading       # Para proteger o cache compartilhado entre sessões
+from collections import OrderedDict  # Para manter a ordem de uso (LRU)
+import numpy as np     # Para operações numéricas
+
+# Hiperparâmetros que não alteram o modelo treinado e, portanto, não entram na chave
+NON_RESULT_PARAMS = ("n_jobs", "verbose", "warm_start")
+
+class ModelCache:
+    """
+    Cache de modelos treinados endereçado pelo conteúdo.
+    A chave combina a impressão digital dos dados de treino/teste com a classe
+    do estimador e seus hiperparâmetros. As entradas são removidas por ordem de uso (LRU)
+    quando o tamanho total em memória ultrapassa o limite, e podem ser persistidas em disco.
+    """
+
+    def __init__(self, max_bytes, persist_dir=None):
+        """
+        Inicializa o cache.
+        Args:
+            max_bytes (int): Tamanho máximo, em bytes, das entradas mantidas em memória
+            persist_dir (str): Diretório para persistir as entradas em disco (opcional)
+        """
+        self.max_bytes = max_bytes        # Limite de memória do cache
+        self.persist_dir = persist_dir    # Diretório de persistência (None desativa)
+        self.total_bytes = 0              # Tamanho atual das entradas em memória
+        self._entries = OrderedDict()     # chave -> (valor, tamanho em bytes)
+        self._groups = {}                 # grupo -> conjunto de chaves (ver put())
+        self._lock = threading.Lock()     # Sessões do Streamlit rodam em threads diferentes
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(*arrays):
+        """
+        Calcula a impressão digital de um conjunto de dados.
+        Args:
+            *arrays: DataFrames, Series ou arrays NumPy (por exemplo, a divisão treino/teste)
+        Returns:
+            str: Hash hexadecimal do conteúdo
+        """
+        import pandas as pd  # Para gerar o hash de DataFrames e Series (carregado só quando usado)
+        digest = hashlib.blake2b(digest_size=16)
+        for data in arrays:
+            if isinstance(data, (pd.DataFrame, pd.Series)):
+                # Inclui nomes e tipos das colunas, além dos valores e do índice
+                if isinstance(data, pd.DataFrame):
+                    digest.update(repr((list(data.columns), [str(t) for t in data.dtypes])).encode())
+                else:
+                    digest.update(repr((data.name, str(data.dtype))).encode())
+                digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+            else:
+                array = np.ascontiguousarray(data)
+                digest.update(repr((array.shape, str(array.dtype))).encode())
+                digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(data_fingerprint, estimator, ignore=()):
+        """
+        Monta a chave do cache para um estimador e um conjunto de dados.
+        Args:
+            data_fingerprint (str): Impressão digital dos dados (ver fingerprint())
+            estimator: Estimador do scikit-learn (ainda não treinado)
+            ignore (tuple): Hiperparâmetros adicionais a desconsiderar na chave
+                (ex.: n_estimators, para agrupar florestas que diferem apenas no número de árvores)
+        Returns:
+            str: Chave do cache
+        """
+        estimator_class = f"{type(estimator).__module__}.{type(estimator).__qualname__}"
+        params = sorted(
+            (name, value) for name, value in estimator.get_params().items()
+            if name not in NON_RESULT_PARAMS and name not in ignore
+        )
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(data_fingerprint.encode())
+        digest.update(estimator_class.encode())
+        digest.update(repr(params).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Obtém uma entrada do cache (memória e, se necessário, disco).
+        Args:
+            key (str): Chave do cache
+        Returns:
+            Valor armazenado, ou None se não existir
+        """
+        with self._lock:
+            if key in self._entries:
+                # Marca a entrada como usada mais recentemente
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+
+        path = self._path(key)
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                payload = f.read()
+            value = pickle.loads(payload)
+            self._store(key, value, len(payload))
+            return value
+        return None
+
+    def put(self, key, value, group=None):
+        """
+        Adiciona uma entrada ao cache, removendo as menos usadas se o limite for ultrapassado.
+        Args:
+            key (str): Chave do cache
+            value: Valor a armazenar (estimador treinado e scores)
+            group (str): Grupo opcional da entrada, para busca com get_group()
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        path = self._path(key)
+        if path and not os.path.exists(path):
+            # Grava em arquivo temporário e renomeia para evitar leituras de arquivos incompletos
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        if group is not None:
+            with self._lock:
+                self._groups.setdefault(group, set()).add(key)
+        self._store(key, value, len(payload))
+
+    def get_group(self, group):
+        """
+        Retorna as entradas de um grupo que ainda estão disponíveis no cache.
+        Args:
+            group (str): Grupo informado em put()
+        Returns:
+            list: Valores armazenados do grupo
+        """
+        with self._lock:
+            keys = list(self._groups.get(group, ()))
+        values = []
+        for key in keys:
+            value = self.get(key)
+            if value is None:
+                # A entrada foi removida pela política LRU
+                with self._lock:
+                    self._groups[group].discard(key)
+            else:
+                values.append(value)
+        return values
+
+    def clear(self):
+        """
+        Remove todas as entradas mantidas em memória (os arquivos em disco são preservados).
+        """
+        with self._lock:
+            self._entries.clear()
+            self._groups.clear()
+            self.total_bytes = 0
+
+    def _store(self, key, value, size):
+        """
+        Guarda a entrada em memória e aplica a política LRU.
+        Entradas maiores que o limite total não são mantidas em memória.
+        """
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+    def _path(self, key):
+        """
+        Retorna o caminho do arquivo da entrada em disco, ou None se a persistência estiver desativada.
+        """
+        if not self.persist_dir:
+            return None
+        return os.path.join(self.persist_dir, f"{key}.pkl")
+
+# Cache do processo, compartilhado entre reruns e sessões do Streamlit.
+# MODEL_CACHE_MAX_MB define o limite em memória e MODEL_CACHE_DIR ativa a persistência em disco.
+MODEL_CACHE = ModelCache(
+    max_bytes=int(os.environ.get("MODEL_CACHE_MAX_MB", "256")) * 1024 * 1024,
+    persist_dir=os.environ.get("MODEL_CACHE_DIR") or None
+)
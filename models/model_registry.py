@@ -0,0 +1,298 @@
+# Importando as bibliotecas necessárias
+import json            # Para salvar os metadados de cada modelo
+import os              # Para manipular caminhos e variáveis de ambiente
+import pickle          # Para persistir os estimadores treinados
+import shutil          # Para remover o formato compacto dos modelos descartados
+import threading       # Para proteger o registro compartilhado entre sessões
+import time            # Para registrar o momento do registro
+from collections import OrderedDict  # Para manter a ordem de uso (LRU)
+from models.compact_trees import CompactTrees  # Formato compacto de inferência para árvores
+from models.feature_encoder import FeatureEncoder  # Codificação das features categóricas
+
+# Diretório padrão dos modelos registrados (pode ser alterado pela variável de ambiente)
+DEFAULT_REGISTRY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "registry")
+# Lotes até este número de registros usam o formato compacto; lotes maiores usam o estimador original,
+# cujo percurso compilado por árvore é mais rápido quando há muitos registros
+COMPACT_MAX_BATCH_ROWS = int(os.environ.get("COMPACT_MAX_BATCH_ROWS", "256"))
+# Número máximo de modelos mantidos em memória e em disco; os usados há mais tempo são removidos
+MODEL_REGISTRY_MAX_MODELS = int(os.environ.get("MODEL_REGISTRY_MAX_MODELS", "50"))
+
+class RegisteredModel:
+    """
+    Modelo treinado disponível para predição, com as informações necessárias para
+    montar a matriz de entrada (features na ordem do treinamento, com os códigos das categorias).
+    Árvores e florestas também têm a versão compacta (models.compact_trees); nesse caso,
+    o estimador original só é carregado do disco se chegar um lote grande.
+    """
+
+    def __init__(self, model_id, features, target, algorithm, dataset="", score=None, created_at=None,
+                 estimator=None, estimator_path=None, compact=None, categories=None, one_hot=False):
+        """
+        Inicializa o modelo registrado.
+        Args:
+            model_id (str): Identificador do modelo
+            features (list): Colunas de entrada, na ordem usada no treinamento
+            target (str): Coluna prevista
+            algorithm (str): Classe do estimador
+            dataset (str): Dataset usado no treinamento
+            score (float): R² no conjunto de teste
+            created_at (float): Momento do registro
+            estimator: Estimador do scikit-learn já treinado (ou None, para carregar de estimator_path)
+            estimator_path (str): Arquivo .pkl do estimador
+            compact (CompactTrees): Versão compacta do estimador, se suportada
+            categories (dict): Categorias das features categóricas (ver FeatureEncoder)
+            one_hot (bool): Se o estimador foi treinado com as categorias em one-hot
+        """
+        self.id = model_id
+        self.features = list(features)
+        self.target = target
+        self.algorithm = algorithm
+        self.dataset = dataset
+        self.score = score
+        self.created_at = created_at or time.time()
+        self.compact = compact
+        self.encoder = FeatureEncoder(self.features, categories or {})
+        self.one_hot = one_hot
+        self._estimator = estimator
+        self._estimator_path = estimator_path
+        self._lock = threading.Lock()
+
+    @property
+    def estimator(self):
+        """
+        Estimador original, carregado do disco no primeiro acesso.
+        """
+        with self._lock:
+            if self._estimator is None:
+                with open(self._estimator_path, "rb") as f:
+                    self._estimator = pickle.load(f)
+            return self._estimator
+
+    @property
+    def metadata(self):
+        """
+        Informações do modelo, sem o estimador (usadas em listagens e no arquivo .json).
+        """
+        return {
+            "id": self.id,
+            "algorithm": self.algorithm,
+            "features": self.features,
+            "target": self.target,
+            "dataset": self.dataset,
+            "score": self.score,
+            "created_at": self.created_at,
+            "compact": self.compact is not None,
+            "categories": self.encoder.categories,
+            "one_hot": self.one_hot
+        }
+
+    def predict(self, X):
+        """
+        Prediz uma matriz de registros.
+        Args:
+            X (numpy.ndarray): Matriz com as features na ordem de self.features (ver FeatureEncoder.encode())
+        Returns:
+            numpy.ndarray: Predições
+        """
+        if self.one_hot:
+            return self.estimator.predict(self.encoder.one_hot(X))
+        estimator_available = self._estimator is not None or self._estimator_path is not None
+        if self.compact is not None and (len(X) <= COMPACT_MAX_BATCH_ROWS or not estimator_available):
+            return self.compact.predict(X)
+        estimator = self.estimator
+        if hasattr(estimator, "feature_names_in_"):
+            # O estimador foi treinado com DataFrame: um único DataFrame por lote evita o aviso de nomes
+            import pandas as pd
+            X = pd.DataFrame(X, columns=self.features, copy=False)
+        return estimator.predict(X)
+
+class ModelRegistry:
+    """
+    Registro dos modelos treinados pelo fluxo da aplicação, consumido pelo serviço de predição.
+    Os modelos ficam em memória e em disco (um .pkl com o estimador, um .json com os metadados e,
+    para árvores, um diretório .trees com o formato compacto), de modo que o serviço HTTP,
+    rodando em outro processo, enxerga os modelos registrados na interface.
+    O registro guarda no máximo max_models modelos: em memória, os usados há mais tempo são
+    descartados (e relidos do disco se pedidos de novo); em disco, os registrados há mais tempo
+    são removidos.
+    """
+
+    def __init__(self, registry_dir=None, max_models=MODEL_REGISTRY_MAX_MODELS):
+        """
+        Inicializa o registro.
+        Args:
+            registry_dir (str): Diretório dos modelos; None mantém os modelos apenas em memória
+            max_models (int): Número máximo de modelos em memória e em disco
+        """
+        self.registry_dir = registry_dir
+        self.max_models = max_models
+        self._models = OrderedDict()      # id -> RegisteredModel, do usado há mais tempo ao mais recente
+        self._lock = threading.Lock()
+
+    def register(self, model_id, estimator, features, target, dataset="", score=None, encoder=None):
+        """
+        Registra um modelo treinado. O id identifica os dados e os hiperparâmetros, então registrar
+        novamente um id existente apenas o marca como recente, sem gravar os arquivos de novo.
+        Args:
+            model_id (str): Identificador do modelo (ex.: a chave do cache de modelos)
+            estimator: Estimador do scikit-learn já treinado
+            features (list): Colunas de entrada, na ordem usada no treinamento
+            target (str): Coluna prevista
+            dataset (str): Dataset usado no treinamento
+            score (float): R² no conjunto de teste
+            encoder (FeatureEncoder): Codificador das features (None se todas forem numéricas)
+        Returns:
+            RegisteredModel: Modelo registrado
+        """
+        try:
+            model = self.get(model_id)
+        except KeyError:
+            model = None
+        if model is not None:
+            self._touch(model_id)
+            return model
+
+        compact = CompactTrees.from_estimator(estimator) if CompactTrees.supports(estimator) else None
+        model = RegisteredModel(
+            model_id, features, target, estimator.__class__.__name__, dataset, score,
+            estimator=estimator, compact=compact,
+            categories=encoder.categories if encoder is not None else None,
+            one_hot=encoder is not None and encoder.uses_one_hot(estimator)
+        )
+        if self.registry_dir:
+            try:
+                os.makedirs(self.registry_dir, exist_ok=True)
+                # Os metadados são gravados por último: quem lista os modelos sempre encontra os demais arquivos
+                self._write(f"{model_id}.pkl", pickle.dumps(estimator, protocol=pickle.HIGHEST_PROTOCOL))
+                if compact is not None:
+                    compact.save(os.path.join(self.registry_dir, f"{model_id}.trees"))
+                self._write(f"{model_id}.json", json.dumps(model.metadata, ensure_ascii=False).encode("utf-8"))
+                model._estimator_path = os.path.join(self.registry_dir, f"{model_id}.pkl")
+            except OSError:
+                # Diretório sem permissão de escrita: o modelo fica disponível apenas neste processo
+                pass
+        with self._lock:
+            self._models[model_id] = model
+        self._evict()
+        return model
+
+    def get(self, model_id):
+        """
+        Obtém um modelo registrado (memória e, se necessário, disco).
+        Do disco, árvores são lidas no formato compacto, mapeado em memória, sem carregar o estimador.
+        Args:
+            model_id (str): Identificador do modelo
+        Returns:
+            RegisteredModel: Modelo registrado
+        Raises:
+            KeyError: Se o modelo não existir
+        """
+        with self._lock:
+            if model_id in self._models:
+                # Marca o modelo como usado mais recentemente
+                self._models.move_to_end(model_id)
+                return self._models[model_id]
+
+        meta_path = os.path.join(self.registry_dir, f"{model_id}.json") if self.registry_dir else None
+        if meta_path is None or os.path.basename(model_id) != model_id or not os.path.exists(meta_path):
+            raise KeyError(f"Modelo não registrado: {model_id}")
+        with open(meta_path, encoding="utf-8") as f:
+            metadata = json.load(f)
+        model = RegisteredModel(
+            model_id, metadata["features"], metadata["target"], metadata["algorithm"],
+            metadata["dataset"], metadata["score"], metadata["created_at"],
+            estimator_path=os.path.join(self.registry_dir, f"{model_id}.pkl"),
+            compact=CompactTrees.load(os.path.join(self.registry_dir, f"{model_id}.trees")),
+            categories=metadata.get("categories"), one_hot=metadata.get("one_hot", False)
+        )
+        with self._lock:
+            model = self._models.setdefault(model_id, model)
+        self._evict()
+        return model
+
+    def remove(self, model_id):
+        """
+        Remove um modelo da memória e do disco (metadados primeiro, para que não seja mais listado).
+        Args:
+            model_id (str): Identificador do modelo
+        """
+        with self._lock:
+            self._models.pop(model_id, None)
+        if not self.registry_dir or os.path.basename(model_id) != model_id:
+            return
+        for name in (f"{model_id}.json", f"{model_id}.pkl"):
+            try:
+                os.remove(os.path.join(self.registry_dir, name))
+            except OSError:
+                pass  # Já removido (ex.: por outro processo)
+        shutil.rmtree(os.path.join(self.registry_dir, f"{model_id}.trees"), ignore_errors=True)
+
+    def list_models(self):
+        """
+        Lista os modelos registrados, do mais recente para o mais antigo.
+        Returns:
+            list: Metadados de cada modelo
+        """
+        with self._lock:
+            models = {model_id: model.metadata for model_id, model in self._models.items()}
+        if self.registry_dir and os.path.isdir(self.registry_dir):
+            for name in os.listdir(self.registry_dir):
+                model_id, extension = os.path.splitext(name)
+                if extension == ".json" and model_id not in models:
+                    try:
+                        with open(os.path.join(self.registry_dir, name), encoding="utf-8") as f:
+                            models[model_id] = json.load(f)
+                    except (OSError, ValueError):
+                        continue  # Metadados sendo gravados por outro processo
+        return sorted(models.values(), key=lambda metadata: metadata["created_at"], reverse=True)
+
+    def _touch(self, model_id):
+        """
+        Marca um modelo como recente, em memória e em disco (data de modificação dos metadados).
+        """
+        with self._lock:
+            if model_id in self._models:
+                self._models.move_to_end(model_id)
+        if self.registry_dir:
+            try:
+                os.utime(os.path.join(self.registry_dir, f"{model_id}.json"))
+            except OSError:
+                pass
+
+    def _evict(self):
+        """
+        Aplica o limite de modelos: descarta da memória os usados há mais tempo e remove do disco
+        os modelos cujos metadados foram gravados (ou marcados como recentes) há mais tempo.
+        """
+        with self._lock:
+            while len(self._models) > self.max_models:
+                self._models.popitem(last=False)
+        if not self.registry_dir:
+            return
+        try:
+            names = [name for name in os.listdir(self.registry_dir) if name.endswith(".json")]
+        except OSError:
+            return
+        if len(names) <= self.max_models:
+            return
+        models = []
+        for name in names:
+            try:
+                models.append((os.path.getmtime(os.path.join(self.registry_dir, name)), name[:-len(".json")]))
+            except OSError:
+                continue  # Removido por outro processo
+        for _, model_id in sorted(models)[:len(models) - self.max_models]:
+            self.remove(model_id)
+
+    def _write(self, name, payload):
+        """
+        Grava um arquivo do registro de forma atômica (arquivo temporário + renomeação).
+        """
+        path = os.path.join(self.registry_dir, name)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+# Registro do processo, compartilhado entre sessões; MODEL_REGISTRY_DIR define o diretório em disco
+MODEL_REGISTRY = ModelRegistry(os.environ.get("MODEL_REGISTRY_DIR", DEFAULT_REGISTRY_DIR))
@@ -0,0 +1,331 @@
+# Importando as bibliotecas necessárias
+import argparse        # Para ler as opções do servidor HTTP
+import io              # Para ler corpos CSV enviados ao servidor
+import json            # Para o protocolo do servidor HTTP
+import os              # Para ler a configuração pelas variáveis de ambiente
+import queue           # Fila de requisições de cada modelo
+import threading       # Para as threads de micro-batching e as estatísticas
+import time            # Para medir a vazão
+from collections import deque  # Blocos do arquivo em predição
+from concurrent.futures import Future  # Resultado de cada requisição
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # Servidor HTTP local
+import numpy as np     # Para montar as matrizes de entrada
+from models.model_registry import MODEL_REGISTRY  # Modelos registrados pelo fluxo de treinamento
+
+# Número máximo de registros agrupados em uma única chamada a predict()
+MAX_BATCH_ROWS = int(os.environ.get("PREDICTION_MAX_BATCH_ROWS", "8192"))
+# Tempo máximo (em milissegundos) que uma requisição espera por outras para formar um lote
+BATCH_WAIT_MS = float(os.environ.get("PREDICTION_BATCH_WAIT_MS", "2"))
+# Tempo (em segundos) sem requisições após o qual a fila e a thread de um modelo são encerradas
+# (recriadas na próxima requisição): modelos removidos do registro não mantêm threads ativas
+IDLE_SECONDS = float(os.environ.get("PREDICTION_IDLE_SECONDS", "60"))
+# Registros por bloco na predição de arquivos
+PREDICTION_CHUNK_ROWS = 100_000
+# Blocos de um arquivo enviados ao modelo sem aguardar o resultado (o restante ainda não foi lido)
+PREDICTION_MAX_PENDING_CHUNKS = int(os.environ.get("PREDICTION_MAX_PENDING_CHUNKS", "2"))
+
+class PredictionService:
+    """
+    Serviço de predição com micro-batching.
+    Cada modelo tem uma fila e uma thread que junta as requisições pequenas que chegam
+    ao mesmo tempo (até MAX_BATCH_ROWS registros ou BATCH_WAIT_MS de espera) em uma única
+    matriz, chama predict() uma vez e devolve a fatia de cada requisição. A fila e a thread
+    de um modelo sem requisições por IDLE_SECONDS são encerradas.
+    """
+
+    def __init__(self, registry, max_batch_rows=MAX_BATCH_ROWS, batch_wait_ms=BATCH_WAIT_MS,
+                 idle_seconds=IDLE_SECONDS):
+        """
+        Inicializa o serviço.
+        Args:
+            registry (ModelRegistry): Registro de onde os modelos são carregados
+            max_batch_rows (int): Número máximo de registros por lote
+            batch_wait_ms (float): Espera máxima para formar um lote, em milissegundos
+            idle_seconds (float): Tempo sem requisições após o qual a thread de um modelo é encerrada
+        """
+        self.registry = registry
+        self.max_batch_rows = max_batch_rows
+        self.batch_wait = batch_wait_ms / 1000
+        self.idle_seconds = idle_seconds
+        self._queues = {}                 # id do modelo -> fila de (matriz, Future)
+        self._stats = {}                  # id do modelo -> contadores
+        self._lock = threading.Lock()
+
+    def submit(self, model_id, rows):
+        """
+        Envia registros para predição sem bloquear.
+        Args:
+            model_id (str): Identificador do modelo registrado
+            rows: Registros (DataFrame, lista de dicionários, lista de listas ou array NumPy)
+        Returns:
+            concurrent.futures.Future: Resultado com o array de predições
+        Raises:
+            KeyError: Se o modelo não existir
+            ValueError: Se faltarem features nos registros
+        """
+        model = self.registry.get(model_id)
+        X = PredictionService.to_matrix(rows, model.features, model.encoder)
+        future = Future()
+        if len(X) == 0:
+            future.set_result(np.empty(0))
+            return future
+        self._enqueue(model_id, (X, future))
+        return future
+
+    def predict(self, model_id, rows, timeout=None):
+        """
+        Prediz registros, aguardando o resultado.
+        Args:
+            model_id (str): Identificador do modelo registrado
+            rows: Registros (ver submit())
+            timeout (float): Tempo máximo de espera, em segundos
+        Returns:
+            numpy.ndarray: Predições, na ordem dos registros
+        """
+        return self.submit(model_id, rows).result(timeout)
+
+    def predict_file(self, model_id, source, chunksize=PREDICTION_CHUNK_ROWS):
+        """
+        Prediz todos os registros de um arquivo CSV ou Parquet, lido em blocos.
+        No máximo PREDICTION_MAX_PENDING_CHUNKS blocos aguardam a predição ao mesmo tempo: o próximo
+        bloco só é lido depois que o mais antigo termina, então apenas as predições (uma por registro)
+        se acumulam na memória, e não o arquivo inteiro.
+        Args:
+            model_id (str): Identificador do modelo registrado
+            source: Caminho do arquivo ou arquivo enviado
+            chunksize (int): Registros por bloco
+        Returns:
+            numpy.ndarray: Predições, na ordem dos registros do arquivo
+        """
+        from models.streaming_model import StreamingModel  # Leitura em blocos de CSV/Parquet
+        pending = deque()
+        predictions = []
+        for chunk in StreamingModel.iter_chunks(source, chunksize):
+            if len(pending) >= PREDICTION_MAX_PENDING_CHUNKS:
+                predictions.append(pending.popleft().result())
+            pending.append(self.submit(model_id, chunk))
+        predictions.extend(future.result() for future in pending)
+        return np.concatenate(predictions) if predictions else np.empty(0)
+
+    def get_stats(self, model_id=None):
+        """
+        Retorna as estatísticas de vazão do serviço.
+        Args:
+            model_id (str): Modelo desejado; None retorna todos
+        Returns:
+            dict: id do modelo -> requisições, registros, lotes, registros por lote e registros/s
+        """
+        with self._lock:
+            stats = {key: dict(value) for key, value in self._stats.items() if model_id in (None, key)}
+        for value in stats.values():
+            value["rows_per_batch"] = value["rows"] / value["batches"] if value["batches"] else 0.0
+            # Vazão do predict() e vazão observada desde a primeira requisição
+            value["rows_per_second"] = value["rows"] / value["predict_seconds"] if value["predict_seconds"] else 0.0
+            elapsed = time.time() - value["started_at"]
+            value["wall_rows_per_second"] = value["rows"] / elapsed if elapsed > 0 else 0.0
+        return stats
+
+    @staticmethod
+    def to_matrix(rows, features, encoder=None):
+        """
+        Converte os registros na matriz de entrada do modelo, com as features na ordem do treinamento.
+        Args:
+            rows: DataFrame, lista de dicionários, lista de listas ou array NumPy
+                (listas e arrays devem trazer os códigos das features categóricas)
+            features (list): Colunas de entrada do modelo
+            encoder (FeatureEncoder): Codificador que converte as categorias em códigos
+        Returns:
+            numpy.ndarray: Matriz float64 com uma linha por registro
+        Raises:
+            ValueError: Se faltarem features ou o número de colunas não corresponder
+        """
+        if len(rows) == 0:
+            return np.empty((0, len(features)))
+        if encoder is not None and encoder.categorical_features:
+            if hasattr(rows, "columns"):
+                missing = [name for name in features if name not in rows.columns]
+                if missing:
+                    raise ValueError(f"Features ausentes: {missing}")
+                return encoder.encode(rows)
+            if isinstance(rows, list) and isinstance(rows[0], dict):
+                try:
+                    return encoder.encode_records(rows)
+                except KeyError as error:
+                    raise ValueError(f"Feature ausente: {error.args[0]}") from None
+        if hasattr(rows, "columns"):
+            missing = [name for name in features if name not in rows.columns]
+            if missing:
+                raise ValueError(f"Features ausentes: {missing}")
+            return rows[features].to_numpy(dtype=np.float64)
+        if isinstance(rows, list) and isinstance(rows[0], dict):
+            try:
+                return np.array([[row[name] for name in features] for row in rows], dtype=np.float64)
+            except KeyError as error:
+                raise ValueError(f"Feature ausente: {error.args[0]}") from None
+        X = np.asarray(rows, dtype=np.float64)
+        if X.ndim == 1:
+            # Um único registro informado como lista de valores
+            X = X.reshape(1, -1)
+        if X.ndim != 2 or X.shape[1] != len(features):
+            raise ValueError(f"Esperadas {len(features)} features ({features}), recebida uma matriz {X.shape}")
+        return X
+
+    def _enqueue(self, model_id, item):
+        """
+        Coloca uma requisição na fila do modelo, criando a fila e a thread de micro-batching se
+        não existirem (no primeiro uso ou depois que a thread foi encerrada por inatividade).
+        A requisição entra na fila com o lock adquirido, então a thread nunca é encerrada com
+        requisições pendentes.
+        """
+        with self._lock:
+            requests = self._queues.get(model_id)
+            if requests is None:
+                requests = self._queues[model_id] = queue.Queue()
+                self._stats.setdefault(model_id, {
+                    "requests": 0, "rows": 0, "batches": 0, "predict_seconds": 0.0, "started_at": time.time()
+                })
+                threading.Thread(
+                    target=self._batch_loop, args=(model_id, requests),
+                    name=f"prediction-{model_id[:8]}", daemon=True
+                ).start()
+            requests.put(item)
+
+    def _batch_loop(self, model_id, requests):
+        """
+        Thread do modelo: forma lotes com as requisições da fila e executa predict() uma vez por lote.
+        Termina (removendo a fila) depois de idle_seconds sem requisições.
+        """
+        while True:
+            try:
+                batch = [requests.get(timeout=self.idle_seconds)]
+            except queue.Empty:
+                with self._lock:
+                    if requests.empty():
+                        del self._queues[model_id]
+                        return
+                continue
+            n_rows = len(batch[0][0])
+            deadline = time.perf_counter() + self.batch_wait
+            # Agrupa as requisições que chegarem até o prazo ou até completar o lote
+            while n_rows < self.max_batch_rows:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = requests.get(timeout=remaining) if remaining > 0 else requests.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+                n_rows += len(item[0])
+            self._run_batch(model_id, batch, n_rows)
+
+    def _run_batch(self, model_id, batch, n_rows):
+        """
+        Executa a predição de um lote e distribui o resultado entre as requisições.
+        """
+        try:
+            model = self.registry.get(model_id)
+            X = batch[0][0] if len(batch) == 1 else np.concatenate([X for X, _ in batch])
+            start = time.perf_counter()
+            predictions = np.asarray(model.predict(X))
+            elapsed = time.perf_counter() - start
+        except Exception as error:  # O erro é devolvido para cada requisição do lote
+            for _, future in batch:
+                future.set_exception(error)
+            return
+
+        with self._lock:
+            stats = self._stats[model_id]
+            stats["requests"] += len(batch)
+            stats["rows"] += n_rows
+            stats["batches"] += 1
+            stats["predict_seconds"] += elapsed
+        offset = 0
+        for X, future in batch:
+            future.set_result(predictions[offset:offset + len(X)])
+            offset += len(X)
+
+class PredictionRequestHandler(BaseHTTPRequestHandler):
+    """
+    API HTTP local do serviço de predição:
+        GET  /models                    Lista os modelos registrados
+        GET  /stats                     Estatísticas de vazão
+        POST /models/<id>/predict       Corpo JSON {"rows": [...]} ou CSV (Content-Type: text/csv)
+    """
+
+    def do_GET(self):
+        """
+        Lista os modelos ou as estatísticas.
+        """
+        if self.path == "/models":
+            self._send(200, {"models": PREDICTION_SERVICE.registry.list_models()})
+        elif self.path == "/stats":
+            self._send(200, {"stats": PREDICTION_SERVICE.get_stats()})
+        else:
+            self._send(404, {"error": "Rota não encontrada"})
+
+    def do_POST(self):
+        """
+        Prediz os registros enviados para um modelo.
+        """
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 3 or parts[0] != "models" or parts[2] != "predict":
+            self._send(404, {"error": "Rota não encontrada"})
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            if self.headers.get("Content-Type", "").startswith("text/csv"):
+                import pandas as pd  # Para ler o CSV enviado
+                rows = pd.read_csv(io.BytesIO(body))
+            else:
+                payload = json.loads(body)
+                rows = payload.get("rows") if isinstance(payload, dict) else None
+                if not isinstance(rows, list):
+                    raise ValueError('O corpo deve ser um objeto JSON {"rows": [...]}')
+            predictions = PREDICTION_SERVICE.predict(parts[1], rows)
+        except KeyError as error:
+            self._send(404, {"error": error.args[0]})
+            return
+        except (ValueError, TypeError) as error:
+            self._send(400, {"error": str(error)})
+            return
+        self._send(200, {"predictions": predictions.tolist(), "rows": len(predictions)})
+
+    def log_message(self, format, *args):
+        """
+        Desativa o log padrão do servidor.
+        """
+        # Evita uma linha de log por requisição, que limitaria a vazão
+        pass
+
+    def _send(self, status, payload):
+        """
+        Envia uma resposta JSON.
+        """
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+# Serviço do processo, compartilhado entre sessões e com o servidor HTTP
+PREDICTION_SERVICE = PredictionService(MODEL_REGISTRY)
+
+def main(argv=None):
+    """
+    Inicia o servidor HTTP de predição com os modelos registrados em MODEL_REGISTRY_DIR.
+    Exemplo: python -m models.prediction_service --port 8765
+    """
+    parser = argparse.ArgumentParser(description="Servidor HTTP local de predição com micro-batching.")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço do servidor (padrão: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Porta do servidor (padrão: 8765)")
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer((args.host, args.port), PredictionRequestHandler)
+    print(f"Servidor de predição em http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# Importando as bibliotecas necessárias
+import json            # Para gravar os hiperparâmetros de cada execução
+import os              # Para manipular caminhos e variáveis de ambiente
+import sqlite3         # Banco de dados embutido do histórico
+import threading       # Para proteger a conexão compartilhada entre sessões
+import time            # Para registrar o momento de cada execução
+import warnings        # Para avisar sobre falhas na gravação do histórico
+from models.algorithm_registry import DEFAULT_PARAMS, PARAM_SPACE  # Hiperparâmetros configuráveis de cada algoritmo
+from models.model_cache import ModelCache, NON_RESULT_PARAMS  # Hash dos hiperparâmetros (mesma regra da chave do cache)
+# O pandas é importado apenas ao montar os rankings
+
+# Arquivo padrão do histórico (pode ser alterado pela variável de ambiente RUN_HISTORY_PATH)
+DEFAULT_HISTORY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "history.sqlite"
+)
+# Tempo máximo, em segundos, de espera por outro processo que esteja gravando no banco
+HISTORY_TIMEOUT_SECONDS = 10
+# Número de execuções exibidas no ranking
+LEADERBOARD_SIZE = 20
+
+# Tabela e índices do histórico: consultas por dataset (ranking e melhor configuração),
+# por algoritmo e por hiperparâmetros, e busca de uma execução idêntica pela chave
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    params_hash TEXT NOT NULL,
+    params TEXT NOT NULL,
+    data_fingerprint TEXT NOT NULL,
+    score REAL NOT NULL,
+    fit_seconds REAL,
+    score_seconds REAL,
+    n_train INTEGER,
+    n_test INTEGER,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_dataset_score ON runs (dataset, score DESC);
+CREATE INDEX IF NOT EXISTS runs_algorithm_dataset ON runs (algorithm, dataset, score DESC);
+CREATE INDEX IF NOT EXISTS runs_params_hash ON runs (params_hash);
+"""
+
+# Colunas do ranking e seus nomes na interface
+LEADERBOARD_COLUMNS = {
+    "score": "R²",
+    "algorithm": "Algoritmo",
+    "params": "Hiperparâmetros",
+    "fit_seconds": "Tempo de Treino (s)",
+    "score_seconds": "Tempo de Avaliação (s)",
+    "n_train": "Registros de Treino",
+    "kind": "Origem",
+    "created_at": "Data"
+}
+
+class RunHistory:
+    """
+    Histórico das execuções de treinamento em um banco SQLite local.
+    Cada execução (treinamento avaliado no conjunto de teste) é gravada uma única vez, identificada
+    pela mesma chave do cache de modelos (dados + classe + hiperparâmetros), com o dataset, o algoritmo,
+    o hash dos hiperparâmetros, o R², os tempos e a impressão digital dos dados.
+    O banco sobrevive a reinícios e é compartilhado pelos processos (modo WAL): uma execução idêntica
+    a uma já gravada retorna o resultado sem novo treinamento (ver MLModel.train_and_evaluate()).
+    """
+
+    def __init__(self, path=None):
+        """
+        Inicializa o histórico, criando o banco e os índices se necessário.
+        Args:
+            path (str): Arquivo do banco; None mantém o histórico apenas em memória
+        """
+        self.path = path
+        self._lock = threading.Lock()     # Uma conexão, usada pelas threads das sessões e dos workers
+        try:
+            if path:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._connection = RunHistory._connect(path or ":memory:")
+        except (OSError, sqlite3.Error):
+            # Diretório sem permissão de escrita: o histórico fica apenas neste processo
+            self.path = None
+            self._connection = RunHistory._connect(":memory:")
+
+    @staticmethod
+    def _connect(path):
+        """
+        Abre a conexão e cria a tabela e os índices.
+        Args:
+            path (str): Arquivo do banco ou ":memory:"
+        Returns:
+            sqlite3.Connection: Conexão compartilhada entre threads
+        """
+        connection = sqlite3.connect(path, timeout=HISTORY_TIMEOUT_SECONDS, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        if path != ":memory:":
+            # Leitores não bloqueiam a gravação de outro processo
+            connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    @staticmethod
+    def params_hash(estimator):
+        """
+        Calcula o hash da classe e dos hiperparâmetros de um estimador, sem os dados:
+        a mesma configuração tem o mesmo hash em todos os datasets.
+        Args:
+            estimator: Estimador do scikit-learn
+        Returns:
+            str: Hash hexadecimal
+        """
+        return ModelCache.make_key("", estimator)
+
+    def record(self, run_key, estimator, dataset, algorithm, data_fingerprint, score, fit_seconds=None,
+               score_seconds=None, n_train=None, n_test=None, kind="train"):
+        """
+        Grava uma execução. Uma execução com a mesma chave já gravada é mantida.
+        Args:
+            run_key (str): Chave da execução (a chave do cache de modelos)
+            estimator: Estimador treinado (fornece os hiperparâmetros)
+            dataset (str): Nome do dataset
+            algorithm (str): Nome do algoritmo
+            data_fingerprint (str): Impressão digital dos dados de treino/teste
+            score (float): R² no conjunto de teste
+            fit_seconds (float): Tempo de treino
+            score_seconds (float): Tempo de avaliação
+            n_train (int): Registros de treino
+            n_test (int): Registros de teste
+            kind (str): Origem da execução ("train" ou "search")
+        """
+        params = json.dumps(estimator.get_params(), sort_keys=True, default=repr, ensure_ascii=False)
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR IGNORE INTO runs (run_key, kind, dataset, algorithm, params_hash, params,"
+                    " data_fingerprint, score, fit_seconds, score_seconds, n_train, n_test, created_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (run_key, kind, dataset or "", algorithm, RunHistory.params_hash(estimator), params,
+                     data_fingerprint, float(score), fit_seconds, score_seconds, n_train, n_test, time.time())
+                )
+        except sqlite3.Error as error:
+            # Uma falha no histórico (ex.: banco bloqueado por outro processo) não deve interromper o treinamento
+            warnings.warn(f"Não foi possível gravar a execução no histórico: {error}")
+
+    def get(self, run_key):
+        """
+        Obtém uma execução pela chave.
+        Args:
+            run_key (str): Chave da execução
+        Returns:
+            dict: Colunas da execução (hiperparâmetros decodificados), ou None se não existir
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM runs WHERE run_key = ?", (run_key,)).fetchone()
+        return RunHistory._to_dict(row) if row is not None else None
+
+    def leaderboard(self, dataset, algorithm=None, limit=LEADERBOARD_SIZE):
+        """
+        Monta o ranking das execuções de um dataset, do maior para o menor R².
+        Args:
+            dataset (str): Nome do dataset
+            algorithm (str): Se informado, apenas as execuções deste algoritmo
+            limit (int): Número máximo de execuções
+        Returns:
+            pandas.DataFrame: Execuções com as colunas de LEADERBOARD_COLUMNS
+        """
+        import pandas as pd  # Para a tabela do ranking
+        query = "SELECT * FROM runs WHERE dataset = ?"
+        args = [dataset]
+        if algorithm is not None:
+            query += " AND algorithm = ?"
+            args.append(algorithm)
+        query += " ORDER BY score DESC LIMIT ?"
+        args.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, args).fetchall()
+        leaderboard = pd.DataFrame([RunHistory._to_dict(row) for row in rows], columns=list(LEADERBOARD_COLUMNS))
+        leaderboard["params"] = [
+            RunHistory.describe_params(algorithm, params)
+            for algorithm, params in zip(leaderboard["algorithm"], leaderboard["params"])
+        ]
+        leaderboard["created_at"] = pd.to_datetime(leaderboard["created_at"], unit="s")
+        leaderboard = leaderboard.rename(columns=LEADERBOARD_COLUMNS)
+        leaderboard.insert(0, "Posição", range(1, len(leaderboard) + 1))
+        return leaderboard
+
+    def best(self, dataset, algorithm=None):
+        """
+        Obtém a melhor configuração já executada em um dataset.
+        Args:
+            dataset (str): Nome do dataset
+            algorithm (str): Se informado, a melhor configuração deste algoritmo
+        Returns:
+            dict: Execução com o maior R², ou None se não houver execuções
+        """
+        query = "SELECT * FROM runs WHERE dataset = ?"
+        args = [dataset]
+        if algorithm is not None:
+            query += " AND algorithm = ?"
+            args.append(algorithm)
+        with self._lock:
+            row = self._connection.execute(query + " ORDER BY score DESC LIMIT 1", args).fetchone()
+        return RunHistory._to_dict(row) if row is not None else None
+
+    def get_algorithms(self, dataset):
+        """
+        Lista os algoritmos com execuções em um dataset.
+        Args:
+            dataset (str): Nome do dataset
+        Returns:
+            list: Nomes dos algoritmos, em ordem alfabética
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT algorithm FROM runs WHERE dataset = ? ORDER BY algorithm", (dataset,)
+            ).fetchall()
+        return [row["algorithm"] for row in rows]
+
+    @staticmethod
+    def describe_params(algorithm, params):
+        """
+        Resume os hiperparâmetros de uma execução: para os algoritmos do registro, apenas os
+        configuráveis na interface (PARAM_SPACE e DEFAULT_PARAMS), sem os que não alteram o modelo.
+        Args:
+            algorithm (str): Nome do algoritmo
+            params (dict): Hiperparâmetros da execução
+        Returns:
+            str: Hiperparâmetros no formato "nome=valor, ..."
+        """
+        names = set(PARAM_SPACE.get(algorithm, {})) | set(DEFAULT_PARAMS.get(algorithm, {}))
+        return ", ".join(
+            f"{name}={value}" for name, value in params.items()
+            if (not names or name in names) and name not in NON_RESULT_PARAMS
+        )
+
+    @staticmethod
+    def _to_dict(row):
+        """
+        Converte uma linha do banco em dicionário, decodificando os hiperparâmetros.
+        """
+        run = dict(row)
+        run["params"] = json.loads(run["params"])
+        return run
+
+# Histórico do processo, compartilhado entre sessões; RUN_HISTORY_PATH define o arquivo do banco
+# (vazio mantém o histórico apenas em memória)
+RUN_HISTORY = RunHistory(os.environ.get("RUN_HISTORY_PATH", DEFAULT_HISTORY_PATH) or None)
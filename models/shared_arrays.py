@@ -0,0 +1,35 @@
+# Importando as bibliotecas necessárias
+# O joblib é importado apenas ao compartilhar as matrizes
+import contextlib      # Para criar o gerenciador de contexto
+import os              # Para montar os caminhos dos arquivos
+import shutil          # Para remover os arquivos ao sair do contexto
+import tempfile        # Para criar o diretório dos arquivos
+import numpy as np     # Para converter as matrizes em arrays contíguos
+from models.tracing import Tracing  # Medição das etapas
+
+@contextlib.contextmanager
+def shared_arrays(*arrays, prefix="shared-"):
+    """
+    Compartilha matrizes entre os processos do joblib sem serializá-las por tarefa.
+    Cada matriz é gravada uma única vez (float64 contíguo) em um diretório temporário e reaberta
+    mapeada em memória, somente leitura; os processos recebem apenas a referência ao arquivo,
+    então a memória não cresce com o número de tarefas nem de núcleos. Os arquivos são removidos
+    ao sair do contexto, inclusive em caso de erro ou cancelamento.
+    Args:
+        *arrays: Matrizes a compartilhar (ex.: X e y)
+        prefix (str): Prefixo do diretório temporário (identifica quem o criou)
+    Yields:
+        tuple: Arrays mapeados em memória, na mesma ordem
+    """
+    import joblib  # Para gravar e reabrir as matrizes mapeadas em memória
+    shared_dir = tempfile.mkdtemp(prefix=prefix)
+    try:
+        with Tracing.span("share_data"):
+            shared = []
+            for i, array in enumerate(arrays):
+                path = os.path.join(shared_dir, f"{i}.joblib")
+                joblib.dump(np.ascontiguousarray(array, dtype=np.float64), path)
+                shared.append(joblib.load(path, mmap_mode="r"))
+        yield tuple(shared)
+    finally:
+        shutil.rmtree(shared_dir, ignore_errors=True)
@@ -0,0 +1,297 @@
+# Importando as bibliotecas necessárias
+import mmap            # Para identificar buffers mapeados de arquivos
+import os              # Para ler a configuração pelas variáveis de ambiente
+import sys             # Para medir objetos Python
+import threading       # Para proteger o armazenamento compartilhado entre sessões
+import time            # Para registrar criação e último acesso das entradas
+from collections import OrderedDict  # Para manter a ordem de uso (LRU)
+import numpy as np     # Para medir e proteger os arrays
+# O pandas é importado apenas ao medir ou criar visões de DataFrames
+
+# Limite de memória (heap) do armazenamento compartilhado, somando todos os tipos de entrada
+SHARED_STORE_MAX_MB = int(os.environ.get("SHARED_STORE_MAX_MB", "512"))
+
+class SharedStore:
+    """
+    Armazenamento somente leitura do processo, compartilhado por todas as sessões do Streamlit:
+    datasets carregados, perfis, divisões treino/teste e gráficos renderizados.
+    Cada entrada pertence a um tipo (namespace) e tem o tamanho medido pelos buffers que
+    referencia, contando uma única vez os arrays compartilhados entre objetos. Buffers mapeados
+    de arquivos (datasets do DatasetStore) são informados à parte e não entram no limite,
+    pois ficam no cache de páginas do sistema e não são liberados pela remoção da entrada.
+    Quando a memória ultrapassa o limite, as entradas menos usadas são removidas (LRU),
+    independentemente do tipo.
+    """
+
+    def __init__(self, max_bytes):
+        """
+        Inicializa o armazenamento.
+        Args:
+            max_bytes (int): Limite de memória (heap), em bytes, de todas as entradas
+        """
+        self.max_bytes = max_bytes
+        self.total_bytes = 0              # Memória (heap) das entradas
+        self.mapped_bytes = 0             # Buffers mapeados de arquivos, fora do limite
+        self._entries = OrderedDict()     # (tipo, chave) -> informações da entrada
+        self._counters = {}               # tipo -> acertos, faltas e remoções
+        self._loading = {}                # (tipo, chave) -> lock do carregamento em andamento
+        self._lock = threading.Lock()
+
+    def get(self, namespace, key):
+        """
+        Obtém uma entrada.
+        Args:
+            namespace (str): Tipo da entrada (ex.: "dataset", "profile")
+            key (str): Chave da entrada
+        Returns:
+            Valor armazenado, ou None se não existir
+        """
+        with self._lock:
+            value = self._touch(namespace, key)
+            if value is None:
+                self._get_counters(namespace)["misses"] += 1
+            return value
+
+    def put(self, namespace, key, value):
+        """
+        Adiciona uma entrada, tornando seus arrays somente leitura e removendo as menos usadas
+        se o limite for ultrapassado. Entradas maiores que o limite não são mantidas.
+        Args:
+            namespace (str): Tipo da entrada
+            key (str): Chave da entrada
+            value: Valor a armazenar (não deve ser modificado depois de armazenado)
+        Returns:
+            O próprio valor
+        """
+        heap_bytes, mapped_bytes = SharedStore.measure(value)
+        if heap_bytes > self.max_bytes:
+            return value
+        SharedStore.freeze(value)
+        now = time.time()
+        with self._lock:
+            self._remove((namespace, key))
+            self._entries[(namespace, key)] = {
+                "value": value, "bytes": heap_bytes, "mapped_bytes": mapped_bytes,
+                "hits": 0, "created_at": now, "last_access": now
+            }
+            self.total_bytes += heap_bytes
+            self.mapped_bytes += mapped_bytes
+            while self.total_bytes > self.max_bytes:
+                evicted = next(iter(self._entries))
+                self._remove(evicted)
+                self._get_counters(evicted[0])["evictions"] += 1
+        return value
+
+    def get_or_create(self, namespace, key, factory):
+        """
+        Obtém uma entrada, criando-a com factory() se não existir.
+        Sessões que pedem a mesma entrada ao mesmo tempo aguardam um único carregamento.
+        Args:
+            namespace (str): Tipo da entrada
+            key (str): Chave da entrada
+            factory (callable): Função sem argumentos que cria o valor
+        Returns:
+            Valor armazenado
+        """
+        with self._lock:
+            value = self._touch(namespace, key)
+            if value is not None:
+                return value
+            loading = self._loading.setdefault((namespace, key), threading.Lock())
+        with loading:
+            with self._lock:
+                value = self._touch(namespace, key)
+                if value is not None:
+                    # Carregada por outra sessão enquanto esta aguardava
+                    return value
+                self._get_counters(namespace)["misses"] += 1
+            try:
+                return self.put(namespace, key, factory())
+            finally:
+                with self._lock:
+                    self._loading.pop((namespace, key), None)
+
+    def clear(self, namespace=None):
+        """
+        Remove as entradas de um tipo (ou todas).
+        Args:
+            namespace (str): Tipo das entradas; None remove todas
+        """
+        with self._lock:
+            for entry_key in [k for k in self._entries if namespace in (None, k[0])]:
+                self._remove(entry_key)
+
+    def get_stats(self):
+        """
+        Retorna o estado do armazenamento para a visão de administração.
+        Returns:
+            dict: Limite e uso de memória, contadores por tipo e informações de cada entrada
+                (da mais recente para a menos usada)
+        """
+        now = time.time()
+        with self._lock:
+            entries = [
+                {
+                    "namespace": namespace, "key": key, "bytes": entry["bytes"],
+                    "mapped_bytes": entry["mapped_bytes"], "hits": entry["hits"],
+                    "age_seconds": now - entry["created_at"], "idle_seconds": now - entry["last_access"]
+                }
+                for (namespace, key), entry in reversed(self._entries.items())
+            ]
+            namespaces = {namespace: dict(counters) for namespace, counters in self._counters.items()}
+            total_bytes, mapped_bytes = self.total_bytes, self.mapped_bytes
+        for namespace, counters in namespaces.items():
+            requests = counters["hits"] + counters["misses"]
+            counters["hit_rate"] = counters["hits"] / requests if requests else 0.0
+            counters["entries"] = sum(1 for entry in entries if entry["namespace"] == namespace)
+            counters["bytes"] = sum(entry["bytes"] for entry in entries if entry["namespace"] == namespace)
+        return {
+            "max_bytes": self.max_bytes, "total_bytes": total_bytes, "mapped_bytes": mapped_bytes,
+            "namespaces": namespaces, "entries": entries
+        }
+
+    @staticmethod
+    def enable_copy_on_write():
+        """
+        Ativa o copy-on-write do pandas, do qual as visões (ver view()) dependem.
+        No pandas 3 ele está sempre ativo; no pandas 2 é opcional e precisa ser ativado antes
+        de os DataFrames compartilhados serem criados (chamado na importação de models.data_model).
+        """
+        import pandas as pd  # Para ajustar a opção do pandas
+        if int(pd.__version__.split(".")[0]) < 3:
+            pd.set_option("mode.copy_on_write", True)
+
+    @staticmethod
+    def view(value):
+        """
+        Cria uma visão de um valor armazenado para uso por uma sessão.
+        DataFrames e Series são copiados de forma rasa (sem copiar os dados): com o copy-on-write
+        do pandas (ver enable_copy_on_write()), uma alteração feita pela sessão copia apenas a
+        coluna alterada, na própria visão, sem afetar a entrada compartilhada.
+        Args:
+            value: Valor armazenado (DataFrame, Series ou tupla/lista deles; outros tipos são retornados como estão)
+        Returns:
+            Visão do valor
+        """
+        import pandas as pd  # Para identificar DataFrames e Series
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return value.copy(deep=False)
+        if isinstance(value, (tuple, list)):
+            return type(value)(SharedStore.view(item) for item in value)
+        return value
+
+    @staticmethod
+    def measure(value):
+        """
+        Mede a memória referenciada por um valor, contando cada buffer uma única vez.
+        Args:
+            value: Valor a medir (arrays, DataFrames, Series, objetos e coleções)
+        Returns:
+            tuple: (bytes em heap, bytes mapeados de arquivos)
+        """
+        sizes = {"heap": 0, "mapped": 0}
+        for array in SharedStore._iter_arrays(value, {}, sizes):
+            root = array
+            while isinstance(root.base, np.ndarray):
+                root = root.base
+            sizes["mapped" if isinstance(root.base, mmap.mmap) else "heap"] += root.nbytes
+        return sizes["heap"], sizes["mapped"]
+
+    @staticmethod
+    def freeze(value):
+        """
+        Torna somente leitura os arrays NumPy referenciados por um valor.
+        """
+        for array in SharedStore._iter_arrays(value, {}, {"heap": 0, "mapped": 0}):
+            array.flags.writeable = False
+
+    @staticmethod
+    def _iter_arrays(value, seen, sizes):
+        """
+        Percorre um valor e retorna os arrays NumPy distintos que ele referencia (pelo buffer raiz).
+        Objetos que não são arrays têm o tamanho somado em sizes["heap"].
+        seen guarda os objetos visitados (e não apenas os ids), para que objetos temporários
+        criados no percurso não sejam coletados e tenham o id reaproveitado.
+        """
+        import pandas as pd  # Para percorrer DataFrames, Series e Index
+        if id(value) in seen or value is None:
+            return
+        seen[id(value)] = value
+
+        if isinstance(value, np.ndarray):
+            root = value
+            while isinstance(root.base, np.ndarray):
+                root = root.base
+            if id(root) in seen and root is not value:
+                return
+            seen[id(root)] = root
+            if value.dtype == object:
+                for item in value.ravel():
+                    yield from SharedStore._iter_arrays(item, seen, sizes)
+            yield value
+        elif isinstance(value, pd.DataFrame):
+            yield from SharedStore._iter_arrays(value.index, seen, sizes)
+            for position in range(value.shape[1]):
+                yield from SharedStore._iter_arrays(value.iloc[:, position].array, seen, sizes)
+        elif isinstance(value, pd.Series):
+            yield from SharedStore._iter_arrays(value.index, seen, sizes)
+            yield from SharedStore._iter_arrays(value.array, seen, sizes)
+        elif isinstance(value, pd.Categorical):
+            yield from SharedStore._iter_arrays(value.codes, seen, sizes)
+            yield from SharedStore._iter_arrays(value.categories, seen, sizes)
+        elif isinstance(value, pd.RangeIndex):
+            sizes["heap"] += sys.getsizeof(value)
+        elif isinstance(value, (pd.Index, pd.api.extensions.ExtensionArray)):
+            array = np.asarray(value) if isinstance(value, pd.Index) or hasattr(value, "_ndarray") else None
+            if array is not None and array.dtype != object:
+                yield from SharedStore._iter_arrays(array, seen, sizes)
+            else:
+                # Texto (object ou Arrow) e demais extensões: memória informada pelo pandas
+                sizes["heap"] += int(value.memory_usage(deep=True) if isinstance(value, pd.Index) else value.nbytes)
+        elif isinstance(value, dict):
+            sizes["heap"] += sys.getsizeof(value)
+            for key, item in value.items():
+                yield from SharedStore._iter_arrays(key, seen, sizes)
+                yield from SharedStore._iter_arrays(item, seen, sizes)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            sizes["heap"] += sys.getsizeof(value)
+            for item in value:
+                yield from SharedStore._iter_arrays(item, seen, sizes)
+        elif hasattr(value, "__dict__") and not isinstance(value, type):
+            sizes["heap"] += sys.getsizeof(value)
+            yield from SharedStore._iter_arrays(vars(value), seen, sizes)
+        else:
+            sizes["heap"] += sys.getsizeof(value)
+
+    def _touch(self, namespace, key):
+        """
+        Retorna o valor de uma entrada e registra o acerto (chamado com o lock adquirido).
+        Returns:
+            Valor armazenado, ou None se não existir
+        """
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        self._get_counters(namespace)["hits"] += 1
+        entry["hits"] += 1
+        entry["last_access"] = time.time()
+        self._entries.move_to_end((namespace, key))
+        return entry["value"]
+
+    def _get_counters(self, namespace):
+        """
+        Retorna os contadores de um tipo de entrada (chamado com o lock adquirido).
+        """
+        return self._counters.setdefault(namespace, {"hits": 0, "misses": 0, "evictions": 0})
+
+    def _remove(self, entry_key):
+        """
+        Remove uma entrada e desconta o seu tamanho (chamado com o lock adquirido).
+        """
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self.total_bytes -= entry["bytes"]
+            self.mapped_bytes -= entry["mapped_bytes"]
+
+# Armazenamento do processo, compartilhado entre reruns e sessões do Streamlit
+SHARED_STORE = SharedStore(max_bytes=SHARED_STORE_MAX_MB * 1024 * 1024)
@@ -0,0 +1,214 @@
+# Importando as bibliotecas necessárias
+import os              # Para resolver os caminhos dos arquivos locais
+import numpy as np     # Para operações numéricas
+import pandas as pd    # Para leitura dos arquivos em blocos
+from models.tracing import Tracing  # Medição das etapas
+
+# Percentual dos registros destinados ao conjunto de teste (mesma proporção de prepare_data)
+TEST_PERCENT = 20
+# Diretório padrão dos arquivos locais que podem ser informados pelo caminho (variável LOCAL_DATA_DIR)
+DEFAULT_LOCAL_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "files")
+# Extensões aceitas para os arquivos locais
+LOCAL_FILE_EXTENSIONS = (".csv", ".parquet")
+
+class StreamingModel:
+    """
+    Classe responsável pelo treinamento fora da memória (out-of-core) de arquivos grandes.
+    Os arquivos CSV/Parquet são lidos em blocos, cada registro é atribuído ao treino ou ao teste
+    por um hash determinístico do seu conteúdo, e o modelo é treinado com partial_fit.
+    O pico de memória depende do tamanho do bloco, e não do tamanho do arquivo.
+    """
+
+    @staticmethod
+    def get_data_dir():
+        """
+        Retorna o diretório dos arquivos locais que podem ser lidos pelo caminho.
+        Returns:
+            str: Caminho do diretório (variável LOCAL_DATA_DIR ou data/files do projeto);
+                vazio desativa a leitura de arquivos locais pelo caminho
+        """
+        return os.environ.get("LOCAL_DATA_DIR", DEFAULT_LOCAL_DATA_DIR)
+
+    @staticmethod
+    def resolve_path(path, data_dir=None):
+        """
+        Resolve o caminho de um arquivo local informado pelo usuário, que deve estar dentro do
+        diretório de dados (links simbólicos e ".." são resolvidos antes da verificação).
+        Args:
+            path (str): Caminho relativo ao diretório de dados (ou absoluto, dentro dele)
+            data_dir (str): Diretório de dados; padrão: get_data_dir()
+        Returns:
+            str: Caminho absoluto do arquivo
+        Raises:
+            ValueError: Se a leitura pelo caminho estiver desativada, se o arquivo estiver fora do
+                diretório de dados, não existir ou não for CSV/Parquet
+        """
+        data_dir = StreamingModel.get_data_dir() if data_dir is None else data_dir
+        if not data_dir:
+            raise ValueError("A leitura de arquivos locais pelo caminho está desativada.")
+        root = os.path.realpath(data_dir)
+        resolved = os.path.realpath(os.path.join(root, path))
+        if os.path.commonpath([root, resolved]) != root:
+            raise ValueError(f"O arquivo deve estar no diretório de dados: {root}")
+        if not resolved.lower().endswith(LOCAL_FILE_EXTENSIONS) or not os.path.isfile(resolved):
+            raise ValueError(f"Arquivo CSV ou Parquet não encontrado: {path}")
+        return resolved
+
+    @staticmethod
+    def iter_chunks(source, chunksize):
+        """
+        Lê um arquivo CSV ou Parquet em blocos.
+        Args:
+            source: Caminho do arquivo ou arquivo enviado (objeto com read/seek e atributo name)
+            chunksize (int): Número de registros por bloco
+        Yields:
+            pandas.DataFrame: Bloco de registros
+        """
+        name = source if isinstance(source, str) else getattr(source, "name", "")
+        if hasattr(source, "seek"):
+            # Arquivos enviados são relidos a cada passagem
+            source.seek(0)
+
+        if name.lower().endswith(".parquet"):
+            import pyarrow.parquet as pq  # Dependência do Streamlit, carregada apenas para Parquet
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(source, chunksize=chunksize)
+
+    @staticmethod
+    def get_columns(source, chunksize):
+        """
+        Define features e target a partir do primeiro bloco, com a mesma regra de prepare_data:
+        todas as colunas numéricas exceto a última são features e a última é o target.
+        Args:
+            source: Caminho do arquivo ou arquivo enviado
+            chunksize (int): Número de registros por bloco
+        Returns:
+            tuple: (lista de features, nome do target), ou None se não houver colunas numéricas suficientes
+        """
+        first_chunk = next(StreamingModel.iter_chunks(source, chunksize), None)
+        if first_chunk is None:
+            return None
+        numeric_cols = list(first_chunk.select_dtypes(include=[np.number]).columns)
+        if len(numeric_cols) < 2:
+            return None
+        return numeric_cols[:-1], numeric_cols[-1]
+
+    @staticmethod
+    def split_mask(chunk):
+        """
+        Atribui cada registro ao conjunto de teste por um hash do seu conteúdo.
+        A divisão não depende da ordem nem do tamanho dos blocos, então todas as passagens
+        pelo arquivo (e execuções futuras) usam exatamente a mesma divisão.
+        Args:
+            chunk (pandas.DataFrame): Bloco com as colunas usadas no treinamento
+        Returns:
+            numpy.ndarray: Máscara booleana, True para registros de teste
+        """
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        return hashes % 100 < TEST_PERCENT
+
+    @staticmethod
+    def iter_split(source, chunksize, features, target):
+        """
+        Percorre o arquivo em blocos já divididos em treino e teste.
+        Args:
+            source: Caminho do arquivo ou arquivo enviado
+            chunksize (int): Número de registros por bloco
+            features (list): Colunas usadas como features
+            target (str): Coluna usada como target
+        Yields:
+            tuple: (X_train, y_train, X_test, y_test) do bloco, como arrays NumPy
+        """
+        columns = features + [target]
+        for chunk in StreamingModel.iter_chunks(source, chunksize):
+            # A inferência de tipos do CSV é feita por bloco; força as colunas escolhidas a numéricas
+            chunk = chunk[columns].apply(pd.to_numeric, errors="coerce").dropna()
+            if chunk.empty:
+                continue
+            is_test = StreamingModel.split_mask(chunk)
+            X = chunk[features].to_numpy(dtype=np.float64)
+            y = chunk[target].to_numpy(dtype=np.float64)
+            yield X[~is_test], y[~is_test], X[is_test], y[is_test]
+
+    @staticmethod
+    def train_and_evaluate(algorithm, source, chunksize, epochs, progress=None):
+        """
+        Treina um algoritmo incremental (com partial_fit) sobre o arquivo e avalia o R² no teste.
+        São feitas epochs + 2 passagens pelo arquivo: uma para ajustar a padronização,
+        uma por época de treinamento e uma para a avaliação.
+        Args:
+            algorithm: Instância de um algoritmo com partial_fit (ex.: SGDRegressor)
+            source: Caminho do arquivo ou arquivo enviado
+            chunksize (int): Número de registros por bloco
+            epochs (int): Número de passagens de treinamento pelo arquivo
+            progress (callable): Função opcional chamada com a fração concluída;
+                pode lançar uma exceção para interromper o treinamento
+        Returns:
+            tuple: (Score R², nome do modelo, dicionário de parâmetros)
+        Raises:
+            ValueError: Se o arquivo não tiver colunas numéricas suficientes ou registros de teste
+        """
+        from sklearn.preprocessing import StandardScaler  # Para padronizar as features de forma incremental
+
+        columns = StreamingModel.get_columns(source, chunksize)
+        if columns is None:
+            raise ValueError("O arquivo não possui variáveis numéricas suficientes para treinar o modelo.")
+        features, target = columns
+
+        total_passes = epochs + 2
+        report = progress or (lambda fraction: None)
+
+        # 1ª passagem: ajusta a padronização apenas com os registros de treino e conta os blocos
+        # (o total de blocos só é conhecido ao fim dela; até lá o progresso fica em zero)
+        scaler = StandardScaler()
+        n_chunks = 0
+        with Tracing.span("scaler_pass"):
+            for X_train, _, _, _ in StreamingModel.iter_split(source, chunksize, features, target):
+                report(0.0)
+                n_chunks += 1
+                if len(X_train):
+                    scaler.partial_fit(X_train)
+
+        def report_chunk(done_passes, chunk_index):
+            # Progresso por bloco dentro da passagem atual
+            report((done_passes + (chunk_index + 1) / max(n_chunks, 1)) / total_passes)
+
+        # Passagens de treinamento
+        for epoch in range(epochs):
+            with Tracing.span("fit_epoch"):
+                for i, (X_train, y_train, _, _) in enumerate(
+                        StreamingModel.iter_split(source, chunksize, features, target)):
+                    report_chunk(epoch + 1, i)
+                    if len(X_train):
+                        algorithm.partial_fit(scaler.transform(X_train), y_train)
+
+        # Passagem de avaliação: combina média e soma dos quadrados dos desvios do target bloco a bloco
+        # (método de Chan, como em DatasetProfile), evitando o cancelamento de sum(y²) - sum(y)²/n
+        n_test = 0
+        mean_y = 0.0
+        ss_tot = 0.0
+        ss_res = 0.0
+        with Tracing.span("score"):
+            for i, (_, _, X_test, y_test) in enumerate(
+                    StreamingModel.iter_split(source, chunksize, features, target)):
+                report_chunk(epochs + 1, i)
+                if len(y_test):
+                    predictions = algorithm.predict(scaler.transform(X_test))
+                    block_count = len(y_test)
+                    block_mean = y_test.mean()
+                    block_m2 = np.square(y_test - block_mean).sum()
+                    total = n_test + block_count
+                    delta = block_mean - mean_y
+                    mean_y += delta * block_count / total
+                    ss_tot += block_m2 + delta ** 2 * n_test * block_count / total
+                    n_test = total
+                    ss_res += np.square(y_test - predictions).sum()
+
+        if n_test == 0:
+            raise ValueError("O arquivo não possui registros suficientes para o conjunto de teste.")
+        score = 1.0 - ss_res / ss_tot if ss_tot > 0 else 0.0
+        report(1.0)
+
+        return score, algorithm.__class__.__name__, algorithm.get_params()
@@ -0,0 +1,209 @@
+# Importando as bibliotecas necessárias
+import contextvars     # Para associar o rastreamento ativo à thread/contexto em execução
+import json            # Para exportar as etapas em JSON lines
+import os              # Para ler a configuração pelas variáveis de ambiente
+import sys             # Para os argumentos da linha de comando
+import threading       # Para proteger a escrita do arquivo de log
+import time            # Para medir a duração das etapas
+import uuid            # Para gerar identificadores de rastreamentos
+import warnings        # Para avisar sobre falhas na gravação do log
+from contextlib import contextmanager  # Para delimitar as etapas com "with"
+
+# Desliga a instrumentação quando definido como "0"
+TRACING_ENABLED = os.environ.get("TRACING_ENABLED", "1") != "0"
+# Arquivo JSON lines onde cada etapa concluída é registrada (opcional)
+TRACE_LOG_PATH = os.environ.get("TRACE_LOG_PATH")
+# Percentis calculados no resumo das etapas
+SUMMARY_PERCENTILES = (50, 90, 99)
+
+# Rastreamento ativo no contexto atual (cada execução da página e cada job tem o seu)
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+# Sessões e workers escrevem no mesmo arquivo de log
+_log_lock = threading.Lock()
+
+def _memory_usage():
+    """
+    Memória residente (RSS) atual do processo, em bytes.
+    Returns:
+        int: Bytes em uso, ou None se não for possível medir neste sistema
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+class Trace:
+    """
+    Rastreamento de uma execução (uma execução da página ou um job de treinamento).
+    Guarda as etapas com início, duração, variação de memória e etapa pai.
+    A variação de memória é a do processo inteiro, então inclui o efeito de sessões concorrentes.
+    """
+
+    def __init__(self, name, session_id=""):
+        """
+        Inicializa o rastreamento.
+        Args:
+            name (str): Nome da execução (ex.: "page", "train")
+            session_id (str): Sessão do Streamlit que originou a execução
+        """
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.session_id = session_id
+        self.spans = []                   # Etapas na ordem de início
+        self._stack = []                  # Etapas em andamento (para registrar a etapa pai)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name):
+        """
+        Mede uma etapa.
+        Args:
+            name (str): Nome da etapa (ex.: "load_dataset", "fit")
+        """
+        record = {
+            "span": name,
+            "parent": self._stack[-1] if self._stack else None,
+            "depth": len(self._stack),
+            "start": time.time(),
+            "duration_ms": None,
+            "memory_delta_mb": None,
+            "error": None
+        }
+        with self._lock:
+            self.spans.append(record)
+        self._stack.append(name)
+        memory_before = _memory_usage()
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as error:
+            record["error"] = error.__class__.__name__
+            raise
+        finally:
+            record["duration_ms"] = (time.perf_counter() - start) * 1000
+            memory_after = _memory_usage()
+            if memory_before is not None and memory_after is not None:
+                record["memory_delta_mb"] = (memory_after - memory_before) / (1024 * 1024)
+            self._stack.pop()
+
+    def to_records(self):
+        """
+        Converte as etapas em registros independentes (um por linha no log).
+        Returns:
+            list: Dicionários com as etapas e a identificação do rastreamento
+        """
+        with self._lock:
+            spans = list(self.spans)
+        return [
+            {"trace_id": self.id, "trace": self.name, "session_id": self.session_id, **span}
+            for span in spans
+        ]
+
+    def to_json_lines(self):
+        """
+        Serializa as etapas em JSON lines.
+        Returns:
+            str: Uma etapa por linha
+        """
+        return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in self.to_records())
+
+    def export(self, path=None):
+        """
+        Acrescenta as etapas ao arquivo de log, se configurado.
+        Args:
+            path (str): Arquivo JSON lines (padrão: TRACE_LOG_PATH)
+        """
+        path = path or TRACE_LOG_PATH
+        if not path or not self.spans:
+            return
+        lines = self.to_json_lines()
+        try:
+            with _log_lock:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+        except OSError as error:
+            # Uma falha no log não deve interromper a página nem o treinamento
+            warnings.warn(f"Não foi possível gravar o rastreamento em {path}: {error}")
+
+class Tracing:
+    """
+    Ponto de acesso à instrumentação.
+    As camadas de modelo chamam Tracing.span() sem conhecer quem as executa;
+    sem rastreamento ativo (ex.: benchmarks), as etapas não são registradas.
+    """
+
+    @staticmethod
+    def current():
+        """
+        Retorna o rastreamento ativo no contexto atual.
+        Returns:
+            Trace: Rastreamento ativo, ou None
+        """
+        return _current_trace.get()
+
+    @staticmethod
+    @contextmanager
+    def activate(trace):
+        """
+        Torna o rastreamento ativo no contexto atual durante o bloco "with".
+        Args:
+            trace (Trace): Rastreamento a ativar
+        """
+        token = _current_trace.set(trace if TRACING_ENABLED else None)
+        try:
+            yield trace
+        finally:
+            _current_trace.reset(token)
+
+    @staticmethod
+    @contextmanager
+    def span(name):
+        """
+        Mede uma etapa no rastreamento ativo (ou não faz nada, se não houver).
+        Args:
+            name (str): Nome da etapa
+        """
+        trace = _current_trace.get()
+        if trace is None:
+            yield
+            return
+        with trace.span(name):
+            yield
+
+    @staticmethod
+    def read_log(path):
+        """
+        Lê um arquivo JSON lines gerado por Trace.export().
+        Args:
+            path (str): Caminho do arquivo
+        Returns:
+            list: Registros das etapas
+        """
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    @staticmethod
+    def summarize(records):
+        """
+        Agrega as etapas de várias execuções e sessões em percentis de latência.
+        Args:
+            records (list): Registros das etapas
+        Returns:
+            pandas.DataFrame: Por rastreamento e etapa, quantidade, percentis (ms) e memória média (MB)
+        """
+        import pandas as pd  # Carregado apenas para gerar o resumo
+
+        df = pd.DataFrame(records)
+        grouped = df.groupby(["trace", "span"])
+        summary = grouped["duration_ms"].agg(["count"])
+        for percentile in SUMMARY_PERCENTILES:
+            summary[f"p{percentile}_ms"] = grouped["duration_ms"].quantile(percentile / 100)
+        summary["memory_delta_mb"] = grouped["memory_delta_mb"].mean()
+        return summary.sort_values(f"p{SUMMARY_PERCENTILES[-1]}_ms", ascending=False).reset_index()
+
+if __name__ == "__main__":
+    # Resumo de um arquivo de log: python -m models.tracing traces.jsonl
+    if len(sys.argv) != 2:
+        sys.exit("Uso: python -m models.tracing <arquivo.jsonl>")
+    print(Tracing.summarize(Tracing.read_log(sys.argv[1])).to_string(index=False))
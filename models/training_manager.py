@@ -0,0 +1,437 @@
+# Importando as bibliotecas necessárias
+import hashlib         # Para gerar as chaves de deduplicação dos jobs
+import os              # Para ler a configuração do pool pelas variáveis de ambiente
+import threading       # Para os workers, o cancelamento e a proteção das filas
+import time            # Para medir o tempo decorrido e o tempo de espera na fila
+import uuid            # Para gerar identificadores de jobs
+from collections import OrderedDict, deque  # Filas por sessão (rodízio) e amostras de espera
+from models.algorithm_registry import LIGHT_LANE, HEAVY_LANE, TRAINING_WORKERS  # Filas e workers do agendador
+from models.model_cache import ModelCache  # Chave dos dados e hiperparâmetros do estimador
+from models.tracing import Trace, Tracing  # Medição das etapas do treinamento
+
+# Tempo (em segundos) que um job finalizado fica disponível para a sessão que o criou
+JOB_RETENTION_SECONDS = 600
+# Quantidade de tempos de espera guardados por fila para as métricas
+WAIT_SAMPLES = 200
+
+class TrainingCancelled(Exception):
+    """
+    Exceção lançada dentro do worker quando o usuário cancela o treinamento.
+    """
+
+class TrainingStopped(TrainingCancelled):
+    """
+    Exceção lançada dentro do worker quando o usuário pede para encerrar o treinamento
+    mantendo o resultado parcial (ver TrainingJob.stop()).
+    Funções que não a tratam são canceladas.
+    """
+
+class TrainingJob:
+    """
+    Representa um treinamento submetido ao agendador.
+    Guarda o estado, o progresso, o tempo decorrido e o resultado do treinamento.
+    Um mesmo job pode ser aguardado por várias sessões (jobs idênticos são deduplicados).
+    """
+
+    PENDING = "pendente"
+    RUNNING = "executando"
+    DONE = "concluído"
+    CANCELLED = "cancelado"
+    FAILED = "erro"
+
+    def __init__(self, description="", kind="train", session_id="", lane=HEAVY_LANE, key=None):
+        """
+        Inicializa o job.
+        Args:
+            description (str): Descrição exibida na interface (ex.: nome do modelo)
+            kind (str): Tipo do job, usado pela interface para exibir o resultado
+            session_id (str): Sessão que submeteu o job (registrada no rastreamento)
+            lane (str): Fila do agendador (LIGHT_LANE ou HEAVY_LANE)
+            key (str): Chave de deduplicação (ver TrainingManager.make_key()), ou None
+        """
+        self.id = uuid.uuid4().hex            # Identificador guardado na sessão do usuário
+        self.description = description        # Descrição do treinamento
+        self.kind = kind                      # Tipo do job (ex.: "train", "search")
+        self.lane = lane                      # Fila do agendador
+        self.key = key                        # Chave de deduplicação
+        self.sessions = [session_id]          # Sessões que aguardam o resultado
+        self.status = TrainingJob.PENDING     # Estado atual do job
+        self.progress = 0.0                   # Progresso entre 0 e 1
+        self.partial_result = None            # Resultado parcial informado pela função (ex.: até a última etapa)
+        self.result = None                    # Resultado retornado pela função de treinamento
+        self.error = None                     # Exceção, se o treinamento falhar
+        self.submitted_at = time.time()       # Momento da submissão
+        self.started_at = None                # Início da execução no worker
+        self.finished_at = None               # Fim da execução
+        self.trace = Trace(kind, session_id)  # Etapas medidas durante a execução
+        self._call = None                     # (função, args, kwargs) executados pelo worker
+        self._cancel_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self):
+        """
+        Tempo decorrido desde a submissão, em segundos.
+        """
+        end = self.finished_at or time.time()
+        return end - self.submitted_at
+
+    @property
+    def wait_time(self):
+        """
+        Tempo de espera na fila, em segundos (até o início da execução ou até agora).
+        """
+        end = self.started_at or self.finished_at or time.time()
+        return end - self.submitted_at
+
+    @property
+    def finished(self):
+        """
+        Indica se o job terminou (com sucesso, erro ou cancelamento).
+        """
+        return self.status in (TrainingJob.DONE, TrainingJob.CANCELLED, TrainingJob.FAILED)
+
+    def cancel(self, session_id=None):
+        """
+        Solicita o cancelamento do job.
+        Um job compartilhado por várias sessões (ver TrainingManager.submit()) só é cancelado
+        quando todas as sessões desistem dele; até lá, apenas a sessão informada deixa de aguardá-lo.
+        Jobs ainda na fila são descartados; jobs em execução param no próximo ponto de verificação.
+        Args:
+            session_id (str): Sessão que desiste do job (ignorado se ela não o aguarda);
+                None cancela para todas as sessões
+        """
+        with self._lock:
+            if session_id is not None:
+                if session_id not in self.sessions:
+                    # A sessão não aguarda este job (ou já desistiu dele): nada muda para as demais
+                    return
+                self.sessions.remove(session_id)
+                if self.sessions:
+                    return
+            self.sessions = []
+            self._cancel_event.set()
+            if self.status == TrainingJob.PENDING:
+                self.status = TrainingJob.CANCELLED
+                self.finished_at = time.time()
+
+    def stop(self, session_id=None):
+        """
+        Solicita que o job termine no próximo ponto de verificação, mantendo o resultado parcial.
+        Apenas funções que tratam TrainingStopped (ex.: o treinamento progressivo) terminam com
+        um resultado; as demais são canceladas. Um job compartilhado por várias sessões não é
+        encerrado por uma delas (ver TrainingManager.stop(), que dá à sessão um job próprio).
+        Args:
+            session_id (str): Sessão que pede o encerramento; None encerra para todas as sessões
+        Returns:
+            bool: Se o encerramento foi solicitado
+        """
+        with self._lock:
+            if session_id is not None and self.sessions != [session_id]:
+                return False
+            self._stop_event.set()
+            return True
+
+    def _unsubscribe(self, session_id):
+        """
+        Retira uma sessão de um job que continua sendo aguardado por outras sessões.
+        Returns:
+            bool: True se a sessão foi retirada (o job segue para as demais)
+        """
+        with self._lock:
+            if session_id not in self.sessions or len(self.sessions) < 2:
+                return False
+            self.sessions.remove(session_id)
+            return True
+
+    def _subscribe(self, session_id):
+        """
+        Adiciona uma sessão às que aguardam o resultado de um job idêntico já submetido.
+        Returns:
+            bool: False se o job já foi cancelado ou terminou (um novo job deve ser criado)
+        """
+        with self._lock:
+            if self._cancel_event.is_set() or self._stop_event.is_set() or self.finished:
+                return False
+            self.sessions.append(session_id)
+            return True
+
+    def report_progress(self, fraction, partial_result=None):
+        """
+        Atualiza o progresso; chamado pela função de treinamento dentro do worker.
+        Args:
+            fraction (float): Fração concluída, entre 0 e 1
+            partial_result: Resultado parcial, no mesmo formato do resultado final (opcional);
+                é o resultado entregue a uma sessão que encerra um job compartilhado
+        Raises:
+            TrainingCancelled: Se o cancelamento foi solicitado
+            TrainingStopped: Se o encerramento com o resultado parcial foi solicitado
+        """
+        if partial_result is not None:
+            self.partial_result = partial_result
+        if self._cancel_event.is_set():
+            raise TrainingCancelled()
+        if self._stop_event.is_set():
+            raise TrainingStopped()
+        self.progress = min(max(fraction, 0.0), 1.0)
+
+    def _run(self):
+        """
+        Executa a função de treinamento no worker e registra o resultado.
+        """
+        func, args, kwargs = self._call
+        self._call = None
+        with self._lock:
+            if self._cancel_event.is_set():
+                return
+            self.status = TrainingJob.RUNNING
+            self.started_at = time.time()
+        try:
+            with Tracing.activate(self.trace), Tracing.span(self.kind):
+                self.result = func(*args, progress=self.report_progress, **kwargs)
+            # Um cancelamento pedido durante um fit indivisível descarta o resultado
+            self.status = TrainingJob.CANCELLED if self._cancel_event.is_set() else TrainingJob.DONE
+            if self.status == TrainingJob.DONE:
+                self.progress = 1.0
+        except TrainingCancelled:
+            self.status = TrainingJob.CANCELLED
+        except Exception as error:  # O erro é exibido na sessão que submeteu o job
+            self.error = error
+            self.status = TrainingJob.FAILED
+        finally:
+            self.finished_at = time.time()
+            self.trace.export()
+
+class TrainingManager:
+    """
+    Agendador de treinamentos compartilhado por todas as sessões.
+    Os treinamentos rodam fora das threads de script do Streamlit, em um número limitado
+    de workers, e os jobs ficam registrados no processo, de modo que o resultado sobrevive
+    aos reruns da página.
+    - Jobs idênticos em andamento (mesmos dados, estimador e hiperparâmetros) são executados
+      uma única vez: as sessões que os submetem recebem o mesmo job.
+    - Há duas filas: a leve (LIGHT_LANE) tem workers próprios, então uma Regressão Linear
+      não espera atrás de Random Forests; os workers da fila pesada também executam jobs
+      leves quando não há jobs pesados.
+    - Em cada fila, as sessões são atendidas em rodízio: uma sessão com muitos jobs não
+      impede que as demais sejam atendidas.
+    """
+
+    def __init__(self, max_workers, light_workers=1):
+        """
+        Inicializa o agendador (os workers são criados na primeira submissão).
+        Args:
+            max_workers (int): Número de workers da fila pesada
+            light_workers (int): Número de workers reservados para a fila leve
+        """
+        self.max_workers = max_workers
+        self.light_workers = light_workers
+        self._jobs = {}                   # id -> TrainingJob
+        self._in_flight = {}              # chave de deduplicação -> TrainingJob em andamento
+        # Fila -> sessão -> jobs pendentes da sessão (as sessões são atendidas em rodízio)
+        self._queues = {LIGHT_LANE: OrderedDict(), HEAVY_LANE: OrderedDict()}
+        self._running = {LIGHT_LANE: 0, HEAVY_LANE: 0}
+        self._waits = {LIGHT_LANE: deque(maxlen=WAIT_SAMPLES), HEAVY_LANE: deque(maxlen=WAIT_SAMPLES)}
+        self._counters = {"submitted": 0, "deduplicated": 0}
+        self._workers = []
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def make_key(kind, data_fingerprint, estimator, **options):
+        """
+        Monta a chave de deduplicação de um job.
+        Args:
+            kind (str): Tipo do job ("train", "search" ou "cv")
+            data_fingerprint (str): Impressão digital dos dados (ex.: DataModel.get_fingerprint())
+            estimator: Estimador do scikit-learn configurado (classe e hiperparâmetros entram na chave)
+            **options: Demais opções que alteram o resultado (ex.: n_folds, estratégia da busca)
+        Returns:
+            str: Chave do job
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(kind.encode())
+        digest.update(ModelCache.make_key(data_fingerprint, estimator).encode())
+        digest.update(repr(sorted(options.items())).encode())
+        return digest.hexdigest()
+
+    def submit(self, func, *args, description="", kind="train", session_id="", lane=HEAVY_LANE, key=None, **kwargs):
+        """
+        Submete um treinamento ao agendador.
+        A função recebe o argumento nomeado `progress`, que deve ser chamado com a fração concluída.
+        Args:
+            func (callable): Função de treinamento
+            *args: Argumentos posicionais da função
+            description (str): Descrição exibida na interface
+            kind (str): Tipo do job, usado pela interface para exibir o resultado
+            session_id (str): Sessão que submeteu o job
+            lane (str): Fila do agendador (LIGHT_LANE ou HEAVY_LANE)
+            key (str): Chave de deduplicação (ver make_key()); se houver um job em andamento
+                com a mesma chave, ele é retornado em vez de criar outro
+            **kwargs: Argumentos nomeados da função
+        Returns:
+            TrainingJob: Job criado (ou o job idêntico já em andamento)
+        """
+        with self._condition:
+            self._prune()
+            self._counters["submitted"] += 1
+            running = self._in_flight.get(key) if key is not None else None
+            if running is not None and running._subscribe(session_id):
+                self._counters["deduplicated"] += 1
+                return running
+
+            job = TrainingJob(description, kind, session_id, lane, key)
+            job._call = (func, args, kwargs)
+            self._jobs[job.id] = job
+            if key is not None:
+                self._in_flight[key] = job
+            queue = self._queues[lane]
+            queue.setdefault(session_id, deque()).append(job)
+            self._start_workers()
+            self._condition.notify_all()
+        return job
+
+    def stop(self, job, session_id=None):
+        """
+        Encerra um job mantendo o resultado parcial, sem afetar as outras sessões que o aguardam.
+        Se outras sessões aguardam o job, ele continua para elas: a sessão deixa de aguardá-lo e
+        recebe um job próprio, na fila leve, que apenas entrega o resultado parcial atual.
+        Args:
+            job (TrainingJob): Job a encerrar
+            session_id (str): Sessão que pede o encerramento; None encerra para todas as sessões
+        Returns:
+            TrainingJob: Job que a sessão deve acompanhar (o próprio job ou o job criado para ela)
+        """
+        partial_result = job.partial_result
+        if partial_result is not None and session_id is not None and job._unsubscribe(session_id):
+            return self.submit(
+                _return_result, partial_result, description=job.description, kind=job.kind,
+                session_id=session_id, lane=LIGHT_LANE
+            )
+        job.stop(session_id)
+        return job
+
+    def get(self, job_id):
+        """
+        Obtém um job pelo identificador.
+        Args:
+            job_id (str): Identificador do job
+        Returns:
+            TrainingJob: Job encontrado, ou None
+        """
+        with self._condition:
+            return self._jobs.get(job_id)
+
+    def get_stats(self):
+        """
+        Retorna as métricas do agendador para a visão de administração.
+        Returns:
+            dict: Workers, jobs submetidos e deduplicados e, por fila, jobs na fila,
+                em execução, sessões aguardando e tempos de espera (médio, p95 e máximo, em segundos)
+        """
+        with self._condition:
+            lanes = {}
+            for lane, queue in self._queues.items():
+                pending = [job for jobs in queue.values() for job in jobs if not job.finished]
+                waits = sorted(list(self._waits[lane]) + [job.wait_time for job in pending])
+                lanes[lane] = {
+                    "queued": len(pending),
+                    "running": self._running[lane],
+                    "sessions": sum(1 for jobs in queue.values() if any(not job.finished for job in jobs)),
+                    "mean_wait": sum(waits) / len(waits) if waits else 0.0,
+                    "p95_wait": waits[min(len(waits) - 1, int(0.95 * len(waits)))] if waits else 0.0,
+                    "max_wait": waits[-1] if waits else 0.0
+                }
+            return {
+                "workers": self.max_workers, "light_workers": self.light_workers,
+                "in_flight": len(self._in_flight), **self._counters, "lanes": lanes
+            }
+
+    def _start_workers(self):
+        """
+        Cria os workers na primeira submissão (chamado com o lock adquirido).
+        """
+        if self._workers:
+            return
+        lanes = [(HEAVY_LANE, LIGHT_LANE)] * self.max_workers + [(LIGHT_LANE,)] * self.light_workers
+        for index, worker_lanes in enumerate(lanes):
+            worker = threading.Thread(
+                target=self._work, args=(worker_lanes,), name=f"training-{index}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self, lanes):
+        """
+        Laço de um worker: executa o próximo job das filas atendidas, na ordem de prioridade.
+        Args:
+            lanes (tuple): Filas atendidas pelo worker
+        """
+        while True:
+            with self._condition:
+                job = self._next_job(lanes)
+                while job is None:
+                    self._condition.wait()
+                    job = self._next_job(lanes)
+                self._running[job.lane] += 1
+                self._waits[job.lane].append(time.time() - job.submitted_at)
+            try:
+                job._run()
+            finally:
+                with self._condition:
+                    self._running[job.lane] -= 1
+                    if self._in_flight.get(job.key) is job:
+                        del self._in_flight[job.key]
+
+    def _next_job(self, lanes):
+        """
+        Retira o próximo job pendente (chamado com o lock adquirido).
+        Em cada fila, a primeira sessão é atendida e vai para o fim do rodízio.
+        Jobs cancelados enquanto estavam na fila são descartados.
+        Returns:
+            TrainingJob: Próximo job, ou None se as filas estiverem vazias
+        """
+        for lane in lanes:
+            queue = self._queues[lane]
+            while queue:
+                session_id, jobs = next(iter(queue.items()))
+                job = jobs.popleft()
+                if jobs:
+                    queue.move_to_end(session_id)
+                else:
+                    del queue[session_id]
+                if not job.finished:
+                    return job
+                if self._in_flight.get(job.key) is job:
+                    del self._in_flight[job.key]
+        return None
+
+    def _prune(self):
+        """
+        Remove do registro os jobs finalizados há mais de JOB_RETENTION_SECONDS.
+        """
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at and now - job.finished_at > JOB_RETENTION_SECONDS
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+def _return_result(result, progress=None):
+    """
+    Função de um job que apenas entrega um resultado já calculado (ver TrainingManager.stop()).
+    Args:
+        result: Resultado a entregar
+        progress (callable): Função de progresso (não utilizada)
+    Returns:
+        O próprio resultado
+    """
+    return result
+
+# Agendador do processo, compartilhado entre sessões: TRAINING_WORKERS define os workers da fila pesada
+# e TRAINING_LIGHT_WORKERS os reservados para a fila leve
+TRAINING_MANAGER = TrainingManager(
+    max_workers=TRAINING_WORKERS,
+    light_workers=int(os.environ.get("TRAINING_LIGHT_WORKERS", "1"))
+)
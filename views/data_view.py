@@ -1,7 +1,19 @@
 # Importando bibliotecas necessárias
+import io                   # Para renderizar os gráficos em memória
+import os                   # Para ler a configuração pelas variáveis de ambiente
 import streamlit as st      # Para criar a interface web
-import seaborn as sns      # Para criar visualizações
-import matplotlib.pyplot as plt  # Para manipular gráficos
+# O Seaborn e o Matplotlib são importados apenas ao renderizar um gráfico que não está no cache
+from models.shared_store import SHARED_STORE  # Armazenamento compartilhado entre sessões
+from models.run_history import RunHistory    # Resumo dos hiperparâmetros das execuções
+from models.feature_importance import COEFFICIENT_COLUMN, PERMUTATION_COLUMN, PERMUTATION_STD_COLUMN  # Colunas das importâncias
+
+# Acima deste número de registros, o gráfico de dispersão passa a ser de densidade (hexbin)
+DENSITY_THRESHOLD = int(os.environ.get("SCATTER_DENSITY_THRESHOLD", "10000"))
+
+# Configurações dos gráficos (fazem parte da chave do cache)
+FIGURE_SIZE = (8, 6)
+FIGURE_DPI = 100
+HEXBIN_GRIDSIZE = 50
 
 class DataView:
     """
@@ -10,11 +22,11 @@ class DataView:
     """
     
     @staticmethod
-    def show_dataset_info(df):
+    def show_dataset_info(profile):
         """
         Exibe informações gerais sobre o dataset.
         Args:
-            df (pandas.DataFrame): DataFrame a ser analisado
+            profile (DatasetProfile): Perfil pré-calculado do dataset
         """
         # Cria duas colunas para o layout
         col1, col2 = st.columns(2)
@@ -22,7 +34,7 @@ class DataView:
         # Coluna 1: Amostra do Dataset
         with col1:
             st.subheader("Amostra do Dataset")
-            st.dataframe(df.head())
+            st.dataframe(profile.sample)
 
         # Coluna 2: Informações do Dataset
         with col2:
@@ -54,11 +66,15 @@ class DataView:
             <div class="info-container">
                 <div class="info-item">
                     <span class="info-label">Número de registros:</span>
-                    <div class="info-value">{df.shape[0]}</div>
+                    <div class="info-value">{profile.shape[0]}</div>
                 </div>
                 <div class="info-item">
                     <span class="info-label">Número de variáveis:</span>
-                    <div class="info-value">{df.shape[1]}</div>
+                    <div class="info-value">{profile.shape[1]}</div>
+                </div>
+                <div class="info-item">
+                    <span class="info-label">Valores nulos:</span>
+                    <div class="info-value">{int(profile.null_counts.sum())}</div>
                 </div>
             </div>
             """
@@ -66,19 +82,25 @@ class DataView:
             
             # Mostra estatísticas descritivas do dataset
             st.subheader("Descrição Estatística")
-            st.dataframe(df.describe())
+            st.dataframe(profile.describe)
+            if profile.approximate:
+                st.caption("Estatísticas calculadas em uma única passagem; quartis estimados por amostragem.")
 
     @staticmethod
-    def show_visualizations(df, numeric_cols, dataset_name, model_name):
+    def show_visualizations(df, numeric_cols, dataset_name, data_fingerprint=None):
         """
         Cria e exibe visualizações dos dados.
+        Os gráficos renderizados são guardados em cache pela impressão digital do dataset,
+        pelas colunas e pelas configurações do gráfico. Acima de DENSITY_THRESHOLD registros,
+        o gráfico de dispersão é substituído por um gráfico de densidade (hexbin).
         Args:
             df (pandas.DataFrame): DataFrame para criar visualizações
             numeric_cols (list): Lista de colunas numéricas
             dataset_name (str): Nome do dataset selecionado
-            model_name (str): Nome do modelo selecionado
+            data_fingerprint (str): Impressão digital do dataset; se None, os gráficos não usam cache
         """
-        # Cria um cabeçalho estilizado com as informações de dataset e modelo
+        # Cria um cabeçalho estilizado com o dataset (o modelo fica no painel de configuração,
+        # que é executado separadamente dos gráficos)
         header_html = f"""
         <style>
         .header-container {{
@@ -144,10 +166,6 @@ class DataView:
                     <div class="info-label">Dataset</div>
                     <div class="info-value">{dataset_name}</div>
                 </div>
-                <div class="info-box">
-                    <div class="info-label">Modelo</div>
-                    <div class="info-value">{model_name}</div>
-                </div>
             </div>
         </div>
         """
@@ -159,20 +177,99 @@ class DataView:
 
             with col1:
                 # Cria histograma da primeira variável numérica
-                fig1, ax1 = plt.subplots(figsize=(8, 6))
-                sns.histplot(data=df, x=numeric_cols[0], ax=ax1)
-                ax1.set_title(f'Distribuição de {numeric_cols[0]}')
-                st.pyplot(fig1)
-                plt.close(fig1)
+                key = repr((data_fingerprint, "hist", numeric_cols[0], FIGURE_SIZE, FIGURE_DPI))
+                st.image(DataView._cached_figure(
+                    key, data_fingerprint, lambda: DataView._render_histogram(df, numeric_cols[0])
+                ))
 
             with col2:
                 # Cria gráfico de dispersão das duas primeiras variáveis numéricas
                 if len(numeric_cols) >= 2:
-                    fig2, ax2 = plt.subplots(figsize=(8, 6))
-                    sns.scatterplot(data=df, x=numeric_cols[0], y=numeric_cols[1], ax=ax2)
-                    ax2.set_title(f'{numeric_cols[0]} vs {numeric_cols[1]}')
-                    st.pyplot(fig2)
-                    plt.close(fig2)
+                    density = len(df) > DENSITY_THRESHOLD
+                    key = repr((
+                        data_fingerprint, "scatter", numeric_cols[0], numeric_cols[1],
+                        density, HEXBIN_GRIDSIZE, FIGURE_SIZE, FIGURE_DPI
+                    ))
+                    st.image(DataView._cached_figure(
+                        key, data_fingerprint,
+                        lambda: DataView._render_scatter(df, numeric_cols[0], numeric_cols[1], density)
+                    ))
+
+    @staticmethod
+    def _cached_figure(key, data_fingerprint, render):
+        """
+        Retorna o PNG do gráfico a partir do armazenamento compartilhado, renderizando-o apenas se necessário.
+        Args:
+            key (str): Chave do gráfico (dataset, colunas e configurações)
+            data_fingerprint (str): Impressão digital do dataset; se None, não usa o cache
+            render (callable): Função que renderiza o gráfico e retorna o PNG
+        Returns:
+            bytes: Imagem PNG do gráfico
+        """
+        if data_fingerprint is None:
+            return render()
+        return SHARED_STORE.get_or_create("figure", key, render)
+
+    @staticmethod
+    def _figure_to_png(fig):
+        """
+        Converte a figura em PNG e libera a figura.
+        Args:
+            fig (matplotlib.figure.Figure): Figura a converter
+        Returns:
+            bytes: Imagem PNG
+        """
+        import matplotlib.pyplot as plt  # Para liberar a figura
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=FIGURE_DPI, bbox_inches="tight")
+        plt.close(fig)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _render_histogram(df, column):
+        """
+        Renderiza o histograma de uma coluna.
+        Args:
+            df (pandas.DataFrame): DataFrame com os dados
+            column (str): Coluna a ser exibida
+        Returns:
+            bytes: Imagem PNG do gráfico
+        """
+        import matplotlib.pyplot as plt  # Para manipular gráficos
+        import seaborn as sns            # Para criar visualizações
+        fig1, ax1 = plt.subplots(figsize=FIGURE_SIZE)
+        sns.histplot(data=df, x=column, ax=ax1)
+        ax1.set_title(f'Distribuição de {column}')
+        return DataView._figure_to_png(fig1)
+
+    @staticmethod
+    def _render_scatter(df, x, y, density):
+        """
+        Renderiza o gráfico de dispersão de duas colunas.
+        No modo de densidade, os pontos são agregados em hexágonos, então o custo de
+        renderização não cresce com o número de registros.
+        Args:
+            df (pandas.DataFrame): DataFrame com os dados
+            x (str): Coluna do eixo X
+            y (str): Coluna do eixo Y
+            density (bool): Se True, usa o gráfico de densidade (hexbin)
+        Returns:
+            bytes: Imagem PNG do gráfico
+        """
+        import matplotlib.pyplot as plt  # Para manipular gráficos
+        import seaborn as sns            # Para criar visualizações
+        fig2, ax2 = plt.subplots(figsize=FIGURE_SIZE)
+        if density:
+            points = df[[x, y]].dropna()
+            hexbin = ax2.hexbin(points[x], points[y], gridsize=HEXBIN_GRIDSIZE, mincnt=1, cmap="Blues")
+            fig2.colorbar(hexbin, ax=ax2, label="Registros")
+            ax2.set_xlabel(x)
+            ax2.set_ylabel(y)
+            ax2.set_title(f'{x} vs {y} (densidade)')
+        else:
+            sns.scatterplot(data=df, x=x, y=y, ax=ax2)
+            ax2.set_title(f'{x} vs {y}')
+        return DataView._figure_to_png(fig2)
 
     @staticmethod
     def show_model_result(score, model_name=None, model_params=None):
@@ -257,9 +354,359 @@ class DataView:
                 "\n".join(f'<div class="param-item">• {k}: {v}</div>' for k, v in model_params.items())
             ), unsafe_allow_html=True)
 
+    @staticmethod
+    def show_search_leaderboard(leaderboard):
+        """
+        Exibe o ranking dos candidatos da busca de hiperparâmetros.
+        Args:
+            leaderboard (pandas.DataFrame): Ranking dos candidatos
+        """
+        st.subheader("Ranking da Busca de Hiperparâmetros")
+        st.caption("Candidatos eliminados nas primeiras rodadas foram avaliados com menos amostras.")
+        st.dataframe(leaderboard, hide_index=True, use_container_width=True)
+
+    @staticmethod
+    def show_run_history(best, leaderboard):
+        """
+        Exibe a melhor configuração e o ranking das execuções gravadas no histórico.
+        Args:
+            best (dict): Execução com o maior R² (ver RunHistory.best())
+            leaderboard (pandas.DataFrame): Ranking das execuções (ver RunHistory.leaderboard())
+        """
+        params = RunHistory.describe_params(best["algorithm"], best["params"])
+        st.metric(f"Melhor Configuração: {best['algorithm']}", f"{best['score']:.4f}", help=params)
+        st.caption(f"Hiperparâmetros: {params}")
+        st.dataframe(
+            leaderboard, hide_index=True, use_container_width=True,
+            column_config={
+                "R²": st.column_config.NumberColumn(format="%.4f"),
+                "Tempo de Treino (s)": st.column_config.NumberColumn(format="%.2f"),
+                "Tempo de Avaliação (s)": st.column_config.NumberColumn(format="%.3f"),
+                "Data": st.column_config.DatetimeColumn(format="DD/MM/YYYY HH:mm")
+            }
+        )
+
+    @staticmethod
+    def show_run_history_hint():
+        """
+        Exibe a orientação quando ainda não há execuções gravadas para o dataset.
+        """
+        st.info("Nenhuma execução gravada para este dataset. Os treinamentos executados aparecem aqui, "
+                "do maior para o menor R².")
+
+    @staticmethod
+    def show_cv_results(fold_results):
+        """
+        Exibe o resultado da validação cruzada K-fold.
+        Args:
+            fold_results (pandas.DataFrame): R² e tempos de cada fold
+        """
+        st.subheader("Validação Cruzada (K-Fold)")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("R² Médio", f"{fold_results['R²'].mean():.4f}")
+        col2.metric("Desvio Padrão do R²", f"{fold_results['R²'].std():.4f}")
+        col3.metric("Tempo Médio de Treino", f"{fold_results['Tempo de Treino (s)'].mean():.2f}s")
+        st.dataframe(fold_results, hide_index=True, use_container_width=True)
+
+    @staticmethod
+    def show_feature_importance(importances):
+        """
+        Exibe a importância das features: a do próprio modelo (impureza ou coeficientes) e a por permutação.
+        Args:
+            importances (dict): Importâncias calculadas (ver FeatureImportance.compute())
+        """
+        st.subheader("Importância das Features")
+        permutation = importances["permutation"]
+        st.markdown("**Importância por Permutação**")
+        st.caption("Queda do R² no conjunto de teste ao embaralhar cada feature (média entre as repetições).")
+        st.bar_chart(permutation, x="Feature", y=PERMUTATION_COLUMN, horizontal=True, sort=f"-{PERMUTATION_COLUMN}")
+        st.dataframe(
+            permutation, hide_index=True, use_container_width=True,
+            column_config={
+                PERMUTATION_COLUMN: st.column_config.NumberColumn(format="%.4f"),
+                PERMUTATION_STD_COLUMN: st.column_config.NumberColumn(format="%.4f")
+            }
+        )
+
+        model_importance = importances["model"]
+        if model_importance is None:
+            st.info("Este algoritmo não calcula importância própria das features; use a importância por permutação.")
+            return
+        column = model_importance.columns[1]
+        if column == COEFFICIENT_COLUMN:
+            st.markdown("**Coeficientes do Modelo**")
+            st.caption("Dependem da escala de cada feature; categorias aparecem como colunas \"feature=categoria\".")
+        else:
+            st.markdown("**Importância por Impureza**")
+            st.caption("Redução do erro quadrático nas divisões de cada feature, normalizada para somar 1.")
+        st.bar_chart(model_importance, x="Feature", y=column, horizontal=True, sort=False)
+
+    @staticmethod
+    def show_learning_curve(curve, finished=True):
+        """
+        Exibe a curva de aprendizado do treinamento progressivo (R² por número de registros de treino).
+        Args:
+            curve (pandas.DataFrame): Registros, fração dos dados, R² e tempo de treino de cada etapa
+            finished (bool): Se o treinamento terminou (False enquanto as etapas ainda estão chegando)
+        """
+        st.subheader("Curva de Aprendizado")
+        last = curve.iloc[-1]
+        if len(curve) >= 2:
+            gain = last["R²"] - curve.iloc[-2]["R²"]
+            st.metric(
+                f"R² com {last['Fração dos Dados']:.0%} dos dados", f"{last['R²']:.4f}", delta=f"{gain:+.4f}",
+                help="Variação em relação à etapa anterior: ganhos pequenos indicam que mais dados pouco melhoram o modelo"
+            )
+        if finished and last["Fração dos Dados"] < 1:
+            st.warning(
+                f"Treinamento encerrado com {last['Fração dos Dados']:.0%} dos dados de treino "
+                f"({int(last['Registros'])} registros); este modelo não foi registrado para predição."
+            )
+        if len(curve) >= 2:
+            st.line_chart(curve, x="Registros", y="R²")
+        st.dataframe(
+            curve, hide_index=True, use_container_width=True,
+            column_config={
+                "Fração dos Dados": st.column_config.NumberColumn(format="percent"),
+                "R²": st.column_config.NumberColumn(format="%.4f"),
+                "Tempo de Treino (s)": st.column_config.NumberColumn(format="%.2f")
+            }
+        )
+
+    @staticmethod
+    def show_training_progress(description, progress, elapsed, status):
+        """
+        Exibe o progresso de um treinamento em andamento.
+        Args:
+            description (str): Descrição do treinamento (nome do modelo)
+            progress (float): Fração concluída, entre 0 e 1
+            elapsed (float): Tempo decorrido em segundos
+            status (str): Estado atual do job
+        """
+        st.progress(progress, text=f"Treinando {description} ({status}) — {elapsed:.1f}s decorridos")
+
+    @staticmethod
+    def show_training_cancelled():
+        """
+        Exibe mensagem quando o treinamento é cancelado.
+        """
+        st.info("Treinamento cancelado.")
+
+    @staticmethod
+    def show_training_error(error):
+        """
+        Exibe mensagem quando o treinamento falha.
+        Args:
+            error (Exception): Erro ocorrido no treinamento
+        """
+        st.error(f"Erro ao treinar o modelo: {error}")
+
+    @staticmethod
+    def show_file_hint():
+        """
+        Exibe instruções para o treinamento fora da memória.
+        """
+        st.info(
+            "Envie um arquivo ou informe o caminho de um arquivo do diretório de dados do servidor. O arquivo é lido em blocos, "
+            "as colunas numéricas são usadas como features (exceto a última, que é o target) "
+            "e 20% dos registros são separados para teste por um hash do seu conteúdo."
+        )
+
+    @staticmethod
+    def show_file_error(message):
+        """
+        Exibe mensagem de erro quando o arquivo local não pode ser lido.
+        Args:
+            message (str): Motivo (arquivo inexistente ou fora do diretório de dados)
+        """
+        st.error(message)
+
+    @staticmethod
+    def show_predictions(predictions, target, elapsed, stats=None):
+        """
+        Exibe as predições e a vazão do serviço de predição.
+        Args:
+            predictions (numpy.ndarray): Predições, na ordem dos registros
+            target (str): Coluna prevista pelo modelo
+            elapsed (float): Tempo da predição, em segundos
+            stats (dict): Estatísticas do modelo no serviço (ver PredictionService.get_stats())
+        """
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Registros Previstos", f"{len(predictions)}")
+        col2.metric("Tempo", f"{elapsed * 1000:.1f} ms")
+        col3.metric("Vazão", f"{len(predictions) / elapsed if elapsed > 0 else 0:,.0f} registros/s")
+        if stats:
+            st.caption(
+                f"Serviço: {stats['requests']} requisições em {stats['batches']} lotes "
+                f"({stats['rows_per_batch']:.1f} registros por lote), "
+                f"{stats['rows_per_second']:,.0f} registros/s no predict()"
+            )
+        st.dataframe({f"{target} (previsto)": predictions}, use_container_width=True)
+
+    @staticmethod
+    def show_prediction_hint():
+        """
+        Exibe a orientação quando ainda não há modelos registrados.
+        """
+        st.info(
+            "Nenhum modelo registrado. Execute um modelo preditivo: o modelo treinado fica disponível "
+            "aqui e no servidor HTTP (python -m models.prediction_service)."
+        )
+
+    @staticmethod
+    def show_prediction_error(error):
+        """
+        Exibe o erro de uma predição (modelo inexistente ou registros inválidos).
+        Args:
+            error (Exception): Erro ocorrido
+        """
+        st.error(f"Não foi possível prever os registros: {error}")
+
+    @staticmethod
+    def show_performance(traces):
+        """
+        Exibe o painel "Desempenho" com a duração e a variação de memória de cada etapa.
+        Args:
+            traces (list): Rastreamentos (models.tracing.Trace) a exibir, como a última
+                execução da página e o último treinamento da sessão
+        """
+        traces = [trace for trace in traces if trace is not None and trace.spans]
+        if not traces:
+            return
+        with st.expander("Desempenho"):
+            for trace in traces:
+                st.caption(f"Execução: {trace.name}")
+                rows = [
+                    {
+                        # Recuo pela profundidade para mostrar as etapas aninhadas
+                        "Etapa": "\u2003" * record["depth"] + record["span"],
+                        "Tempo (ms)": record["duration_ms"],
+                        "Memória (MB)": record["memory_delta_mb"],
+                        "Erro": record["error"] or ""
+                    }
+                    for record in trace.to_records()
+                ]
+                st.dataframe(
+                    rows, hide_index=True, use_container_width=True,
+                    column_config={
+                        "Tempo (ms)": st.column_config.NumberColumn(format="%.1f"),
+                        "Memória (MB)": st.column_config.NumberColumn(format="%+.1f")
+                    }
+                )
+            st.download_button(
+                "Exportar (JSON lines)",
+                "".join(trace.to_json_lines() for trace in traces),
+                file_name="desempenho.jsonl",
+                mime="application/jsonl"
+            )
+
+    @staticmethod
+    def show_shared_store(stats):
+        """
+        Exibe a visão de administração do armazenamento compartilhado entre sessões:
+        memória em uso, taxa de acerto por tipo e as entradas residentes.
+        Args:
+            stats (dict): Estado do armazenamento (ver SharedStore.get_stats())
+        """
+        mb = 1024 * 1024
+        with st.expander("Memória Compartilhada (Administração)"):
+            col1, col2, col3 = st.columns(3)
+            col1.metric(
+                "Memória em Uso", f"{stats['total_bytes'] / mb:.1f} MB",
+                help=f"Limite: {stats['max_bytes'] / mb:.0f} MB (SHARED_STORE_MAX_MB)"
+            )
+            col2.metric(
+                "Mapeado de Arquivos", f"{stats['mapped_bytes'] / mb:.1f} MB",
+                help="Datasets lidos do armazenamento local, compartilhados pelo cache de páginas (fora do limite)"
+            )
+            col3.metric("Entradas", len(stats["entries"]))
+
+            st.dataframe(
+                [
+                    {
+                        "Tipo": namespace,
+                        "Entradas": counters["entries"],
+                        "Memória (MB)": counters["bytes"] / mb,
+                        "Acertos": counters["hits"],
+                        "Faltas": counters["misses"],
+                        "Taxa de Acerto": counters["hit_rate"],
+                        "Removidas": counters["evictions"]
+                    }
+                    for namespace, counters in sorted(stats["namespaces"].items())
+                ],
+                hide_index=True, use_container_width=True,
+                column_config={
+                    "Memória (MB)": st.column_config.NumberColumn(format="%.2f"),
+                    "Taxa de Acerto": st.column_config.NumberColumn(format="percent")
+                }
+            )
+            st.dataframe(
+                [
+                    {
+                        "Tipo": entry["namespace"],
+                        "Chave": entry["key"],
+                        "Memória (MB)": entry["bytes"] / mb,
+                        "Mapeado (MB)": entry["mapped_bytes"] / mb,
+                        "Acertos": entry["hits"],
+                        "Criada há (s)": entry["age_seconds"],
+                        "Último acesso há (s)": entry["idle_seconds"]
+                    }
+                    for entry in stats["entries"]
+                ],
+                hide_index=True, use_container_width=True,
+                column_config={
+                    "Memória (MB)": st.column_config.NumberColumn(format="%.2f"),
+                    "Mapeado (MB)": st.column_config.NumberColumn(format="%.2f"),
+                    "Criada há (s)": st.column_config.NumberColumn(format="%.0f"),
+                    "Último acesso há (s)": st.column_config.NumberColumn(format="%.0f")
+                }
+            )
+
     @staticmethod
     def show_error_message():
         """
         Exibe mensagem de erro quando não há dados suficientes.
         """
         st.warning("Dataset não possui variáveis numéricas suficientes para treinar o modelo.")
+
+    @staticmethod
+    def show_training_scheduler(stats):
+        """
+        Exibe a visão de administração do agendador de treinamentos:
+        workers, jobs deduplicados e, por fila, profundidade e tempos de espera.
+        Args:
+            stats (dict): Métricas do agendador (ver TrainingManager.get_stats())
+        """
+        lane_names = {"light": "Leve", "heavy": "Pesada"}
+        with st.expander("Fila de Treinamento (Administração)"):
+            col1, col2, col3 = st.columns(3)
+            col1.metric(
+                "Workers", stats["workers"] + stats["light_workers"],
+                help=f"{stats['workers']} da fila pesada (TRAINING_WORKERS) e "
+                     f"{stats['light_workers']} reservados para a fila leve (TRAINING_LIGHT_WORKERS)"
+            )
+            col2.metric("Jobs Submetidos", stats["submitted"])
+            col3.metric(
+                "Deduplicados", stats["deduplicated"],
+                help="Submissões idênticas a um job em andamento, atendidas por ele sem novo treinamento"
+            )
+            st.dataframe(
+                [
+                    {
+                        "Fila": lane_names.get(lane, lane),
+                        "Na Fila": lane_stats["queued"],
+                        "Em Execução": lane_stats["running"],
+                        "Sessões Aguardando": lane_stats["sessions"],
+                        "Espera Média (s)": lane_stats["mean_wait"],
+                        "Espera p95 (s)": lane_stats["p95_wait"],
+                        "Espera Máxima (s)": lane_stats["max_wait"]
+                    }
+                    for lane, lane_stats in stats["lanes"].items()
+                ],
+                hide_index=True, use_container_width=True,
+                column_config={
+                    "Espera Média (s)": st.column_config.NumberColumn(format="%.2f"),
+                    "Espera p95 (s)": st.column_config.NumberColumn(format="%.2f"),
+                    "Espera Máxima (s)": st.column_config.NumberColumn(format="%.2f")
+                }
+            )
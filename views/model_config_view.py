@@ -0,0 +1,234 @@
+# Importando as bibliotecas necessárias
+import streamlit as st  # Para criar a interface web
+from models.algorithm_registry import AlgorithmRegistry, ALGORITHMS, PARAM_SPACE, JOB_MAX_CORES  # Registro dos algoritmos
+
+class ModelConfigView:
+    """
+    Classe responsável pelos controles de configuração dos modelos.
+    Monta os widgets de seleção do algoritmo e dos hiperparâmetros e cria o estimador
+    pelo registro de algoritmos (models.algorithm_registry), que não depende da interface.
+    """
+
+    @staticmethod
+    def get_model_params(model_name):
+        """
+        Retorna os hiperparâmetros disponíveis para cada modelo.
+        Args:
+            model_name (str): Nome do modelo selecionado
+        Returns:
+            dict: Dicionário com os hiperparâmetros e seus valores
+        """
+        if model_name == "Regressão Linear":
+            # Regressão Linear tem poucos hiperparâmetros ajustáveis
+            # Para normalização, use StandardScaler antes de aplicar o modelo
+            return {
+                "fit_intercept": st.checkbox(
+                    "Incluir Intercepto",
+                    value=True,
+                    help="Se True, o modelo calculará o intercepto (termo constante). "
+                         "Se False, o modelo assumirá que os dados estão centralizados."
+                )
+            }
+        
+        elif model_name == "Árvore de Decisão":
+            # Hiperparâmetros principais da Árvore de Decisão
+            return {
+                "max_depth": st.slider(
+                    "Profundidade Máxima",
+                    min_value=PARAM_SPACE["Árvore de Decisão"]["max_depth"][0],
+                    max_value=PARAM_SPACE["Árvore de Decisão"]["max_depth"][1],
+                    value=None,
+                    help="Profundidade máxima da árvore. Se None, a árvore crescerá até as folhas serem puras "
+                         "ou terem min_samples_split amostras."
+                ),
+                "min_samples_split": st.slider(
+                    "Mínimo de Amostras para Divisão",
+                    min_value=PARAM_SPACE["Árvore de Decisão"]["min_samples_split"][0],
+                    max_value=PARAM_SPACE["Árvore de Decisão"]["min_samples_split"][1],
+                    value=2,
+                    help="Número mínimo de amostras necessário para dividir um nó interno."
+                ),
+                "min_samples_leaf": st.slider(
+                    "Mínimo de Amostras por Folha",
+                    min_value=PARAM_SPACE["Árvore de Decisão"]["min_samples_leaf"][0],
+                    max_value=PARAM_SPACE["Árvore de Decisão"]["min_samples_leaf"][1],
+                    value=1,
+                    help="Número mínimo de amostras necessário para ser um nó folha."
+                ),
+                "random_state": st.number_input(
+                    "Semente Aleatória",
+                    value=42,
+                    help="Controla a aleatoriedade do estimador."
+                )
+            }
+        
+        elif model_name == "Random Forest":
+            # Hiperparâmetros principais do Random Forest
+            return {
+                "n_estimators": st.slider(
+                    "Número de Árvores",
+                    min_value=PARAM_SPACE["Random Forest"]["n_estimators"][0],
+                    max_value=PARAM_SPACE["Random Forest"]["n_estimators"][1],
+                    value=100,
+                    help="Número de árvores na floresta."
+                ),
+                "max_depth": st.slider(
+                    "Profundidade Máxima",
+                    min_value=PARAM_SPACE["Random Forest"]["max_depth"][0],
+                    max_value=PARAM_SPACE["Random Forest"]["max_depth"][1],
+                    value=None,
+                    help="Profundidade máxima das árvores. Se None, as árvores crescerão até as folhas serem puras "
+                         "ou terem min_samples_split amostras."
+                ),
+                "min_samples_split": st.slider(
+                    "Mínimo de Amostras para Divisão",
+                    min_value=PARAM_SPACE["Random Forest"]["min_samples_split"][0],
+                    max_value=PARAM_SPACE["Random Forest"]["min_samples_split"][1],
+                    value=2,
+                    help="Número mínimo de amostras necessário para dividir um nó interno."
+                ),
+                "min_samples_leaf": st.slider(
+                    "Mínimo de Amostras por Folha",
+                    min_value=PARAM_SPACE["Random Forest"]["min_samples_leaf"][0],
+                    max_value=PARAM_SPACE["Random Forest"]["min_samples_leaf"][1],
+                    value=1,
+                    help="Número mínimo de amostras necessário para ser um nó folha."
+                ),
+                "random_state": st.number_input(
+                    "Semente Aleatória",
+                    value=42,
+                    help="Controla a aleatoriedade do estimador."
+                ),
+                "n_jobs": st.number_input(
+                    "Cores",
+                    min_value=1,
+                    max_value=JOB_MAX_CORES,
+                    value=JOB_MAX_CORES,
+                    help="Número de núcleos usados para construir as árvores em paralelo "
+                         "(limitado à parte de cada treinamento simultâneo)."
+                )
+            }
+
+        elif model_name == "Gradient Boosting (Histograma)":
+            # Hiperparâmetros principais do gradient boosting por histogramas
+            return {
+                "max_iter": st.slider(
+                    "Número de Iterações",
+                    min_value=PARAM_SPACE["Gradient Boosting (Histograma)"]["max_iter"][0],
+                    max_value=PARAM_SPACE["Gradient Boosting (Histograma)"]["max_iter"][1],
+                    value=100,
+                    help="Número máximo de árvores adicionadas em sequência, cada uma corrigindo o erro das anteriores."
+                ),
+                "learning_rate": st.select_slider(
+                    "Taxa de Aprendizado",
+                    options=PARAM_SPACE["Gradient Boosting (Histograma)"]["learning_rate"],
+                    value=0.1,
+                    help="Peso da contribuição de cada árvore. Valores menores exigem mais iterações, "
+                         "mas costumam generalizar melhor."
+                ),
+                "max_bins": st.slider(
+                    "Número de Bins",
+                    min_value=PARAM_SPACE["Gradient Boosting (Histograma)"]["max_bins"][0],
+                    max_value=PARAM_SPACE["Gradient Boosting (Histograma)"]["max_bins"][1],
+                    value=255,
+                    help="Número máximo de intervalos em que cada feature é discretizada. A discretização é "
+                         "calculada uma vez por dataset e reaproveitada nos treinamentos seguintes."
+                ),
+                "early_stopping": st.selectbox(
+                    "Parada Antecipada",
+                    PARAM_SPACE["Gradient Boosting (Histograma)"]["early_stopping"],
+                    format_func=lambda value: {"auto": "Automática (mais de 10.000 registros)",
+                                               True: "Sim", False: "Não"}[value],
+                    help="Separa 10% do treino para validação e encerra o treinamento quando o erro "
+                         "nessa parte deixa de melhorar."
+                ),
+                "random_state": st.number_input(
+                    "Semente Aleatória",
+                    value=42,
+                    help="Controla a aleatoriedade do estimador."
+                )
+            }
+
+        elif model_name == "Regressão SGD":
+            # Hiperparâmetros principais da regressão por gradiente descendente estocástico
+            return {
+                "alpha": st.select_slider(
+                    "Regularização (alpha)",
+                    options=[0.000001, 0.00001, 0.0001, 0.001, 0.01, 0.1],
+                    value=0.0001,
+                    help="Intensidade da regularização. Valores maiores reduzem o sobreajuste."
+                ),
+                "penalty": st.selectbox(
+                    "Penalidade",
+                    ["l2", "l1", "elasticnet"],
+                    help="Tipo de regularização aplicada aos coeficientes."
+                ),
+                "eta0": st.number_input(
+                    "Taxa de Aprendizado Inicial",
+                    min_value=0.0001,
+                    max_value=1.0,
+                    value=0.01,
+                    format="%.4f",
+                    help="Taxa de aprendizado inicial do gradiente descendente. "
+                         "Funciona melhor com features padronizadas."
+                ),
+                "random_state": st.number_input(
+                    "Semente Aleatória",
+                    value=42,
+                    help="Controla a aleatoriedade do estimador."
+                )
+            }
+        return {}
+
+    @staticmethod
+    def get_available_algorithms(algorithm_names=None):
+        """
+        Retorna um dicionário com os algoritmos de machine learning disponíveis.
+        Cada algoritmo é instanciado com seus parâmetros padrão.
+        Args:
+            algorithm_names (list): Algoritmos exibidos no menu (padrão: ALGORITHMS)
+        Returns:
+            dict: Dicionário com nome do algoritmo e sua instância
+        """
+        # Obtém o nome do algoritmo selecionado
+        algorithm_name = st.selectbox(
+            "Selecione o Algoritmo:",
+            algorithm_names or ALGORITHMS
+        )
+        
+        # Obtém os parâmetros do modelo selecionado
+        params = ModelConfigView.get_model_params(algorithm_name)
+        
+        # Cria o modelo com os parâmetros selecionados
+        model = AlgorithmRegistry.build(algorithm_name, params)
+            
+        # Exibe informações sobre o modelo
+        st.markdown("""
+        <style>
+        .model-info {
+            background-color: #f0f2f6;
+            padding: 15px;
+            border-radius: 5px;
+            margin: 10px 0;
+        }
+        .model-title {
+            color: #1E395B;
+            font-weight: bold;
+            font-size: 1.2em;
+        }
+        .param-name {
+            color: #1E395B;
+            font-weight: bold;
+        }
+        </style>
+        """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div class="model-info">
+            <div class="model-title">Informações do Modelo: {algorithm_name}</div>
+            <p>Parâmetros configurados:</p>
+            {''.join(f'<p><span class="param-name">{k}:</span> {v}</p>' for k, v in params.items())}
+        </div>
+        """, unsafe_allow_html=True)
+        
+        return {algorithm_name: model}